@@ -6,4 +6,6 @@
 """
 from main import main
 
-main()
+# The guard is required by the worker processes of the batch mode, which import this module.
+if __name__ == "__main__":
+    main()
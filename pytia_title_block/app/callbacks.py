@@ -4,6 +4,7 @@
 
 from tkinter import StringVar
 from tkinter import Tk
+from tkinter import filedialog
 from tkinter import messagebox as tkmsg
 from tkinter import ttk
 
@@ -16,6 +17,7 @@ from pytia.log import log
 from pytia_ui_tools.widgets.tooltips import ToolTip
 from resources import resource
 from tools.explorer import explorer
+from tools.tolerance_export import export_to_file
 from tools.tolerance_tools import ToleranceTools
 from ttkbootstrap import Style
 
@@ -96,9 +98,13 @@ class Callbacks:
     def _bind_menu_callbacks(self) -> None:
         """Binds all callbacks to the menubar."""
         self.layout.tools_menu.entryconfig(0, command=self.on_tools_add_tolerance_table)
-        self.layout.tools_menu.entryconfig(1, command=self.on_tools_open_file_explorer)
+        self.layout.tools_menu.entryconfig(1, command=self.on_tools_export_tolerances)
+        self.layout.tools_menu.entryconfig(2, command=self.on_tools_open_file_explorer)
         self.layout.tools_menu.entryconfig(
-            2, command=self.on_tools_open_linked_document
+            3, command=self.on_tools_open_linked_document
+        )
+        self.layout.tools_menu.entryconfig(
+            4, command=self.on_tools_compare_linked_document
         )
 
     def _on_btn_reload(
@@ -117,6 +123,7 @@ class Callbacks:
             property_name (str): The name of the catia property, from which to load the data.
         """
         if self.doc_loader.linked_properties is not None:
+            self.doc_loader.refresh_linked_snapshot()
             value = self.doc_loader.get_property_from_linked_doc(property_name)
             if value is not None:
                 variable.set(value)
@@ -194,13 +201,101 @@ class Callbacks:
 
     def on_tools_add_tolerance_table(self) -> None:
         """Creates a new tolerance table (based on all ALP tolerances of all views)"""
-        tol_tools = ToleranceTools(doc_loader=self.doc_loader)
-        tol_tools.add_table()
+        linked_document = self.vars.linked_document.get()
+
+        def show_progress(done: int, total: int) -> None:
+            if done % 50 == 0 or done == total:
+                self.vars.linked_document.set(f"Reading dimensions {done}/{total} ...")
+                self.root.update_idletasks()
+
+        self.root.config(cursor="wait")
+        try:
+            tol_tools = ToleranceTools(
+                doc_loader=self.doc_loader, progress=show_progress
+            )
+            tol_tools.add_table()
+        finally:
+            self.vars.linked_document.set(linked_document)
+            self.root.config(cursor="arrow")
+
+    def on_tools_export_tolerances(self) -> None:
+        """Exports all tolerated dimensions of the drawing as CSV or JSON Lines file."""
+        log.info("Callback for tool 'Export Tolerances'.")
+        path = filedialog.asksaveasfilename(
+            parent=self.root,
+            title="Export Tolerances",
+            initialdir=self.doc_loader.folder,
+            initialfile=f"{self.doc_loader.path.stem}_tolerances.csv",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl")],
+        )
+        if not path:
+            return
+
+        linked_document = self.vars.linked_document.get()
+
+        def show_progress(done: int, total: int) -> None:
+            if done % 50 == 0 or done == total:
+                self.vars.linked_document.set(
+                    f"Exporting dimensions {done}/{total} ..."
+                )
+                self.root.update_idletasks()
+
+        self.root.config(cursor="wait")
+        try:
+            tol_tools = ToleranceTools(
+                doc_loader=self.doc_loader, progress=show_progress
+            )
+            count = export_to_file(tol_tools, path)
+        except (OSError, ValueError) as e:
+            tkmsg.showerror(title=resource.settings.title, message=str(e))
+            return
+        finally:
+            self.vars.linked_document.set(linked_document)
+            self.root.config(cursor="arrow")
+
+        tkmsg.showinfo(
+            title=resource.settings.title,
+            message=f"Exported {count} tolerated dimension(s) to {path}.",
+        )
 
     def on_tools_open_linked_document(self) -> None:
         """Opens the linked document and closes the app."""
         self.doc_loader.open_linked()
 
+    def on_tools_compare_linked_document(self) -> None:
+        """
+        Shows a summary of all title block items, that differ from the linked document. \
+            Nothing is written.
+        """
+        log.info("Callback for tool 'Compare With Linked Document'.")
+        self.doc_loader.refresh_linked_snapshot()
+        if self.doc_loader.linked_snapshot is None:
+            tkmsg.showinfo(
+                title=resource.settings.title, message="No linked document found."
+            )
+            return
+
+        if not (differences := self.data_loader.get_differences()):
+            tkmsg.showinfo(
+                title=resource.settings.title,
+                message="The title block is in sync with the linked document.",
+            )
+            return
+
+        tkmsg.showinfo(
+            title=resource.settings.title,
+            message=(
+                f"{len(differences)} title block item(s) differ from the linked "
+                "document:\n\n"
+                + "\n".join(
+                    f"{d.key}: {d.title_block or '-'}  ->  {d.linked}"
+                    for d in differences
+                )
+                + "\n\nUse the reload buttons to apply the values of the linked document."
+            ),
+        )
+
     def on_tools_open_file_explorer(self) -> None:
         """Opens the file explorer."""
         explorer(self.doc_loader.path)
@@ -212,6 +307,8 @@ class Callbacks:
         """
         log.info("Callback for button 'Save'.")
         self.data_loader.load_into_title_block()
+        # The drawing isn't saved by the app, its title block is cached once the saved
+        # drawing is loaded again.
         self.doc_loader.save_drawing_path_to_linked_document()
 
         self.root.withdraw()
@@ -50,8 +50,10 @@ class Layout:
 
         self._tools_menu = Menu(menubar, tearoff=False)
         self._tools_menu.add_command(label="Tolerance Table")
+        self._tools_menu.add_command(label="Export Tolerances")
         self._tools_menu.add_command(label="Open File Explorer")
         self._tools_menu.add_command(label="Open Linked Document")
+        self._tools_menu.add_command(label="Compare With Linked Document")
 
         menubar.add_cascade(label="Help", command=show_help)
         menubar.add_cascade(label="Appearance", menu=self._appearance_menu)
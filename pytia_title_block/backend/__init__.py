@@ -0,0 +1,3 @@
+"""
+    Backends for the app. A backend provides the CATIA object model to the loaders and tools.
+"""
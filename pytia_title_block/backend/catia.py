@@ -0,0 +1,94 @@
+"""
+    The CATIA backend. Provides the documents of the running CATIA instance via pytia.
+"""
+
+import os
+from pathlib import Path
+from typing import Tuple
+
+import pythoncom
+from pycatia.drafting_interfaces.drawing_view import DrawingView
+from pycatia.in_interfaces.application import Application
+from pycatia.in_interfaces.document import Document
+from pycatia.product_structure_interfaces.product import Product
+from pytia.exceptions import PytiaDifferentDocumentError
+from pytia.framework import framework
+from pytia.wrapper.documents.drawing_documents import PyDrawingDocument
+from pytia.wrapper.properties import PyProperties
+
+
+class CatiaBackend:
+    """Backend for the running CATIA application."""
+
+    def initialize_thread(self) -> None:
+        """
+        Initializes COM for the calling worker thread. The thread joins the multithreaded \
+        apartment, the main thread (Tk) stays in its single-threaded apartment. The objects \
+        obtained in the worker must not be used by other threads.
+        """
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+
+    def uninitialize_thread(self) -> None:
+        """Releases COM for the calling worker thread."""
+        pythoncom.CoUninitialize()
+
+    @property
+    def application(self) -> Application:
+        """Returns the CATIA application object."""
+        return framework.catia
+
+    def get_active_drawing(self) -> PyDrawingDocument:
+        """Returns the active document as drawing document."""
+        drawing_document = PyDrawingDocument()
+        drawing_document.current()
+        return drawing_document
+
+    def is_open(self, path: str | Path) -> bool:
+        """Returns True if the document at the given path is open in CATIA."""
+        key = os.path.normcase(str(path))
+        documents = self.application.documents
+        return any(
+            os.path.normcase(documents.item(index).full_name) == key
+            for index in range(1, documents.count + 1)
+        )
+
+    def open_drawing(self, path: str | Path) -> PyDrawingDocument:
+        """
+        Opens the drawing document at the given path and returns it as drawing document. \
+            The opened document becomes the active document.
+
+        Args:
+            path (str | Path): The path of the drawing document.
+
+        Raises:
+            PytiaDifferentDocumentError: Another document became the active document \
+                meanwhile, e.g. if another process opened a document.
+
+        Returns:
+            PyDrawingDocument: The opened drawing document.
+        """
+        document = self.application.documents.open(str(path))
+        drawing_document = self.get_active_drawing()
+        if drawing_document.document.full_name != document.full_name:
+            raise PytiaDifferentDocumentError(
+                f"Opened {document.full_name!r}, but the active document is "
+                f"{drawing_document.document.full_name!r}."
+            )
+        return drawing_document
+
+    def get_linked(self, view: DrawingView) -> Tuple[Product, Document, PyProperties]:
+        """
+        Returns the product, the document and the properties of the document from which \
+            the given generative view has been created.
+
+        Args:
+            view (DrawingView): The generative view.
+
+        Returns:
+            Tuple[Product, Document, PyProperties]: The linked product, document and \
+                properties.
+        """
+        com_doc = view.generative_behavior.document.com_object
+        product = Product(com_doc)
+        document = Document(product.parent.com_object)
+        return product, document, PyProperties(product)
@@ -0,0 +1,849 @@
+"""
+    In-memory stand-in for the CATIA backend.
+
+    Mimics the parts of the pycatia object model that are used by the loaders and tools:
+    Documents, sheets, views, texts, dimensions, tables and properties. Every access to
+    an attribute or method that would be a COM call on CATIA is counted by the session
+    and delayed by the session's latency, so the stand-in behaves like out-of-process COM.
+
+    Important: Do not import third party modules here. This module must work on its own,
+    without CATIA and on any platform.
+"""
+
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# The result of `get_tolerances` for a dimension without tolerance.
+NO_TOLERANCE = (0, "", "", "", 0.0, 0.0, 0)
+
+
+class FakeSession:
+    """Call accounting and latency simulation, shared by all objects of a fake application."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """
+        Inits the session.
+
+        Args:
+            latency (float, optional): The time in seconds every call takes. Defaults to 0.
+        """
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+
+    @property
+    def total(self) -> int:
+        """Returns the total number of calls since the last reset."""
+        return sum(self.calls.values())
+
+    def call(self, name: str) -> None:
+        """Counts the call and waits for the latency."""
+        self.calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def count(self, prefix: str) -> int:
+        """Returns the number of calls whose name starts with the given prefix."""
+        return sum(v for k, v in self.calls.items() if k.startswith(prefix))
+
+    def reset(self) -> None:
+        """Resets the call counter."""
+        self.calls.clear()
+
+
+class ComAttribute:
+    """
+    Descriptor for attributes of fake objects. Reading and writing are counted as calls,
+    e.g. `DrawingText.text` and `DrawingText.text=`.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.attr = f"_{name}"
+
+    def __get__(self, obj: Any, owner: type) -> Any:
+        if obj is None:
+            return self
+        obj.session.call(f"{obj.COM_NAME}.{self.name}")
+        return getattr(obj, self.attr)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.session.call(f"{obj.COM_NAME}.{self.name}=")
+        setattr(obj, self.attr, value)
+
+
+class FakeObject:
+    """Base class for all fake objects."""
+
+    COM_NAME = "AnyObject"
+
+    def __init__(self, session: FakeSession) -> None:
+        self.session = session
+
+    def _call(self, method: str) -> None:
+        self.session.call(f"{self.COM_NAME}.{method}")
+
+
+class FakeCollection(FakeObject, Generic[T]):
+    """Base class for fake collections. Items are accessed with a 1-based index or by name."""
+
+    COM_NAME = "Collection"
+
+    def __init__(self, session: FakeSession, items: Iterable[T] | None = None) -> None:
+        super().__init__(session)
+        self._items: List[T] = list(items or [])
+
+    @property
+    def count(self) -> int:
+        self._call("count")
+        return len(self._items)
+
+    def item(self, index: int | str) -> T:
+        self._call("item")
+        if isinstance(index, str):
+            for item in self._items:
+                if getattr(item, "_name") == index:
+                    return item
+            raise KeyError(f"No item named {index!r} in {self.COM_NAME}.")
+        return self._items[index - 1]
+
+    def get_item(self, name: str) -> T:
+        self._call("get_item")
+        for item in self._items:
+            if getattr(item, "_name") == name:
+                return item
+        raise KeyError(f"No item named {name!r} in {self.COM_NAME}.")
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(1, self.count + 1):
+            yield self.item(index)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _append(self, item: T) -> T:
+        self._items.append(item)
+        return item
+
+
+class FakeText(FakeObject):
+    """Stand-in for pycatia's DrawingText."""
+
+    COM_NAME = "DrawingText"
+
+    name = ComAttribute()
+    text = ComAttribute()
+    x = ComAttribute()
+    y = ComAttribute()
+
+    def __init__(
+        self,
+        session: FakeSession,
+        name: str = "Text",
+        text: str = "",
+        x: float = 0,
+        y: float = 0,
+    ) -> None:
+        super().__init__(session)
+        self._name = name
+        self._text = text
+        self._x = x
+        self._y = y
+        self.font_size: float = 3.5
+
+    def set_font_size(self, first: int, count: int, size: float) -> None:
+        self._call("set_font_size")
+        self.font_size = size
+
+
+class FakeTexts(FakeCollection[FakeText]):
+    """Stand-in for pycatia's DrawingTexts."""
+
+    COM_NAME = "DrawingTexts"
+
+    def add(self, text: str, x: float, y: float) -> FakeText:
+        self._call("add")
+        return self._append(FakeText(self.session, text=text, x=x, y=y))
+
+    def remove(self, index: int) -> None:
+        self._call("remove")
+        del self._items[index - 1]
+
+
+class FakeDimValue(FakeObject):
+    """Stand-in for pycatia's DrawingDimValue."""
+
+    COM_NAME = "DrawingDimValue"
+
+    name = ComAttribute()
+    value = ComAttribute()
+
+    def __init__(
+        self, session: FakeSession, name: str, value: float, precision: float
+    ) -> None:
+        super().__init__(session)
+        self._name = name
+        self._value = value
+        self._precision = precision
+
+    def get_format_precision(self, index: int) -> float:
+        self._call("get_format_precision")
+        return self._precision
+
+
+class FakeDimension(FakeObject):
+    """Stand-in for pycatia's DrawingDimension."""
+
+    COM_NAME = "DrawingDimension"
+
+    name = ComAttribute()
+    dim_type = ComAttribute()
+
+    def __init__(
+        self,
+        session: FakeSession,
+        name: str,
+        value: float,
+        precision: float = 0.01,
+        tolerances: Tuple[int, str, str, str, float, float, int] = NO_TOLERANCE,
+        dim_type: int = 0,
+    ) -> None:
+        super().__init__(session)
+        self._name = name
+        self._dim_type = dim_type
+        self._value = FakeDimValue(session, name, value, precision)
+        self._tolerances = tolerances
+
+    def get_tolerances(self) -> Tuple[int, str, str, str, float, float, int]:
+        self._call("get_tolerances")
+        return self._tolerances
+
+    def get_value(self) -> FakeDimValue:
+        self._call("get_value")
+        return self._value
+
+
+class FakeDimensions(FakeCollection[FakeDimension]):
+    """Stand-in for pycatia's DrawingDimensions."""
+
+    COM_NAME = "DrawingDimensions"
+
+
+class FakeTable(FakeObject):
+    """Stand-in for pycatia's DrawingTable."""
+
+    COM_NAME = "DrawingTable"
+    DEFAULT_ROW_SIZE = 10.0  # Size of rows added with `add_row`
+
+    name = ComAttribute()
+    x = ComAttribute()
+    y = ComAttribute()
+    compute_mode = ComAttribute()
+
+    def __init__(
+        self,
+        session: FakeSession,
+        x: float,
+        y: float,
+        rows: int,
+        columns: int,
+        row_height: float,
+        column_width: float,
+    ) -> None:
+        super().__init__(session)
+        self._name = "Table"
+        self._x = x
+        self._y = y
+        self._compute_mode = 0
+        self.row_height = row_height
+        self.column_width = column_width
+        self.cells: List[List[FakeText]] = [
+            [self._new_cell() for _ in range(columns)] for _ in range(rows)
+        ]
+        self.row_sizes: List[float] = [row_height] * rows
+        self.alignments: Dict[Tuple[int, int], int] = {}
+
+    def _new_cell(self) -> FakeText:
+        return FakeText(self.session, name="Cell")
+
+    @property
+    def number_of_rows(self) -> int:
+        self._call("number_of_rows")
+        return len(self.cells)
+
+    @property
+    def number_of_columns(self) -> int:
+        self._call("number_of_columns")
+        return len(self.cells[0]) if self.cells else 0
+
+    def set_cell_string(self, row: int, column: int, value: str) -> None:
+        self._call("set_cell_string")
+        self.cells[row - 1][column - 1]._text = value
+
+    def get_cell_string(self, row: int, column: int) -> str:
+        self._call("get_cell_string")
+        return self.cells[row - 1][column - 1]._text
+
+    def get_cell_object(self, row: int, column: int) -> FakeText:
+        self._call("get_cell_object")
+        return self.cells[row - 1][column - 1]
+
+    def set_cell_alignment(self, row: int, column: int, alignment: int) -> None:
+        self._call("set_cell_alignment")
+        self.alignments[(row, column)] = alignment
+
+    def add_row(self, position: int) -> None:
+        """Adds a row after the given position (0 adds the row at the top)."""
+        self._call("add_row")
+        columns = len(self.cells[0]) if self.cells else 0
+        self.cells.insert(position, [self._new_cell() for _ in range(columns)])
+        self.row_sizes.insert(position, self.DEFAULT_ROW_SIZE)
+        self.alignments = {
+            (r + 1 if r > position else r, c): a
+            for (r, c), a in self.alignments.items()
+        }
+
+    def remove_row(self, row: int) -> None:
+        self._call("remove_row")
+        del self.cells[row - 1]
+        del self.row_sizes[row - 1]
+        self.alignments = {
+            (r - 1 if r > row else r, c): a
+            for (r, c), a in self.alignments.items()
+            if r != row
+        }
+
+    def set_row_size(self, row: int, size: float) -> None:
+        self._call("set_row_size")
+        self.row_sizes[row - 1] = size
+
+    def get_row_size(self, row: int) -> float:
+        self._call("get_row_size")
+        return self.row_sizes[row - 1]
+
+    def get_column_size(self, column: int) -> float:
+        self._call("get_column_size")
+        return self.column_width
+
+    @property
+    def values(self) -> List[List[str]]:
+        """Returns the cell strings without counting calls (for assertions)."""
+        return [[cell._text for cell in row] for row in self.cells]
+
+
+class FakeTables(FakeCollection[FakeTable]):
+    """Stand-in for pycatia's DrawingTables."""
+
+    COM_NAME = "DrawingTables"
+
+    def add(
+        self,
+        x: float,
+        y: float,
+        rows: int,
+        columns: int,
+        row_height: float,
+        column_width: float,
+    ) -> FakeTable:
+        self._call("add")
+        return self._append(
+            FakeTable(self.session, x, y, rows, columns, row_height, column_width)
+        )
+
+    def remove(self, index: int) -> None:
+        self._call("remove")
+        del self._items[index - 1]
+
+
+class FakeParameter(FakeObject):
+    """Stand-in for pycatia's (string) Parameter."""
+
+    COM_NAME = "Parameter"
+
+    name = ComAttribute()
+    value = ComAttribute()
+
+    def __init__(self, session: FakeSession, name: str, value: str) -> None:
+        super().__init__(session)
+        self._name = name
+        self._value = value
+
+    def value_as_string(self) -> str:
+        self._call("value_as_string")
+        return str(self._value)
+
+
+class FakeParameters(FakeCollection[FakeParameter]):
+    """Stand-in for pycatia's Parameters (the user ref properties of a product)."""
+
+    COM_NAME = "Parameters"
+
+    def __init__(self, session: FakeSession, owner: str) -> None:
+        super().__init__(session)
+        self.owner = owner
+
+    def create_string(self, name: str, value: str) -> FakeParameter:
+        self._call("create_string")
+        return self._append(
+            FakeParameter(self.session, f"{self.owner}\\Properties\\{name}", value)
+        )
+
+    def remove(self, name: str) -> None:
+        self._call("remove")
+        self._items = [i for i in self._items if self._short(i) != name]
+
+    def find(self, name: str) -> FakeParameter | None:
+        """Returns the parameter by its short name without counting calls."""
+        for item in self._items:
+            if self._short(item) == name:
+                return item
+        return None
+
+    @staticmethod
+    def _short(parameter: FakeParameter) -> str:
+        return parameter._name.rsplit("\\", 1)[-1]
+
+
+class FakeDocument(FakeObject):
+    """Stand-in for pycatia's Document."""
+
+    COM_NAME = "Document"
+
+    name = ComAttribute()
+    full_name = ComAttribute()
+    saved = ComAttribute()
+
+    def __init__(self, session: FakeSession, full_name: str) -> None:
+        super().__init__(session)
+        self._full_name = full_name
+        self._name = Path(full_name.replace("\\", "/")).name
+        self._saved = True
+        self.closed = False
+        self.save_count = 0
+
+    def path(self) -> Path:
+        self._call("path")
+        return Path(self._full_name)
+
+    def save(self) -> None:
+        self._call("save")
+        self._saved = True
+        self.save_count += 1
+
+    def close(self) -> None:
+        self._call("close")
+        self.closed = True
+
+    def modified(self) -> None:
+        """Marks the document as modified without counting calls."""
+        self._saved = False
+
+
+class FakeProduct(FakeObject):
+    """Stand-in for pycatia's Product, including the document it belongs to."""
+
+    COM_NAME = "Product"
+
+    part_number = ComAttribute()
+    definition = ComAttribute()
+    revision = ComAttribute()
+    nomenclature = ComAttribute()
+    source = ComAttribute()
+    description_reference = ComAttribute()
+    full_name = ComAttribute()
+    parent = ComAttribute()
+    user_ref_properties = ComAttribute()
+
+    def __init__(
+        self,
+        session: FakeSession,
+        full_name: str,
+        part_number: str = "",
+        definition: str = "",
+        revision: str = "",
+        nomenclature: str = "",
+        source: int = 0,
+        description_reference: str = "",
+        properties: Dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(session)
+        self._full_name = full_name
+        self._part_number = part_number
+        self._definition = definition
+        self._revision = revision
+        self._nomenclature = nomenclature
+        self._source = source
+        self._description_reference = description_reference
+        self._parent = FakeDocument(session, full_name)
+        self._user_ref_properties = FakeParameters(session, part_number or "Part")
+        for name, value in (properties or {}).items():
+            self._user_ref_properties._append(
+                FakeParameter(session, f"{part_number}\\Properties\\{name}", value)
+            )
+
+
+class FakeProperty:
+    """Stand-in for pytia's PyProperty."""
+
+    def __init__(self, parameter: FakeParameter) -> None:
+        self.parameter = parameter
+
+    @property
+    def name(self) -> str:
+        return self.parameter.name
+
+    @property
+    def value(self) -> str:
+        return self.parameter.value
+
+
+class FakeProperties:
+    """Stand-in for pytia's PyProperties, working on the product's user ref properties."""
+
+    def __init__(self, product: FakeProduct) -> None:
+        self.product = product
+
+    @property
+    def _parameters(self) -> FakeParameters:
+        return self.product._user_ref_properties
+
+    def exists(self, name: str) -> bool:
+        self.product.session.call("PyProperties.exists")
+        return self._parameters.find(name) is not None
+
+    def get_by_name(self, name: str) -> FakeProperty:
+        self.product.session.call("PyProperties.get_by_name")
+        if (parameter := self._parameters.find(name)) is None:
+            raise KeyError(f"Property {name!r} does not exist.")
+        return FakeProperty(parameter)
+
+    def create(self, name: str, value: str) -> FakeProperty:
+        self._parameters.create_string(name, value)
+        self.product._parent.modified()
+        return FakeProperty(self._parameters.find(name))  # type: ignore
+
+    def delete(self, name: str) -> None:
+        self._parameters.remove(name)
+        self.product._parent.modified()
+
+
+class FakeGenerativeBehavior(FakeObject):
+    """Stand-in for pycatia's DrawingViewGenerativeBehavior."""
+
+    COM_NAME = "DrawingViewGenerativeBehavior"
+
+    document = ComAttribute()
+
+    def __init__(self, session: FakeSession, product: FakeProduct) -> None:
+        super().__init__(session)
+        self._document = product
+
+
+class FakeView(FakeObject):
+    """Stand-in for pycatia's DrawingView."""
+
+    COM_NAME = "DrawingView"
+
+    name = ComAttribute()
+    texts = ComAttribute()
+    dimensions = ComAttribute()
+    tables = ComAttribute()
+    lock_status = ComAttribute()
+    scale = ComAttribute()
+    x = ComAttribute()
+    y = ComAttribute()
+    generative_behavior = ComAttribute()
+
+    def __init__(
+        self,
+        session: FakeSession,
+        name: str,
+        product: FakeProduct | None = None,
+        scale: float = 1.0,
+        locked: bool = False,
+        bounding_box: Tuple[float, float, float, float] = (0, 0, 0, 0),
+    ) -> None:
+        super().__init__(session)
+        self._name = name
+        self._texts = FakeTexts(session)
+        self._dimensions = FakeDimensions(session)
+        self._tables = FakeTables(session)
+        self._lock_status = locked
+        self._scale = scale
+        self._x = 0.0
+        self._y = 0.0
+        self._generative_behavior = (
+            FakeGenerativeBehavior(session, product) if product is not None else None
+        )
+        self.bounding_box = bounding_box
+
+    def is_generative(self) -> bool:
+        self._call("is_generative")
+        return self._generative_behavior is not None
+
+    def size(self) -> Tuple[float, float, float, float]:
+        """Returns the bounding box as (xmin, xmax, ymin, ymax)."""
+        self._call("size")
+        return self.bounding_box
+
+
+class FakeViews(FakeCollection[FakeView]):
+    """Stand-in for pycatia's DrawingViews."""
+
+    COM_NAME = "DrawingViews"
+
+    def add(self, name: str) -> FakeView:
+        self._call("add")
+        return self._append(FakeView(self.session, name))
+
+
+class FakeSheet(FakeObject):
+    """Stand-in for pycatia's DrawingSheet."""
+
+    COM_NAME = "DrawingSheet"
+
+    PAPER_SIZES = {
+        6: (297, 210),
+        5: (420, 297),
+        4: (594, 420),
+        3: (841, 594),
+        2: (1189, 841),
+    }
+
+    name = ComAttribute()
+    views = ComAttribute()
+    paper_size = ComAttribute()
+
+    def __init__(self, session: FakeSession, name: str, paper_size: int = 6) -> None:
+        super().__init__(session)
+        self._name = name
+        self._paper_size = paper_size
+        self._views = FakeViews(session)
+
+    def get_paper_width(self) -> float:
+        self._call("get_paper_width")
+        return self.PAPER_SIZES[self._paper_size][0]
+
+    def get_paper_height(self) -> float:
+        self._call("get_paper_height")
+        return self.PAPER_SIZES[self._paper_size][1]
+
+
+class FakeSheets(FakeCollection[FakeSheet]):
+    """Stand-in for pycatia's DrawingSheets."""
+
+    COM_NAME = "DrawingSheets"
+
+    active_sheet = ComAttribute()
+
+    def __init__(self, session: FakeSession, sheets: Iterable[FakeSheet]) -> None:
+        super().__init__(session, sheets)
+        self._active_sheet = self._items[0]
+
+
+class FakeDrawingDocument(FakeDocument):
+    """
+    Stand-in for pycatia's DrawingDocument. Also serves the `document` and \
+        `drawing_document` attributes of pytia's PyDrawingDocument wrapper.
+    """
+
+    COM_NAME = "DrawingDocument"
+
+    sheets = ComAttribute()
+
+    def __init__(self, session: FakeSession, full_name: str, sheet: FakeSheet) -> None:
+        super().__init__(session, full_name)
+        self._sheets = FakeSheets(session, [sheet])
+
+    @property
+    def document(self) -> "FakeDrawingDocument":
+        return self
+
+    @property
+    def drawing_document(self) -> "FakeDrawingDocument":
+        return self
+
+
+class FakeWindow(FakeObject):
+    """Stand-in for pycatia's Window."""
+
+    COM_NAME = "Window"
+
+    name = ComAttribute()
+
+    def __init__(self, session: FakeSession, name: str) -> None:
+        super().__init__(session)
+        self._name = name
+
+    def activate(self) -> None:
+        self._call("activate")
+
+
+class FakeDocuments(FakeCollection[FakeDocument]):
+    """Stand-in for pycatia's Documents."""
+
+    COM_NAME = "Documents"
+
+    def __init__(self, application: "FakeApplication") -> None:
+        super().__init__(application.session)
+        self.application = application
+        self.files: Dict[str, FakeDocument] = {}
+
+    def open(self, path: str | Path) -> FakeDocument:
+        """Opens a document registered in `files`."""
+        self._call("open")
+        document = self.files[str(path)]
+        document.closed = False
+        if document not in self._items:
+            self._append(document)
+            self.application.windows._append(FakeWindow(self.session, document._name))
+        self.application._active_document = document
+        return document
+
+
+class FakeApplication(FakeObject):
+    """Stand-in for pycatia's Application."""
+
+    COM_NAME = "Application"
+
+    active_document = ComAttribute()
+    documents = ComAttribute()
+    windows = ComAttribute()
+    refresh_display = ComAttribute()
+    interactive = ComAttribute()
+    display_file_alerts = ComAttribute()
+    undo_redo_lock = ComAttribute()
+
+    def __init__(self, session: FakeSession | None = None) -> None:
+        super().__init__(session or FakeSession())
+        self._active_document: FakeDocument | None = None
+        self._documents = FakeDocuments(self)
+        self._windows = FakeCollection[FakeWindow](self.session)
+        self._refresh_display = True
+        self._interactive = True
+        self._display_file_alerts = True
+        self._undo_redo_lock = False
+
+    def add_file(self, document: FakeDocument) -> FakeDocument:
+        """Registers a document as file on disk, that can be opened."""
+        self._documents.files[document._full_name] = document
+        return document
+
+    def disable_new_undo_redo_transaction(self) -> None:
+        self._call("disable_new_undo_redo_transaction")
+
+    def enable_new_undo_redo_transaction(self) -> None:
+        self._call("enable_new_undo_redo_transaction")
+
+
+class FakeBackend:
+    """Backend for the in-memory stand-in of CATIA, see `CatiaBackend`."""
+
+    def __init__(self, application: FakeApplication) -> None:
+        self._application = application
+
+    def initialize_thread(self) -> None:
+        pass
+
+    def uninitialize_thread(self) -> None:
+        pass
+
+    @property
+    def application(self) -> FakeApplication:
+        return self._application
+
+    @property
+    def session(self) -> FakeSession:
+        return self._application.session
+
+    def get_active_drawing(self) -> FakeDrawingDocument:
+        document = self._application._active_document
+        if not isinstance(document, FakeDrawingDocument):
+            raise TypeError("The active document is not a drawing document.")
+        return document
+
+    def is_open(self, path: str | Path) -> bool:
+        return any(
+            not document.closed and document._full_name == str(path)
+            for document in self._application._documents._items
+        )
+
+    def open_drawing(self, path: str | Path) -> FakeDrawingDocument:
+        self._application.documents.open(path)
+        return self.get_active_drawing()
+
+    def get_linked(
+        self, view: FakeView
+    ) -> Tuple[FakeProduct, FakeDocument, FakeProperties]:
+        product = view.generative_behavior.document
+        return product, product.parent, FakeProperties(product)
+
+
+def create_drawing(
+    application: FakeApplication,
+    full_name: str,
+    title_block: Dict[str, str],
+    product: FakeProduct | None = None,
+    paper_size: int = 6,
+    dimensions: Iterable[Callable[[FakeSession], FakeDimension]] = (),
+    extra_texts: int = 0,
+) -> FakeDrawingDocument:
+    """
+    Creates a drawing document with a main view, a background view holding the title block
+    texts and, if a product is given, a generative front view that links the product.
+    The drawing is registered as file and opened as active document.
+
+    Args:
+        application (FakeApplication): The application to which the drawing is added.
+        full_name (str): The full path of the drawing.
+        title_block (Dict[str, str]): The title block texts, mapped by component name.
+        product (FakeProduct | None, optional): The linked product. Defaults to None.
+        paper_size (int, optional): The CATIA paper size enum value. Defaults to 6 (A4).
+        dimensions (Iterable[Callable[[FakeSession], FakeDimension]], optional): Factories \
+            for the dimensions of the front view. Defaults to ().
+        extra_texts (int, optional): Number of additional texts in the background view. \
+            Defaults to 0.
+
+    Returns:
+        FakeDrawingDocument: The drawing document.
+    """
+    session = application.session
+    sheet = FakeSheet(session, "Sheet.1", paper_size=paper_size)
+    main_view = FakeView(session, "Main View")
+    background_view = FakeView(session, "Background View")
+    sheet._views._append(main_view)
+    sheet._views._append(background_view)
+
+    for index in range(extra_texts):
+        background_view._texts._append(
+            FakeText(session, name=f"Text.{index + 1}", text=f"Note {index + 1}")
+        )
+    for index, (name, value) in enumerate(title_block.items()):
+        background_view._texts._append(
+            FakeText(session, name=name, text=value, x=200, y=10 + index * 5)
+        )
+
+    if product is not None:
+        front_view = FakeView(
+            session, "Front View", product=product, bounding_box=(20, 120, 60, 160)
+        )
+        for factory in dimensions:
+            front_view._dimensions._append(factory(session))
+        sheet._views._append(front_view)
+        application.add_file(product._parent)
+
+    drawing = FakeDrawingDocument(session, full_name, sheet)
+    application.add_file(drawing)
+    application._documents.open(full_name)
+    return drawing
@@ -0,0 +1,278 @@
+"""
+    Opt-in instrumentation of the backend.
+
+    Wraps the backend and every object obtained from it into a proxy, which counts each
+    attribute access and method call (each of those is a COM call on CATIA) per method and
+    per call site, and records their latency. A report of the session is written to the
+    logs folder when the app exits.
+
+    The instrumentation is enabled with the environment variable `PYTIA_TITLE_BLOCK_COM_STATS`.
+"""
+
+import atexit
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+
+from const import ENV_COM_STATS
+from const import LOGS
+from const import PID
+from pytia.log import log
+
+# Upper bounds of the latency histogram buckets in seconds, the last bucket is open.
+HISTOGRAM_BOUNDS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+HISTOGRAM_LABELS = ("<10us", "<100us", "<1ms", "<10ms", "<100ms", "<1s", ">=1s")
+
+# Attributes that are plain python attributes of the wrapped objects, not COM calls.
+PASSTHROUGH = frozenset(("com_object", "session"))
+PRIMITIVES = (str, int, float, bool, bytes, type(None), os.PathLike)
+
+
+class CallStats:
+    """Statistics of a single method or call site."""
+
+    __slots__ = ("count", "total", "max", "histogram")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * len(HISTOGRAM_LABELS)
+
+    def add(self, duration: float) -> None:
+        """Adds the duration of a call."""
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        for index, bound in enumerate(HISTOGRAM_BOUNDS):
+            if duration < bound:
+                self.histogram[index] += 1
+                return
+        self.histogram[-1] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the statistics as dict, durations in milliseconds."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 4) if self.count else 0,
+            "max_ms": round(self.max * 1000, 3),
+            "histogram": dict(zip(HISTOGRAM_LABELS, self.histogram)),
+        }
+
+
+class ComStats:
+    """Collects the statistics of all calls of the instrumented backend."""
+
+    def __init__(self) -> None:
+        self._report_at_exit = False
+        self.started = datetime.now()
+        self.methods: Dict[str, CallStats] = defaultdict(CallStats)
+        self.call_sites: Dict[str, CallStats] = defaultdict(CallStats)
+        self.method_call_sites: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+
+    @property
+    def total_calls(self) -> int:
+        """Returns the number of all recorded calls."""
+        return sum(stats.count for stats in self.methods.values())
+
+    def record(self, method: str, duration: float) -> None:
+        """
+        Records a call of the given method.
+
+        Args:
+            method (str): The name of the method, e.g. `DrawingText.text`.
+            duration (float): The duration of the call in seconds.
+        """
+        call_site = self._get_call_site()
+        self.methods[method].add(duration)
+        self.call_sites[call_site].add(duration)
+        self.method_call_sites[method][call_site] += 1
+
+    @staticmethod
+    def _get_call_site() -> str:
+        """Returns the first function outside this module that issued the call."""
+        frame = sys._getframe(2)  # pylint: disable=W0212
+        while frame is not None and frame.f_globals.get("__name__") == __name__:
+            frame = frame.f_back  # type: ignore
+        if frame is None:
+            return "<unknown>"
+        return f"{frame.f_globals.get('__name__')}.{frame.f_code.co_name}"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the report of the session as dict."""
+
+        def by_total(stats: Dict[str, CallStats]) -> List[str]:
+            return sorted(stats, key=lambda k: stats[k].total, reverse=True)
+
+        return {
+            "started": self.started.isoformat(timespec="seconds"),
+            "pid": PID,
+            "total_calls": self.total_calls,
+            "total_ms": round(sum(s.total for s in self.methods.values()) * 1000, 3),
+            "methods": {
+                name: {
+                    **self.methods[name].as_dict(),
+                    "call_sites": dict(self.method_call_sites[name]),
+                }
+                for name in by_total(self.methods)
+            },
+            "call_sites": {
+                name: self.call_sites[name].as_dict()
+                for name in by_total(self.call_sites)
+            },
+        }
+
+    def write_report_at_exit(self) -> None:
+        """Registers the report to be written into the logs folder at exit (once)."""
+        if not self._report_at_exit:
+            atexit.register(self.write_report)
+            self._report_at_exit = True
+
+    def write_report(self, folder: str | Path = LOGS) -> Path | None:
+        """
+        Writes the report of the session as json file into the given folder.
+
+        Args:
+            folder (str | Path, optional): The target folder. Defaults to the logs folder.
+
+        Returns:
+            Path | None: The path of the report, None if nothing has been recorded.
+        """
+        if not self.methods:
+            return None
+
+        report = self.as_dict()
+        os.makedirs(folder, exist_ok=True)
+        path = Path(folder, f"com_stats_{self.started:%Y%m%d_%H%M%S}_{PID}.json")
+        with open(path, "w", encoding="utf8") as f:
+            json.dump(report, f, indent=2)
+
+        log.info(
+            f"COM stats: {report['total_calls']} calls in {report['total_ms']:.0f} ms, "
+            f"report written to {str(path)!r}."
+        )
+        for name, stats in list(report["call_sites"].items())[:5]:
+            log.info(
+                f"COM stats: {name}: {stats['count']} calls, {stats['total_ms']} ms"
+            )
+        return path
+
+
+class ComProxy:
+    """
+    Proxy for an object of the backend. Forwards all attribute reads, writes and method
+    calls to the wrapped object and records them. Returned objects are wrapped as well.
+    """
+
+    __slots__ = ("_target", "_stats", "_record")
+
+    def __init__(self, target: Any, stats: ComStats, record: bool = True) -> None:
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_stats", stats)
+        object.__setattr__(self, "_record", record)
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, PRIMITIVES) or isinstance(value, ComProxy):
+            return value
+        if isinstance(value, tuple):
+            return tuple(self._wrap(v) for v in value)
+        if isinstance(value, list):
+            return [self._wrap(v) for v in value]
+        return ComProxy(value, self._stats)
+
+    def _name(self, attribute: str) -> str:
+        return f"{type(self._target).__name__}.{attribute}"
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name in PASSTHROUGH:
+            return getattr(self._target, name)
+
+        start = time.perf_counter()
+        value = getattr(self._target, name)
+        duration = time.perf_counter() - start
+
+        if callable(value):
+            method_name = self._name(name)
+
+            def call(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                result = value(*args, **kwargs)
+                if self._record:
+                    self._stats.record(method_name, time.perf_counter() - start)
+                return self._wrap(result)
+
+            return call
+
+        if self._record:
+            self._stats.record(self._name(name), duration)
+        return self._wrap(value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        start = time.perf_counter()
+        setattr(self._target, name, value)
+        if self._record:
+            self._stats.record(f"{self._name(name)}=", time.perf_counter() - start)
+
+    def __iter__(self) -> Any:
+        for item in self._target:
+            yield self._wrap(item)
+
+    def __len__(self) -> int:
+        return len(self._target)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._wrap(self._target[key])
+
+    def __bool__(self) -> bool:
+        return bool(self._target)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ComProxy):
+            other = other._target
+        return self._target == other
+
+    def __hash__(self) -> int:
+        return hash(self._target)
+
+    def __repr__(self) -> str:
+        return f"ComProxy({self._target!r})"
+
+
+com_stats = ComStats()
+
+
+def is_enabled() -> bool:
+    """Returns True if the instrumentation is enabled by the environment variable."""
+    return os.environ.get(ENV_COM_STATS, "").lower() in ("1", "true", "yes")
+
+
+def instrument(backend: Any, stats: ComStats | None = None) -> Any:
+    """
+    Wraps the backend, so that all objects obtained from it are instrumented. The backend's
+    own methods are not recorded, only the calls to the objects it provides.
+
+    The report of the session-wide stats is written to the logs folder at exit.
+
+    Args:
+        backend (Any): The backend to instrument.
+        stats (ComStats | None, optional): The stats that record the calls. Defaults to \
+            the session-wide stats.
+
+    Returns:
+        Any: The instrumented backend.
+    """
+    if stats is None:
+        stats = com_stats
+        stats.write_report_at_exit()
+    log.info("COM call instrumentation is enabled.")
+    return ComProxy(backend, stats, record=False)
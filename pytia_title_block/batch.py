@@ -0,0 +1,479 @@
+"""
+    Headless batch mode: Syncs the title blocks of many drawings with their linked documents.
+
+    Usage:
+        pytia_title_block.pyz batch [--report FILE] [--keep-title-block] [--dry-run] PATH ...
+        pytia_title_block.pyz export --output FILE [--report FILE] PATH ...
+
+    Each PATH is a drawing or a folder, folders are searched recursively for drawings. The
+    drawings are synced one after the other in the running CATIA application, with the
+    same restrictions as the app. A report with the result of each drawing is written as
+    json file.
+
+    The export streams the tolerated dimensions of all drawings into one CSV or JSON Lines
+    file, see `tools.tolerance_export`. The drawings are exported one after the other, so
+    the records of a drawing are never held in memory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from datetime import datetime
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import IO
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+from const import LOGON
+from const import LOGS
+from const import PID
+from loader.data_loader import DataLoader
+from loader.doc_loader import DocumentLoader
+from models.batch_model import BatchResultModel
+from models.batch_model import BatchStatus
+from pytia.log import log
+from pytia_ui_tools.exceptions import PytiaUiToolsOutsideWorkspaceError
+from pytia_ui_tools.handlers.workspace_handler import Workspace
+from resources import resource
+from resources.env_index import get_env_index
+from tools.tolerance_export import export_tolerances
+from tools.tolerance_export import get_format
+from tools.tolerance_tools import ToleranceTools
+
+if TYPE_CHECKING:
+    from backend.catia import CatiaBackend
+    from backend.fake import FakeBackend
+    from backend.fake import FakeDrawingDocument
+    from pytia.wrapper.documents.drawing_documents import PyDrawingDocument
+
+DRAWING_SUFFIX = ".catdrawing"
+
+# The backend of the worker process, see `_init_worker`.
+_backend: CatiaBackend | FakeBackend | None = None
+
+
+def collect_drawings(paths: Iterable[str | Path]) -> List[Path]:
+    """
+    Collects the drawings from the given paths. Folders are searched recursively.
+
+    Args:
+        paths (Iterable[str | Path]): Paths of drawings and folders. Environment \
+            variables like `%ONEDRIVE%` are expanded.
+
+    Returns:
+        List[Path]: The drawings, without duplicates.
+    """
+    drawings: List[Path] = []
+    env_index = get_env_index()
+    for value in paths:
+        # Paths may be symlinked like the drawing paths in the linked documents.
+        try:
+            path = Path(env_index.expand(str(value)))
+        except KeyError as e:
+            log.warning(f"Skipping {str(value)!r}: Variable {e.args[0]!r} not set.")
+            continue
+        if path.is_dir():
+            drawings.extend(
+                sorted(p for p in path.rglob("*") if p.suffix.lower() == DRAWING_SUFFIX)
+            )
+        elif path.suffix.lower() == DRAWING_SUFFIX:
+            drawings.append(path)
+        else:
+            log.warning(f"Skipping {str(path)!r}: Not a drawing or folder.")
+    return list(dict.fromkeys(drawings))
+
+
+def get_restriction(workspace: Workspace) -> str | None:
+    """
+    Returns why the current user must not change the drawings of the workspace, with the \
+        same rules as the app (see `GUI.main_controller`).
+
+    Args:
+        workspace (Workspace): The workspace of the drawing.
+
+    Returns:
+        str | None: The reason, or None if the user may change the drawings.
+    """
+    if not workspace.elements.active:
+        return "The workspace is disabled."
+    if (
+        not resource.logon_exists()
+        and not resource.settings.restrictions.allow_all_users
+    ):
+        return f"{LOGON} is not available in the user configuration."
+    if (
+        workspace.elements.editors
+        and LOGON not in workspace.elements.editors
+        and not resource.settings.restrictions.allow_all_editors
+    ):
+        return f"{LOGON} is not available in the workspace configuration."
+    return None
+
+
+def sync_drawing(
+    backend: CatiaBackend | FakeBackend,
+    path: Path,
+    prefer_linked: bool = True,
+    dry_run: bool = False,
+) -> BatchResultModel:
+    """
+    Opens the drawing, syncs its title block with the linked document, saves the drawing \
+        if anything has changed and closes it again. Drawings that have been open before \
+        are left open. Drawings outside of any workspace (unless allowed by the settings) \
+        and drawings the user must not change (see `get_restriction`) are skipped.
+
+    Args:
+        backend (CatiaBackend | FakeBackend): The backend that provides the documents.
+        path (Path): The path of the drawing.
+        prefer_linked (bool, optional): Prefer the values of the linked document over \
+            the values of the title block. Defaults to True.
+        dry_run (bool, optional): Only compare the title block with the linked document \
+            and report the differences as `changed`, without writing anything. The \
+            restrictions of the user don't apply. Defaults to False.
+
+    Returns:
+        BatchResultModel: The result of the drawing. Exceptions are caught and reported \
+            as failed result.
+    """
+    start = time.perf_counter()
+    drawing = None
+    opened = False
+    message: str | None = None
+    changed: Dict[str, Tuple[str | None, str]] = {}
+    missing: List[str] = []
+    try:
+        opened = not backend.is_open(path)
+        drawing = backend.open_drawing(path)
+        doc_loader = DocumentLoader(backend=backend, drawing_document=drawing)
+        workspace = Workspace(
+            path=doc_loader.path,
+            filename=resource.settings.files.workspace,
+            allow_outside_workspace=resource.settings.restrictions.allow_outside_workspace,
+        )
+        workspace.read_yaml()
+        doc_loader.set_workspace(workspace)
+
+        if doc_loader.locked:
+            status, message = BatchStatus.SKIPPED, "First view is locked."
+        elif doc_loader.linked_snapshot is None:
+            status, message = BatchStatus.SKIPPED, "No document linked."
+        elif dry_run:
+            data_loader = DataLoader(variables=None, layout=None, doc_loader=doc_loader)
+            differences = data_loader.get_differences()
+            changed = {d.name: (d.title_block, d.linked) for d in differences}
+            status = BatchStatus.OUT_OF_SYNC if changed else BatchStatus.UNCHANGED
+        elif (restriction := get_restriction(workspace)) is not None:
+            status, message = BatchStatus.SKIPPED, restriction
+        else:
+            data_loader = DataLoader(variables=None, layout=None, doc_loader=doc_loader)
+            summary = data_loader.load_into_title_block(
+                data_loader.get_synced_values(prefer_linked=prefer_linked)
+            )
+            changed, missing = summary.changed, summary.missing
+            if summary.has_changes:
+                doc_loader.save_drawing()
+                status = BatchStatus.UPDATED
+            else:
+                doc_loader.cache_title_block()
+                status = BatchStatus.UNCHANGED
+    except PytiaUiToolsOutsideWorkspaceError as e:
+        status, message = BatchStatus.SKIPPED, f"Outside of any workspace: {e}"
+    except Exception as e:  # pylint: disable=W0718
+        log.warning(f"Failed to sync {str(path)!r}: {e}")
+        status, message = BatchStatus.FAILED, f"{type(e).__name__}: {e}"
+    finally:
+        if drawing is not None and opened:
+            _close(drawing, path)
+
+    log.info(f"Batch: {str(path)!r} {status.value}.")
+    return BatchResultModel(
+        path=str(path),
+        status=status,
+        changed=dict(changed),
+        missing=list(missing),
+        message=message,
+        duration=round(time.perf_counter() - start, 3),
+    )
+
+
+def _close(drawing: PyDrawingDocument | FakeDrawingDocument, path: Path) -> None:
+    try:
+        drawing.document.close()
+    except Exception as e:  # pylint: disable=W0718
+        log.warning(f"Failed to close {str(path)!r}: {e}")
+
+
+def _create_catia_backend() -> CatiaBackend:
+    from backend.catia import CatiaBackend  # pylint: disable=C0415
+
+    return CatiaBackend()
+
+
+def _init_worker(backend_factory: Callable[[], CatiaBackend | FakeBackend]) -> None:
+    """Initializer of the worker processes: Creates the backend of the process."""
+    global _backend  # pylint: disable=W0603
+    _backend = backend_factory()
+
+
+def _sync_in_worker(path: Path, prefer_linked: bool, dry_run: bool) -> BatchResultModel:
+    assert _backend is not None, "Worker has not been initialized."
+    return sync_drawing(_backend, path, prefer_linked=prefer_linked, dry_run=dry_run)
+
+
+def run_batch(
+    paths: Iterable[str | Path],
+    backend_factory: Callable[[], CatiaBackend | FakeBackend] | None = None,
+    workers: int = 1,
+    prefer_linked: bool = True,
+    dry_run: bool = False,
+) -> List[BatchResultModel]:
+    """
+    Syncs the title blocks of all drawings found in the given paths.
+
+    Args:
+        paths (Iterable[str | Path]): Paths of drawings and folders. Environment \
+            variables like `%ONEDRIVE%` are expanded.
+        backend_factory (Callable[[], CatiaBackend | FakeBackend] | None, optional): \
+            Creates the backend of each worker, must be picklable. Each backend must \
+            provide its own application. Defaults to the CATIA backend.
+        workers (int, optional): The number of worker processes. With 1 the drawings \
+            are processed in this process. The CATIA backend always uses 1 worker: All \
+            backends connect to the same running CATIA application, whose active \
+            document is shared. Defaults to 1.
+        prefer_linked (bool, optional): Prefer the values of the linked document over \
+            the values of the title block. Defaults to True.
+        dry_run (bool, optional): Only report the differences between the title blocks \
+            and the linked documents, see `sync_drawing`. Defaults to False.
+
+    Returns:
+        List[BatchResultModel]: The results, in the order of the drawings.
+    """
+    drawings = collect_drawings(paths)
+    if backend_factory is None:
+        if workers > 1:
+            log.warning("Batch: The CATIA application is shared, using 1 worker.")
+        backend_factory, workers = _create_catia_backend, 1
+    workers = max(1, min(workers, len(drawings)))
+    log.info(f"Batch: Syncing {len(drawings)} drawings with {workers} worker(s).")
+
+    if workers == 1:
+        backend = backend_factory()
+        return [sync_drawing(backend, d, prefer_linked, dry_run) for d in drawings]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(backend_factory,),
+    ) as executor:
+        return list(
+            executor.map(
+                _sync_in_worker, drawings, repeat(prefer_linked), repeat(dry_run)
+            )
+        )
+
+
+def export_drawing(
+    backend: CatiaBackend | FakeBackend,
+    path: Path,
+    file: IO[str],
+    fmt: str,
+    header: bool,
+) -> BatchResultModel:
+    """
+    Opens the drawing, streams its tolerated dimensions into the file and closes it again, \
+        unless it has been open before.
+
+    Args:
+        backend (CatiaBackend | FakeBackend): The backend that provides the documents.
+        path (Path): The path of the drawing.
+        file (IO[str]): The export file.
+        fmt (str): The format of the export file, see `tools.tolerance_export`.
+        header (bool): Writes the CSV header.
+
+    Returns:
+        BatchResultModel: The result of the drawing. Exceptions are caught and reported \
+            as failed result.
+    """
+    start = time.perf_counter()
+    drawing = None
+    opened = False
+    message: str | None = None
+    exported = 0
+    try:
+        opened = not backend.is_open(path)
+        drawing = backend.open_drawing(path)
+        doc_loader = DocumentLoader(backend=backend, drawing_document=drawing)
+        exported = export_tolerances(ToleranceTools(doc_loader), file, fmt, header)
+        status = BatchStatus.EXPORTED
+    except Exception as e:  # pylint: disable=W0718
+        log.warning(f"Failed to export {str(path)!r}: {e}")
+        status, message = BatchStatus.FAILED, f"{type(e).__name__}: {e}"
+    finally:
+        if drawing is not None and opened:
+            _close(drawing, path)
+
+    log.info(f"Export: {str(path)!r} {status.value}.")
+    return BatchResultModel(
+        path=str(path),
+        status=status,
+        message=message,
+        exported=exported,
+        duration=round(time.perf_counter() - start, 3),
+    )
+
+
+def run_export(
+    paths: Iterable[str | Path],
+    output: str | Path,
+    backend_factory: Callable[[], CatiaBackend | FakeBackend] | None = None,
+) -> List[BatchResultModel]:
+    """
+    Exports the tolerated dimensions of all drawings found in the given paths into one \
+        file. The format is given by the suffix of the output, `.csv` or `.jsonl`.
+
+    Args:
+        paths (Iterable[str | Path]): Paths of drawings and folders. Environment \
+            variables like `%ONEDRIVE%` are expanded.
+        output (str | Path): The path of the export file.
+        backend_factory (Callable[[], CatiaBackend | FakeBackend] | None, optional): \
+            Creates the backend. Defaults to the CATIA backend.
+
+    Returns:
+        List[BatchResultModel]: The results, in the order of the drawings.
+    """
+    fmt = get_format(output)
+    drawings = collect_drawings(paths)
+    backend = (backend_factory or _create_catia_backend)()
+    log.info(f"Export: Exporting {len(drawings)} drawings to {str(output)!r}.")
+
+    results: List[BatchResultModel] = []
+    header = True
+    with open(output, "w", encoding="utf8", newline="") as f:
+        for drawing in drawings:
+            result = export_drawing(backend, drawing, f, fmt, header)
+            header &= result.status != BatchStatus.EXPORTED
+            results.append(result)
+    return results
+
+
+def write_report(
+    results: Sequence[BatchResultModel],
+    path: str | Path | None = None,
+    prefix: str = "batch",
+) -> Path:
+    """
+    Writes the results as json report.
+
+    Args:
+        results (Sequence[BatchResultModel]): The results of the batch run.
+        path (str | Path | None, optional): The path of the report. Defaults to a file in \
+            the logs folder.
+        prefix (str, optional): The prefix of the default file name. Defaults to `batch`.
+
+    Returns:
+        Path: The path of the report.
+    """
+    if path is None:
+        path = Path(LOGS, f"{prefix}_{datetime.now():%Y%m%d_%H%M%S}_{PID}.json")
+    path = Path(path)
+    os.makedirs(path.parent, exist_ok=True)
+
+    report: Dict[str, Any] = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "drawings": len(results),
+        "summary": dict(Counter(result.status.value for result in results)),
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w", encoding="utf8") as f:
+        json.dump(report, f, indent=2)
+    log.info(f"Batch: {report['summary']}, report written to {str(path)!r}.")
+    return path
+
+
+def run_batch_cli(argv: Sequence[str]) -> int:
+    """
+    Runs the batch mode from the command line.
+
+    Args:
+        argv (Sequence[str]): The command line arguments, without the `batch` command.
+
+    Returns:
+        int: The exit code: 1 if any drawing failed, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="pytia_title_block batch",
+        description="Syncs the title blocks of drawings with their linked documents.",
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="Drawings or folders, searched recursively."
+    )
+    parser.add_argument(
+        "--report", default=None, help="Path of the json report (default: logs)."
+    )
+    parser.add_argument(
+        "--keep-title-block",
+        action="store_true",
+        help="Prefer the title block values over the linked document, like the app.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report title blocks that differ from their linked document.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_batch(
+        args.paths,
+        prefer_linked=not args.keep_title_block,
+        dry_run=args.dry_run,
+    )
+    write_report(results, args.report)
+    return int(any(result.status == BatchStatus.FAILED for result in results))
+
+
+def run_export_cli(argv: Sequence[str]) -> int:
+    """
+    Runs the tolerance export from the command line.
+
+    Args:
+        argv (Sequence[str]): The command line arguments, without the `export` command.
+
+    Returns:
+        int: The exit code: 1 if any drawing failed, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="pytia_title_block export",
+        description="Exports the tolerated dimensions of drawings as CSV or JSON Lines.",
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="Drawings or folders, searched recursively."
+    )
+    parser.add_argument(
+        "--output", required=True, help="Path of the export file (.csv or .jsonl)."
+    )
+    parser.add_argument(
+        "--report", default=None, help="Path of the json report (default: logs)."
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        get_format(args.output)
+    except ValueError as e:
+        parser.error(str(e))
+
+    results = run_export(args.paths, args.output)
+    write_report(results, args.report, prefix="export")
+    return int(any(result.status == BatchStatus.FAILED for result in results))
@@ -18,6 +18,7 @@ CNEXT = "win_b64\\code\\bin\\CNEXT.exe"
 TEMP = str(os.environ.get("TEMP"))
 APPDATA = f"{str(os.environ.get('APPDATA'))}\\{PYTIA}\\{PYTIA_TITLE_BLOCK}"
 LOGS = f"{APPDATA}\\logs"
+CACHE = f"{APPDATA}\\cache"
 LOG = "app.log"
 PID = os.getpid()
 PID_FILE = f"{TEMP}\\{PYTIA_TITLE_BLOCK}.pid"
@@ -29,6 +30,9 @@ EXPLORER = os.path.join(str(os.getenv("WINDIR")), "explorer.exe")
 
 PROP_DRAWING_PATH = "pytia.drawing_path"
 
+ENV_COM_STATS = "PYTIA_TITLE_BLOCK_COM_STATS"
+LOADER_POLL_INTERVAL = 50  # ms
+
 CONFIG_APPDATA = "config.json"
 CONFIG_SETTINGS = "settings.json"
 CONFIG_DEPS = "dependencies.json"
@@ -40,10 +44,18 @@ CONFIG_TB_ITEMS_DEFAULT = "title_block_items.default.json"
 CONFIG_INFOS = "information.json"
 CONFIG_INFOS_DEFAULT = "information.default.json"
 CONFIG_USERS = "users.json"
+CONFIG_BUNDLE = "resources.bundle"
+CONFIG_USERS_INDEX = "users.sqlite"
+CONFIG_USERS_CACHE = "users.cache.sqlite"
 
 TOLERANCE_TABLE_NAME = "tolerance_table"
 TOLERANCE_TABLE_CELL_HEIGHT = 4.5
 TOLERANCE_TABLE_CELL_WIDTH = 32.3333
+TOLERANCE_TABLE_FONT_SIZE = 2
+TOLERANCE_TABLE_ALIGNMENT = 4  # CatTableMiddleLeft
+TOLERANCE_TABLE_GAP = 5  # mm, between side-by-side tables
+TOLERANCE_TABLE_TOP_MARGIN = 25  # mm, frame and notes above the tables
+TOLERANCE_COLUMNAR_THRESHOLD = 5000  # dimensions, see tools.tolerance_columns
 
 WEB_PIP = "https://www.pypi.org"
 
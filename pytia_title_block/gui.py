@@ -2,6 +2,7 @@
     The main window for the application.
 """
 
+import queue
 import tkinter as tk
 from pathlib import Path
 from tkinter import font
@@ -16,12 +17,15 @@ from app.tooltips import ToolTips
 from app.traces import Traces
 from app.vars import Variables
 from const import APP_VERSION
+from const import LOADER_POLL_INTERVAL
 from const import LOG
 from const import LOGON
 from const import LOGS
 from helper.messages import show_help
+from loader.background_loader import BackgroundLoader
 from loader.data_loader import DataLoader
 from loader.doc_loader import DocumentLoader
+from models.loader_model import LoadingResultModel
 from pytia.exceptions import PytiaBodyEmptyError
 from pytia.exceptions import PytiaDifferentDocumentError
 from pytia.exceptions import PytiaDocumentNotSavedError
@@ -34,6 +38,7 @@ from pytia_ui_tools.handlers.mail_handler import MailHandler
 from pytia_ui_tools.handlers.workspace_handler import Workspace
 from pytia_ui_tools.window_manager import WindowManager
 from resources import resource
+from tools.placement import sheet_indexes
 
 
 class GUI(tk.Tk):
@@ -52,6 +57,7 @@ class GUI(tk.Tk):
         self.data_loader: DataLoader  # Instantiate later for
         self.workspace: Workspace  # Instantiate later, dependent on doc_helper
         self.set_ui: UISetter  # Instantiate later, dependent on doc_helper
+        self.loader: BackgroundLoader  # Instantiate later, loads the document in a thread
         self.vars = Variables(root=self)
         self.frames = Frames(root=self)
         self.layout = Layout(
@@ -115,22 +121,76 @@ class GUI(tk.Tk):
         self.mainloop()
 
     def run_controller(self) -> None:
-        """Runs all controllers. Initializes all lazy loaders, bindings and traces."""
-        self.doc_loader = DocumentLoader(variables=self.vars)
+        """
+        Starts loading the document in a worker thread. The window stays responsive and \
+        shows the loading progress, `loaded_controller` runs when the document is loaded.
+        """
+        self.loader = BackgroundLoader()
+        self.loader.start()
+        self.poll_loader()
+
+    def poll_loader(self) -> None:
+        """
+        Polls the messages of the background loader: Shows progress stages, re-raises \
+        exceptions of the worker on the UI thread and hands the result to the \
+        `loaded_controller`.
+        """
+        while True:
+            try:
+                message = self.loader.messages.get_nowait()
+            except queue.Empty:
+                self.after(LOADER_POLL_INTERVAL, self.poll_loader)
+                return
+
+            if isinstance(message, Exception):
+                self.config(cursor="arrow")
+                self.vars.linked_document.set("-")
+                raise message
+            if isinstance(message, LoadingResultModel):
+                self.loaded_controller(message)
+                return
+            self.vars.linked_document.set(message)
+
+    def loaded_controller(self, result: LoadingResultModel) -> None:
+        """
+        Initializes all lazy loaders, bindings and traces with the loaded document.
+
+        Args:
+            result (LoadingResultModel): The result of the background loader.
+        """
+        # The worker's COM objects are bound to its thread: Acquire them again.
+        self.doc_loader = DocumentLoader(loaded=result.document)
+        self.workspace = result.workspace
+        self.doc_loader.set_workspace(self.workspace)
         self.data_loader = DataLoader(
             variables=self.vars, doc_loader=self.doc_loader, layout=self.layout
         )
-        self.workspace = Workspace(
-            path=self.doc_loader.path,
-            filename=resource.settings.files.workspace,
-            allow_outside_workspace=resource.settings.restrictions.allow_outside_workspace,
-        )
-        self.workspace.read_yaml()
-        self.doc_loader.set_workspace(self.workspace)
+        self.vars.linked_document.set("-")
 
         if ws_title := self.workspace.elements.title:
             self.title(f"{self.title()}  -  {ws_title} (Workspace)")
 
+        if self.doc_loader.missing_items:
+            tkmsg.showwarning(
+                title=resource.settings.title,
+                message=(
+                    "The title block of the current document doesn't have all required items. "
+                    "It is possible, that some information will be lost. Please consider "
+                    "updating the title block.\n\nItems missing:\n"
+                    f"{', '.join(self.doc_loader.missing_items)}"
+                ),
+            )
+        if self.doc_loader.locked:
+            self.vars.locked.set(True)
+            tkmsg.showinfo(
+                title=resource.settings.title,
+                message=(
+                    "The settings are set to disable this app if the first view is locked. "
+                    "Unlock the first view to enable editing.\n\n"
+                    "But take into account, there is a reason why the view is locked."
+                ),
+            )
+
         self.set_ui = UISetter(
             root=self,
             layout=self.layout,
@@ -187,11 +247,20 @@ class GUI(tk.Tk):
         self.data_loader.load_into_app()
         self.set_ui.normal()
 
+    def reload(self) -> None:
+        """Reads the title block again and reloads the UI."""
+        sheet_indexes.invalidate()
+        # Texts may have been added, removed or renamed in CATIA meanwhile.
+        self.doc_loader.invalidate_text_index()
+        self.doc_loader.check_title_block()
+        self.doc_loader.read_text_values()
+        self.main_controller()
+
     def bindings(self) -> None:
         """Key bindings."""
         self.bind("<Escape>", lambda _: self.destroy())
         self.bind("<F1>", lambda _: show_help())
-        self.bind("<F5>", lambda _: self.main_controller())
+        self.bind("<F5>", lambda _: self.reload())
         # FIXME: There is a bug on the middle mouse button, where, when the button is clicked,
         # selected text will be inserted into a widget, when the cursor hovers above the widget.
         # I can't find the source of the bug, this is a to do.
@@ -0,0 +1,101 @@
+"""
+    Loads the document in a worker thread.
+
+    The worker connects to CATIA within its own COM apartment, loads the drawing and the
+    linked document, reads the title block values and the workspace file. Progress stages,
+    the result and any exception are handed to the UI thread through a queue, which must be
+    polled by the UI thread (see `GUI.run_controller`). The worker never touches the UI.
+
+    COM objects are bound to the apartment of the thread that obtained them. The result
+    therefore holds plain data only (see `LoadedDocumentModel`), the UI thread acquires its
+    own COM objects from it without reading the title block and the linked document again.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import TYPE_CHECKING
+
+from loader.doc_loader import DocumentLoader
+from models.loader_model import LoadingResultModel
+from pytia.log import log
+from pytia_ui_tools.handlers.workspace_handler import Workspace
+from resources import resource
+
+if TYPE_CHECKING:
+    from backend.catia import CatiaBackend
+    from backend.fake import FakeBackend
+
+
+class BackgroundLoader:
+    """Loads the document in a worker thread."""
+
+    def __init__(self, backend: CatiaBackend | FakeBackend | None = None) -> None:
+        """
+        Initializes the background loader.
+
+        Args:
+            backend (CatiaBackend | FakeBackend | None, optional): The backend that \
+                provides the documents. Defaults to the CATIA backend, which is created \
+                in the worker thread.
+        """
+        self.backend = backend
+        self.messages: queue.Queue[str | LoadingResultModel | Exception] = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="BackgroundLoader", daemon=True
+        )
+
+    @property
+    def is_alive(self) -> bool:
+        """Returns True while the worker thread is running."""
+        return self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts the worker thread."""
+        self._thread.start()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Waits for the worker thread to finish."""
+        self._thread.join(timeout)
+
+    def _progress(self, stage: str) -> None:
+        log.info(f"Loading: {stage}")
+        self.messages.put(stage)
+
+    def _run(self) -> None:
+        """The worker. Puts the progress stages, and the result or the exception."""
+        if self.backend is None:
+            from backend.catia import CatiaBackend  # pylint: disable=C0415
+
+            self.backend = CatiaBackend()
+
+        self.backend.initialize_thread()
+        try:
+            self._progress("Loading drawing and linked document ...")
+            doc_loader = DocumentLoader(backend=self.backend)
+
+            self._progress("Reading title block ...")
+            doc_loader.read_text_values()
+
+            self._progress("Reading workspace ...")
+            workspace = Workspace(
+                path=doc_loader.path,
+                filename=resource.settings.files.workspace,
+                allow_outside_workspace=resource.settings.restrictions.allow_outside_workspace,
+            )
+            workspace.read_yaml()
+            doc_loader.set_workspace(workspace)
+            doc_loader.cache_title_block()
+
+            document = doc_loader.to_loaded_model()
+            # The COM objects of the worker are released before leaving the apartment.
+            del doc_loader
+            self.messages.put(
+                LoadingResultModel(document=document, workspace=workspace)
+            )
+        except Exception as e:  # pylint: disable=W0718
+            log.warning(f"Loading failed: {e}")
+            self.messages.put(e)
+        finally:
+            self.backend.uninitialize_thread()
@@ -0,0 +1,307 @@
+"""
+    SQLite catalogue of the title blocks of all drawings of a workspace.
+
+    The catalogue is filled incrementally: Every cached title block (see `metadata_cache`)
+    is added when a drawing is loaded, saved or synced in batch mode, and `scan` adds all
+    drawings of a folder, whose cache entries are up to date. Queries are answered from
+    indexed columns, without CATIA and without crawling folders.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import date
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+from const import CACHE
+from loader.metadata_cache import MetadataCache
+from loader.metadata_cache import metadata_cache
+from models.cache_model import TitleBlockCacheModel
+from pytia.log import log
+from resources import resource
+
+# Increment if the schema changes. An outdated catalogue is dropped and refilled, it only
+# holds data that can be recovered from the drawings. Changed title block items are
+# detected by the columns of the table.
+SCHEMA_VERSION = 1
+FIXED_COLUMNS = (
+    "drawing_key",
+    "drawing_path",
+    "mtime_ns",
+    "size",
+    "linked_key",
+    "linked_path",
+    "released",
+    "created",
+)
+RELEASE_DATE_FORMAT = "%d.%m.%Y"
+DRAWING_SUFFIX = ".catdrawing"
+
+
+def _key(path: str | Path) -> str:
+    """Returns the normalized path, used for lookups."""
+    return os.path.normcase(str(path))
+
+
+class Catalogue:
+    """Catalogue of the title blocks of a workspace."""
+
+    # The catalogues of the workspaces, opened once per session, see `for_workspace`.
+    _workspaces: Dict[Path, "Catalogue"] = {}
+    _workspaces_lock = threading.Lock()
+
+    def __init__(self, database: str | Path) -> None:
+        """
+        Inits the catalogue, creates the database if it doesn't exist.
+
+        Args:
+            database (str | Path): The path of the database file.
+        """
+        self.database = Path(database)
+        self.columns: List[str] = resource.title_block_items.keys
+        os.makedirs(self.database.parent, exist_ok=True)
+        self._create_schema()
+
+    @classmethod
+    def for_workspace(cls, workspace_folder: str | Path | None) -> "Catalogue":
+        """
+        Returns the catalogue of the given workspace folder. Drawings outside of any \
+            workspace share a common catalogue. Each catalogue is opened once per session.
+
+        Args:
+            workspace_folder (str | Path | None): The folder of the workspace file.
+
+        Returns:
+            Catalogue: The catalogue.
+        """
+        name = (
+            hashlib.sha1(_key(workspace_folder).encode("utf8")).hexdigest()
+            if workspace_folder
+            else "default"
+        )
+        database = Path(CACHE, "catalogues", f"{name}.sqlite")
+        with cls._workspaces_lock:
+            if database not in cls._workspaces:
+                cls._workspaces[database] = cls(database)
+            return cls._workspaces[database]
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation keeps the catalogue usable from the loader thread,
+        # the UI thread and the worker processes of the batch mode.
+        connection = sqlite3.connect(self.database, timeout=10)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _create_schema(self) -> None:
+        item_columns = ", ".join(f'"{column}" TEXT' for column in self.columns)
+        with closing(self._connect()) as connection, connection:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            columns = [
+                row["name"] for row in connection.execute("PRAGMA table_info(drawings)")
+            ]
+            if version not in (0, SCHEMA_VERSION) or (
+                columns and columns != [*FIXED_COLUMNS, *self.columns]
+            ):
+                log.info(f"Catalogue {str(self.database)!r} is outdated, recreating.")
+                connection.execute("DROP TABLE IF EXISTS drawings")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS drawings (
+                    drawing_key TEXT PRIMARY KEY,
+                    drawing_path TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    linked_key TEXT,
+                    linked_path TEXT,
+                    released TEXT,
+                    created TEXT NOT NULL,
+                    {item_columns}
+                )
+                """
+            )
+            for column in ("linked_key", "released", "partnumber", "product"):
+                connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS "ix_{column}" ON drawings ("{column}")'
+                )
+            connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    @staticmethod
+    def _parse_release_date(value: str | None) -> str | None:
+        """Returns the release date of the title block as ISO date, for range queries."""
+        try:
+            return (
+                datetime.strptime(value or "", RELEASE_DATE_FORMAT).date().isoformat()
+            )
+        except ValueError:
+            return None
+
+    def _to_model(self, row: sqlite3.Row) -> TitleBlockCacheModel:
+        return TitleBlockCacheModel(
+            path=row["drawing_path"],
+            mtime_ns=row["mtime_ns"],
+            size=row["size"],
+            values={column: row[column] for column in self.columns},
+            linked_path=row["linked_path"],
+            created=row["created"],
+        )
+
+    def upsert(self, entry: TitleBlockCacheModel) -> None:
+        """
+        Adds the title block to the catalogue or replaces it.
+
+        Args:
+            entry (TitleBlockCacheModel): The title block, see `MetadataCache`.
+        """
+        columns = [*FIXED_COLUMNS, *self.columns]
+        values = [
+            _key(entry.path),
+            entry.path,
+            entry.mtime_ns,
+            entry.size,
+            _key(entry.linked_path) if entry.linked_path else None,
+            entry.linked_path,
+            self._parse_release_date(entry.get("release_date")),
+            entry.created,
+            *(entry.get(column) for column in self.columns),
+        ]
+        names = ", ".join(f'"{column}"' for column in columns)
+        placeholders = ", ".join("?" * len(columns))
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO drawings ({names}) VALUES ({placeholders})",
+                values,
+            )
+        log.debug(f"Catalogued {entry.path!r}.")
+
+    def remove(self, path: str | Path) -> None:
+        """Removes the drawing from the catalogue."""
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "DELETE FROM drawings WHERE drawing_key = ?", (_key(path),)
+            )
+
+    def get(self, path: str | Path) -> TitleBlockCacheModel | None:
+        """Returns the catalogued title block of the drawing, or None."""
+        rows = self._query("drawing_key = ?", (_key(path),))
+        return rows[0] if rows else None
+
+    def find(
+        self,
+        product: str | None = None,
+        partnumber: str | None = None,
+        document_type: str | None = None,
+        released_after: date | None = None,
+        released_before: date | None = None,
+    ) -> List[TitleBlockCacheModel]:
+        """
+        Returns all catalogued drawings matching all given criteria.
+
+        Args:
+            product (str | None, optional): The product number. Defaults to None.
+            partnumber (str | None, optional): The partnumber. Defaults to None.
+            document_type (str | None, optional): The document type. Defaults to None.
+            released_after (date | None, optional): Only drawings released after (and \
+                on) this date. Defaults to None.
+            released_before (date | None, optional): Only drawings released before (and \
+                on) this date. Defaults to None.
+
+        Returns:
+            List[TitleBlockCacheModel]: The drawings, ordered by release date and path.
+        """
+        conditions: List[str] = []
+        parameters: List[Any] = []
+        for column, value in (
+            ("product", product),
+            ("partnumber", partnumber),
+            ("document_type", document_type),
+        ):
+            if value is not None:
+                conditions.append(f'"{column}" = ?')
+                parameters.append(value)
+        if released_after is not None:
+            conditions.append("released >= ?")
+            parameters.append(released_after.isoformat())
+        if released_before is not None:
+            conditions.append("released <= ?")
+            parameters.append(released_before.isoformat())
+        return self._query(" AND ".join(conditions) or "1", tuple(parameters))
+
+    def find_by_linked(self, linked_path: str | Path) -> List[TitleBlockCacheModel]:
+        """
+        Returns the drawings of the given part or product.
+
+        Args:
+            linked_path (str | Path): The path of the linked document.
+
+        Returns:
+            List[TitleBlockCacheModel]: The drawings, ordered by release date and path.
+        """
+        return self._query("linked_key = ?", (_key(linked_path),))
+
+    def _query(
+        self, where: str, parameters: Tuple[Any, ...]
+    ) -> List[TitleBlockCacheModel]:
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                f"SELECT * FROM drawings WHERE {where} ORDER BY released, drawing_path",
+                parameters,
+            ).fetchall()
+        return [self._to_model(row) for row in rows]
+
+    def __iter__(self) -> Iterator[TitleBlockCacheModel]:
+        yield from self._query("1", ())
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM drawings").fetchone()[0]
+
+    def scan(
+        self, folder: str | Path, cache: MetadataCache = metadata_cache
+    ) -> Tuple[int, List[Path]]:
+        """
+        Adds all drawings of the folder (recursively), whose metadata cache entries are \
+            up to date, and removes catalogued drawings of the folder that don't exist \
+            anymore. Doesn't need CATIA.
+
+        Args:
+            folder (str | Path): The folder to scan.
+            cache (MetadataCache, optional): The cache. Defaults to the metadata cache.
+
+        Returns:
+            Tuple[int, List[Path]]: The number of catalogued drawings and the drawings, \
+                that have no up to date cache entry. Those must be loaded (e.g. by the \
+                batch mode) to be catalogued.
+        """
+        catalogued = 0
+        outdated: List[Path] = []
+        found = set()
+        for path in Path(folder).rglob("*"):
+            if path.suffix.lower() != DRAWING_SUFFIX:
+                continue
+            found.add(_key(path))
+            if (entry := cache.lookup(path)) is not None:
+                self.upsert(entry)
+                catalogued += 1
+            else:
+                outdated.append(path)
+
+        # The separator bounds the prefix: `C:\A` must not match `C:\AB\x.CATDrawing`.
+        folder_key = os.path.join(_key(Path(folder)).rstrip("\\/"), "")
+        for entry in self:
+            key = _key(entry.path)
+            if key.startswith(folder_key) and key not in found:
+                self.remove(entry.path)
+
+        log.info(
+            f"Scanned {str(folder)!r}: {catalogued} catalogued, {len(outdated)} outdated."
+        )
+        return catalogued, outdated
@@ -2,33 +2,61 @@
     Data loader submodule.
 """
 
+from __future__ import annotations
+
 from datetime import datetime
 from fractions import Fraction
-from tkinter import StringVar
-from tkinter import ttk
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import List
 
-from app.layout import Layout
-from app.vars import Variables
 from const import APP_NAME
 from const import APP_VERSION
 from const import LOGON
 from loader.doc_loader import DocumentLoader
+from models.diff_model import TitleBlockDiffModel
+from models.text_model import TextWriteSummaryModel
 from pytia_ui_tools.widgets.tooltips import ToolTip
 from resources import resource
 
+# The UI is only imported for type checking, the loader is used without UI in batch mode.
+if TYPE_CHECKING:
+    from tkinter import StringVar
+    from tkinter import ttk
+
+    from app.layout import Layout
+    from app.vars import Variables
+
+# The keys of the title block items, that have a property of the same key in the linked
+# document (see `Props` and `TitleBlockItems`).
+LINKED_KEYS = (
+    "product",
+    "partnumber",
+    "revision",
+    "definition",
+    "material",
+    "base_size",
+    "tolerance",
+)
+
 
 class DataLoader:
     """Class for loading data from and to the app."""
 
     def __init__(
-        self, variables: Variables, layout: Layout, doc_loader: DocumentLoader
+        self,
+        variables: Variables | None,
+        layout: Layout | None,
+        doc_loader: DocumentLoader,
     ) -> None:
         """
         Inits the class.
 
         Args:
-            variables (Variables): The variables of the application.
-            layout (Layout): The layout of the application.
+            variables (Variables | None): The variables of the application. None when \
+                running without UI, see `get_synced_values`.
+            layout (Layout | None): The layout of the application. None when running \
+                without UI.
             doc_loader (DocumentLoader): The document loader instance.
         """
         self.doc_loader = doc_loader
@@ -108,8 +136,42 @@ class DataLoader:
             variable (StringVar): The tkinter variable, which holds the user's name.
             logon (str | None): The logon to translate.
         """
+        variable.set(self._get_username(logon))
+
+    @staticmethod
+    def _get_username(logon: str | None) -> str:
+        """Returns the name of the user with the given logon."""
         user = resource.get_user_by_logon(logon)
-        variable.set(user.name if user else f"Unknown user ({logon})")
+        return user.name if user else f"Unknown user ({logon})"
+
+    def _get_value(
+        self,
+        title_block_item: str,
+        property_name: str | None = None,
+        default_value: str | None = None,
+        prefer_linked: bool = False,
+    ) -> str:
+        """
+        Returns the value of a title block item from the title block, the linked document \
+            or the default value (in this order, the first two are swapped if \
+            `prefer_linked` is True).
+
+        Args:
+            title_block_item (str): The component name of the title block item.
+            property_name (str | None, optional): The property name of the linked document. \
+                Defaults to None.
+            default_value (str | None, optional): The default value. Defaults to None.
+            prefer_linked (bool, optional): Prefer the value of the linked document over \
+                the value of the title block. Defaults to False.
+
+        Returns:
+            str: The value, an empty string if no source has a value.
+        """
+        text_value = self.doc_loader.get_text_value_by_name(title_block_item)
+        prop_value = self.doc_loader.get_property_from_linked_doc(property_name)
+        if prefer_linked:
+            return prop_value or text_value or default_value or ""
+        return text_value or prop_value or default_value or ""
 
     def _get_scale(self) -> str:
         """Returns the first view's scale as fraction (1:1, 1:5, ...)."""
@@ -120,12 +182,13 @@ class DataLoader:
 
     def load_into_app(self) -> None:
         """Loads all data into the app."""
-        if self.doc_loader.linked_product is None:
+        self.doc_loader.refresh_linked_snapshot()
+
+        if (snapshot := self.doc_loader.linked_snapshot) is None:
             self.vars.linked_document.set("No document linked.")
         else:
             self.vars.linked_document.set(
-                f"{self.doc_loader.linked_product.part_number}"
-                f" Rev{self.doc_loader.linked_product.revision}"
+                f"{snapshot.get('partnumber')} Rev{snapshot.get('revision')}"
             )
 
         self._set_var(
@@ -203,53 +266,110 @@ class DataLoader:
             logon=LOGON,
         )
 
-    def load_into_title_block(self) -> None:
-        """Loads (writes) all data into the title block."""
-        self.doc_loader.set_text_value(
-            value=self.vars.product.get(), name=resource.title_block_items.product
+    def get_synced_values(self, prefer_linked: bool = True) -> Dict[str, str]:
+        """
+        Returns the values of all title block items without the UI: Each value is taken \
+            from the linked document, the title block or the default value, like \
+            `load_into_app` does. The 2D creator is kept as it is in the title block.
+
+        Args:
+            prefer_linked (bool, optional): Prefer the values of the linked document over \
+                the values of the title block, which syncs the title block with the \
+                linked document. Defaults to True.
+
+        Returns:
+            Dict[str, str]: The values, mapped by the component name of the title block item.
+        """
+        items = resource.title_block_items
+        props = resource.props
+        creator_3d = self.doc_loader.get_property_from_linked_doc(props.creator_3d)
+
+        values = {
+            getattr(items, key): self._get_value(
+                getattr(items, key), getattr(props, key), prefer_linked=prefer_linked
+            )
+            for key in LINKED_KEYS
+        }
+        values[items.release_date] = self._get_value(
+            items.release_date, default_value=datetime.now().strftime("%d.%m.%Y")
         )
-        self.doc_loader.set_text_value(
-            value=self.vars.partnumber.get(), name=resource.title_block_items.partnumber
+        values[items.document_type] = self._get_value(
+            items.document_type, default_value=resource.settings.doc_types[0]
         )
-        self.doc_loader.set_text_value(
-            value=self.vars.revision.get(), name=resource.title_block_items.revision
+        values[items.creator_3d] = (
+            self._get_username(creator_3d)
+            if creator_3d
+            else self._get_value(items.creator_3d)
         )
-        self.doc_loader.set_text_value(
-            value=self.vars.definition.get(), name=resource.title_block_items.definition
+        values[items.creator_2d] = self._get_value(
+            items.creator_2d, default_value=self._get_username(LOGON)
         )
+        return values
 
-        self.doc_loader.set_text_value(
-            value=self.vars.material.get(), name=resource.title_block_items.material
-        )
-        self.doc_loader.set_text_value(
-            value=self.vars.base_size.get(), name=resource.title_block_items.base_size
-        )
-        self.doc_loader.set_text_value(
-            value=self.vars.tolerance.get(), name=resource.title_block_items.tolerance
-        )
+    def get_differences(self) -> List[TitleBlockDiffModel]:
+        """
+        Compares the title block with the linked document, without writing anything. \
+            Only the texts of items whose property has a value in the linked document are \
+            read, the properties come from the linked document snapshot.
 
-        self.doc_loader.set_text_value(
-            value=self.vars.release_date.get(),
-            name=resource.title_block_items.release_date,
-        )
-        self.doc_loader.set_text_value(
-            value=self.vars.document_type.get(),
-            name=resource.title_block_items.document_type,
-        )
+        Returns:
+            List[TitleBlockDiffModel]: The title block items, that differ from the linked \
+                document.
+        """
+        items = resource.title_block_items
+        props = resource.props
+        text_index = self.doc_loader.text_index
+        differences: List[TitleBlockDiffModel] = []
 
-        self.doc_loader.set_text_value(
-            value=self.vars.creator_3d.get(), name=resource.title_block_items.creator_3d
-        )
-        self.doc_loader.set_text_value(
-            value=self.vars.creator_2d.get(), name=resource.title_block_items.creator_2d
-        )
+        for key in LINKED_KEYS:
+            name = getattr(items, key)
+            linked = self.doc_loader.get_property_from_linked_doc(getattr(props, key))
+            if not linked or name not in text_index:
+                continue
+            title_block = self.doc_loader.get_text_value_by_name(name)
+            if title_block != linked:
+                differences.append(
+                    TitleBlockDiffModel(
+                        key=key, name=name, title_block=title_block, linked=linked
+                    )
+                )
+        return differences
 
-        self.doc_loader.set_text_value(
-            value=self._get_scale(), name=resource.title_block_items.scale
-        )
-        self.doc_loader.set_text_value(
-            value=f"{APP_NAME} v{APP_VERSION}", name=resource.title_block_items.version
-        )
-        self.doc_loader.set_text_value(
-            value=str(self.doc_loader.path), name=resource.title_block_items.path
-        )
+    def load_into_title_block(
+        self, values: Dict[str, str] | None = None
+    ) -> TextWriteSummaryModel:
+        """
+        Loads (writes) all data into the title block. Only those text elements are \
+            written, whose value has changed.
+
+        Args:
+            values (Dict[str, str] | None, optional): The values of the title block items, \
+                mapped by component name. Defaults to the values of the UI.
+
+        Returns:
+            TextWriteSummaryModel: The summary of all written text elements.
+        """
+        items = resource.title_block_items
+        if values is None:
+            values = {
+                items.product: self.vars.product.get(),
+                items.partnumber: self.vars.partnumber.get(),
+                items.revision: self.vars.revision.get(),
+                items.definition: self.vars.definition.get(),
+                items.material: self.vars.material.get(),
+                items.base_size: self.vars.base_size.get(),
+                items.tolerance: self.vars.tolerance.get(),
+                items.release_date: self.vars.release_date.get(),
+                items.document_type: self.vars.document_type.get(),
+                items.creator_3d: self.vars.creator_3d.get(),
+                items.creator_2d: self.vars.creator_2d.get(),
+            }
+        values = {
+            **values,
+            items.scale: self._get_scale(),
+            items.version: f"{APP_NAME} v{APP_VERSION}",
+            items.path: str(self.doc_loader.path),
+        }
+        for name, value in values.items():
+            self.doc_loader.queue_text_value(value=value, name=name)
+        return self.doc_loader.write_text_values()
@@ -2,37 +2,109 @@
     Document loader for the UI.
 """
 
+from __future__ import annotations
+
 import os
+import sqlite3
 import sys
 from pathlib import Path
 from tkinter import messagebox as tkmsg
+from typing import TYPE_CHECKING
+from typing import Dict
 from typing import List
+from typing import Tuple
 
-from app.vars import Variables
+from backend import instrumentation
 from const import PROP_DRAWING_PATH
-from pycatia.drafting_interfaces.drawing_text import DrawingText
-from pycatia.drafting_interfaces.drawing_view import DrawingView
-from pycatia.in_interfaces.document import Document
-from pycatia.product_structure_interfaces.product import Product
+from loader.catalogue import Catalogue
+from loader.metadata_cache import MetadataCache
+from loader.metadata_cache import metadata_cache
+from models.cache_model import TitleBlockCacheModel
+from models.linked_model import LinkedSnapshotModel
+from models.loader_model import LoadedDocumentModel
+from models.text_model import TextWriteSummaryModel
+from pytia.exceptions import PytiaDifferentDocumentError
 from pytia.exceptions import PytiaDocumentNotSavedError
-from pytia.framework import framework
 from pytia.log import log
-from pytia.wrapper.documents.drawing_documents import PyDrawingDocument
-from pytia.wrapper.properties import PyProperties
-from pytia_ui_tools.handlers.workspace_handler import Workspace
 from resources import resource
+from resources.env_index import get_env_index
 from resources.utils import create_path_symlink
 from resources.utils import create_path_workspace_level
 
+# The CATIA object model is only imported for type checking, the objects are provided by
+# the backend. This keeps the loader usable with the in-memory backend on any platform.
+if TYPE_CHECKING:
+    from backend.catia import CatiaBackend
+    from backend.fake import FakeBackend
+    from backend.fake import FakeDrawingDocument
+    from pycatia.drafting_interfaces.drawing_text import DrawingText
+    from pycatia.drafting_interfaces.drawing_view import DrawingView
+    from pycatia.in_interfaces.document import Document
+    from pycatia.product_structure_interfaces.product import Product
+    from pytia.wrapper.documents.drawing_documents import PyDrawingDocument
+    from pytia.wrapper.properties import PyProperties
+    from pytia_ui_tools.handlers.workspace_handler import Workspace
+
 
 class DocumentLoader:
     """Helper class to handle document operations."""
 
-    def __init__(self, variables: Variables) -> None:
-        """Initialize the document loader."""
-        self.vars = variables
+    def __init__(
+        self,
+        backend: CatiaBackend | FakeBackend | None = None,
+        drawing_document: PyDrawingDocument | FakeDrawingDocument | None = None,
+        loaded: LoadedDocumentModel | None = None,
+    ) -> None:
+        """
+        Initialize the document loader.
+
+        The loader doesn't touch the UI, so it can be created in a worker thread. Items \
+        that are missing in the title block are stored in `missing_items`, a locked first \
+        view sets `locked`. It's up to the caller to inform the user.
+
+        Args:
+            backend (CatiaBackend | FakeBackend | None, optional): The backend that \
+                provides the documents. Defaults to the CATIA backend.
+            drawing_document (PyDrawingDocument | FakeDrawingDocument | None, optional): \
+                The drawing document to load, e.g. as opened by the batch mode. \
+                Defaults to the active document of the application.
+            loaded (LoadedDocumentModel | None, optional): The document as read by \
+                another loader, e.g. in the worker thread of the `BackgroundLoader`. \
+                The COM objects are acquired again in the calling thread, the title \
+                block and the linked document aren't read again. Defaults to None.
+
+        Raises:
+            PytiaDifferentDocumentError: Another document than the loaded one is active.
+        """
+        if backend is None:
+            from backend.catia import CatiaBackend  # pylint: disable=C0415
+
+            backend = CatiaBackend()
+        if instrumentation.is_enabled():
+            backend = instrumentation.instrument(backend)
+            if drawing_document is not None:
+                drawing_document = instrumentation.ComProxy(
+                    drawing_document, instrumentation.com_stats
+                )
+
+        self.backend = backend
+        self.application = backend.application
         self.workspace: Workspace | None = None
-        self.active_document = framework.catia.active_document
+        self.locked = False
+        self.missing_items: List[str] = []
+        # A given document is used as it is, another document may have been activated
+        # meanwhile.
+        if drawing_document is None:
+            drawing_document = self.backend.get_active_drawing()
+        self.drawing_document = drawing_document
+        self.active_document = self.drawing_document.document
+        if loaded is not None and not get_env_index().is_same_path(
+            self.active_document.full_name, loaded.path
+        ):
+            raise PytiaDifferentDocumentError(
+                f"The active document changed to {self.active_document.full_name!r} "
+                f"while loading {loaded.path!r}."
+            )
 
         # FIXME: Locking CATIA prevents the ability to detect changes on the document.
         # This means that the part or product won't be saved, even if the user tries to manually
@@ -48,8 +120,6 @@ class DocumentLoader:
                 "Please save the document first."
             )
 
-        self.drawing_document = PyDrawingDocument()
-        self.drawing_document.current()
         self.name = self.drawing_document.document.name
 
         self.sheets = self.drawing_document.drawing_document.sheets
@@ -65,9 +135,21 @@ class DocumentLoader:
         self._linked_view = None
         self._linked_product = None
         self._linked_properties = None
+        self._linked_snapshot: LinkedSnapshotModel | None = None
 
-        self.check_title_block()
-        self.get_linked()
+        self._text_index: Dict[str, DrawingText] | None = None
+        self._text_locations: Dict[str, Tuple[int, int]] = {}
+        self._text_values: Dict[str, str] = {}
+        self._pending_text_values: Dict[str, str] = {}
+
+        if loaded is None:
+            self.check_title_block()
+            self.get_linked()
+        else:
+            self.missing_items = list(loaded.missing_items)
+            self._text_locations = dict(loaded.text_locations)
+            self._text_values = dict(loaded.text_values)
+            self.get_linked(snapshot=loaded.linked_snapshot)
 
     @property
     def path(self) -> Path:
@@ -99,6 +181,14 @@ class DocumentLoader:
         """Returns the properties of the linked document."""
         return self._linked_properties
 
+    @property
+    def linked_snapshot(self) -> LinkedSnapshotModel | None:
+        """
+        Returns the snapshot of all properties of the linked document, taken when the \
+            document has been linked or refreshed.
+        """
+        return self._linked_snapshot
+
     def set_workspace(self, workspace: Workspace) -> None:
         """Takes the workspace object and stores it in the class"""
         self.workspace = workspace
@@ -111,72 +201,70 @@ class DocumentLoader:
             value (bool): True: Locks the catia UI, False: Releases the lock.
         """
         log.debug(f"Setting catia lock to {value!r}")
-        framework.catia.refresh_display = not value
-        framework.catia.interactive = not value
-        framework.catia.display_file_alerts = value
-        framework.catia.undo_redo_lock = value
+        self.application.refresh_display = not value
+        self.application.interactive = not value
+        self.application.display_file_alerts = value
+        self.application.undo_redo_lock = value
         if value:
-            framework.catia.disable_new_undo_redo_transaction()
+            self.application.disable_new_undo_redo_transaction()
         else:
-            framework.catia.enable_new_undo_redo_transaction()
+            self.application.enable_new_undo_redo_transaction()
 
     def get_all_open_documents(self) -> List[str]:
         """Returns a list of all open documents (document.name)"""
         open_documents: List[str] = []
-        for i in range(1, framework.catia.documents.count + 1):
-            open_documents.append(framework.catia.documents.item(i).name)
+        for i in range(1, self.application.documents.count + 1):
+            open_documents.append(self.application.documents.item(i).name)
         return open_documents
 
     def get_all_open_windows(self) -> List[str]:
         """Returns a list of all open windows"""
         open_windows: List[str] = []
-        for i in range(1, framework.catia.windows.count + 1):
-            open_windows.append(framework.catia.windows.item(i).name)
+        for i in range(1, self.application.windows.count + 1):
+            open_windows.append(self.application.windows.item(i).name)
         return open_windows
 
-    def check_title_block(self) -> None:
-        for item in resource.title_block_items.values:
-            missing_items = []
-            if self.get_text_by_name(item) is None:
-                missing_items.append(item)
-            if missing_items:
-                tkmsg.showwarning(
-                    title=resource.settings.title,
-                    message=(
-                        "The title block of the current document doesn't have all required items. "
-                        "It is possible, that some information will be lost. Please consider "
-                        "updating the title block.\n\nItems missing:\n"
-                        f"{', '.join(missing_items)}"
-                    ),
-                )
-                return
+    def check_title_block(self) -> List[str]:
+        """
+        Checks if all title block items are present in the drawing.
 
-    def get_linked(self) -> None:
-        """Retrieve the linked view, doc and properties from the first view."""
+        Returns:
+            List[str]: The names of the title block items, that are missing.
+        """
+        text_index = self.text_index
+        self.missing_items = [
+            item for item in resource.title_block_items.values if item not in text_index
+        ]
+        if self.missing_items:
+            log.warning(f"Title block items missing: {', '.join(self.missing_items)}.")
+        return self.missing_items
+
+    def get_linked(self, snapshot: LinkedSnapshotModel | None = None) -> None:
+        """
+        Retrieve the linked view, doc and properties from the first view.
+
+        Args:
+            snapshot (LinkedSnapshotModel | None, optional): The snapshot of the linked \
+                document, if it has already been taken. Defaults to None.
+        """
         if self.views.count > 2:
             first_view = self.views.item(3)
             if (
                 first_view.lock_status
                 and not resource.settings.restrictions.allow_locked_view
             ):
-                self.vars.locked.set(True)
-                tkmsg.showinfo(
-                    title=resource.settings.title,
-                    message=(
-                        "The settings are set to disable this app if the first view is locked. "
-                        "Unlock the first view to enable editing.\n\n"
-                        "But take into account, there is a reason why the view is locked."
-                    ),
-                )
+                self.locked = True
+                log.info(f"First view {first_view.name!r} is locked.")
 
             if first_view.is_generative():
                 self._linked_view = first_view
-                com_doc = first_view.generative_behavior.document.com_object
-
-                self._linked_product = Product(com_doc)
-                self._linked_doc = Document(self._linked_product.parent.com_object)
-                self._linked_properties = PyProperties(self._linked_product)
-                log.info(f"Linked document {self._linked_product.full_name!r}.")
+                (
+                    self._linked_product,
+                    self._linked_doc,
+                    self._linked_properties,
+                ) = self.backend.get_linked(first_view)
+                self._linked_snapshot = snapshot or self._take_linked_snapshot()
+                log.info(f"Linked document {self._linked_snapshot.path!r}.")
             else:
                 log.info(
                     f"Cannot link view {first_view.name!r}: View is not generative."
@@ -184,26 +272,117 @@ class DocumentLoader:
         else:
             log.info("No document available to link.")
 
+    def save_drawing(self) -> None:
+        """Saves the drawing document and caches its title block, see `cache_title_block`."""
+        self.drawing_document.document.save()
+        log.info(f"Saved drawing document {self.name!r}.")
+        self.cache_title_block()
+
     def open_linked(self) -> None:
         """Opens the linked document and closes the app."""
         if self.linked_document:
             if self.linked_document.name in self.get_all_open_windows():
-                framework.catia.windows.item(self.linked_document.name).activate()
+                self.application.windows.item(self.linked_document.name).activate()
                 log.info(f"User opened linked document (window).")
                 sys.exit()
             if self.linked_document.path().is_file():
-                framework.catia.documents.open(self.linked_document.path())
+                self.application.documents.open(self.linked_document.path())
                 log.info(f"User opened linked document (file).")
                 sys.exit()
         tkmsg.showinfo(
             title=resource.settings.title, message="No linked document found."
         )
 
+    @property
+    def text_index(self) -> Dict[str, DrawingText]:
+        """
+        Returns the index of all drawing texts of the sheet, mapped by their component \
+            name. The index is built on first access and reused until it's invalidated, \
+            see `invalidate_text_index`.
+        """
+        if self._text_index is None:
+            self._text_index = self._build_text_index()
+        return self._text_index
+
+    def _build_text_index(self) -> Dict[str, DrawingText]:
+        """
+        Enumerates all texts of all views of the sheet once. If multiple texts share the same \
+            name, the first one found (lowest view index) is kept.
+
+        If the locations of the title block texts are known from a loader of another \
+            thread (see `to_loaded_model`), only those texts are fetched. The index then \
+            holds the title block texts only.
+
+        Returns:
+            Dict[str, DrawingText]: The texts, mapped by their component name.
+        """
+        if self._text_locations:
+            try:
+                return self._fetch_text_locations()
+            except LookupError as e:
+                log.warning(f"Text locations are outdated ({e}), indexing all texts.")
+
+        text_index: Dict[str, DrawingText] = {}
+        self._text_locations = {}
+        for view_index in range(1, self.views.count + 1):
+            texts = self.views.item(view_index).texts
+            for index in range(1, texts.count + 1):
+                text = texts.item(index)
+                if text.name not in text_index:
+                    text_index[text.name] = text
+                    self._text_locations[text.name] = (view_index, index)
+        log.info(f"Indexed {len(text_index)} text elements of the drawing document.")
+        return text_index
+
+    def invalidate_text_index(self) -> None:
+        """
+        Drops the text index and the known locations of the texts. Call it whenever the \
+            texts of the sheet may have been added, removed or renamed, e.g. in CATIA while \
+            the app is open. The index is rebuilt on the next lookup.
+        """
+        self._text_index = None
+        self._text_locations = {}
+        log.debug("Invalidated text index.")
+
+    def _fetch_text_locations(self) -> Dict[str, DrawingText]:
+        """
+        Fetches the texts at their known locations.
+
+        Raises:
+            LookupError: A text isn't at its location anymore.
+        """
+        text_index: Dict[str, DrawingText] = {}
+        for name, (view_index, index) in self._text_locations.items():
+            texts = self.views.item(view_index).texts
+            if index > texts.count or (text := texts.item(index)).name != name:
+                raise LookupError(name)
+            text_index[name] = text
+        log.info(f"Fetched {len(text_index)} text elements at their known locations.")
+        return text_index
+
+    def to_loaded_model(self) -> LoadedDocumentModel:
+        """
+        Returns the plain data of the loaded document, without any COM object. Use it to \
+            hand the document to another thread, see `BackgroundLoader`.
+        """
+        self.text_index  # pylint: disable=W0104
+        return LoadedDocumentModel(
+            path=self.drawing_document.document.full_name,
+            missing_items=list(self.missing_items),
+            text_values=dict(self._text_values),
+            text_locations={
+                name: self._text_locations[name]
+                for name in resource.title_block_items.values
+                if name in self._text_locations
+            },
+            linked_snapshot=self._linked_snapshot,
+        )
+
     def get_text_by_name(self, name: str) -> DrawingText | None:
         """
         Returns the drawing text item of the document, which component name matches \
             the given name.
-        Searches for the name in all views.
+        Searches for the name in all views, see `text_index`.
 
         Args:
             name (str): The name of the drawing text item.
@@ -212,24 +391,32 @@ class DocumentLoader:
             DrawingText | None: The item or None, if the given name does not exist as \
                 drawing text.
         """
-        for view_index in range(1, self.views.count + 1):
-            for _ in range(1, self.views.item(view_index).texts.count + 1):
-                try:
-                    text = DrawingText(
-                        self.views.item(view_index).texts.get_item(name).com_object
-                    )
-                    log.info(
-                        f"Retrieved text element {name!r} from view {view_index!r}."
-                    )
-                    return text
-                except:
-                    pass
+        if (text := self.text_index.get(name)) is not None:
+            return text
         log.warning(f"No text element {name!r} found in drawing document.")
         return None
 
+    def read_text_values(self) -> Dict[str, str]:
+        """
+        Reads the values of all title block items from the drawing, replacing the values \
+            read before. Call this to get the current state of the title block, e.g. \
+            when reloading.
+
+        Returns:
+            Dict[str, str]: The raw values of the title block items, mapped by their name.
+        """
+        self._text_values = {}
+        for name in resource.title_block_items.values:
+            if (text := self.text_index.get(name)) is not None:
+                self._text_values[name] = text.text
+        log.info(f"Read {len(self._text_values)} title block values.")
+        return dict(self._text_values)
+
     def get_text_value_by_name(self, name: str) -> str | None:
         """
-        Returns the drawing text's value by its name.
+        Returns the drawing text's value by its name. The value is read from the drawing \
+            once and remembered for further lookups and for the change detection of \
+            `write_text_values`, see `read_text_values`.
 
         Args:
             name (str): The name of the drawing text, from which the value is retrieved.
@@ -238,8 +425,13 @@ class DocumentLoader:
             str | None: The value or None, if the given name does not exist as drawing \
                 text.
         """
-        text = self.get_text_by_name(name)
-        return text.text if text is not None and text.text != "-" else None
+        if (value := self._text_values.get(name)) is None:
+            text = self.get_text_by_name(name)
+            if text is None:
+                return None
+            value = text.text
+            self._text_values[name] = value
+        return value if value != "-" else None
 
     def set_text_value(self, value: str, name: str) -> None:
         """
@@ -255,8 +447,179 @@ class DocumentLoader:
 
         if text is not None:
             text.text = value
+            self._text_values[name] = value
             log.info(f"Wrote value {value!r} to text element {name!r}.")
 
+    def queue_text_value(self, value: str, name: str) -> None:
+        """
+        Queues the value for the drawing text. Nothing is written until \
+            `write_text_values` is called.
+
+        Args:
+            value (str): The value to set.
+            name (str): The component name of the drawing text.
+        """
+        self._pending_text_values[name] = value if value != "" else "-"
+
+    def write_text_values(self) -> TextWriteSummaryModel:
+        """
+        Writes all queued text values in one pass. Only texts whose value differs from the \
+            value read from the drawing are written, so an untouched title block doesn't \
+            modify the document at all.
+
+        Returns:
+            TextWriteSummaryModel: The summary of what has been written.
+        """
+        summary = TextWriteSummaryModel()
+        pending, self._pending_text_values = self._pending_text_values, {}
+
+        for name, value in pending.items():
+            text = self.get_text_by_name(name)
+            if text is None:
+                summary.missing.append(name)
+                continue
+
+            old_value = self._text_values.get(name)
+            if old_value is None:
+                old_value = text.text
+
+            if old_value == value:
+                summary.unchanged.append(name)
+            else:
+                text.text = value
+                summary.changed[name] = (old_value, value)
+            self._text_values[name] = value
+
+        log.info(
+            f"Wrote {len(summary.changed)} of {len(pending)} text elements "
+            f"({len(summary.unchanged)} unchanged, {len(summary.missing)} missing)."
+        )
+        for name, (old_value, value) in summary.changed.items():
+            log.debug(f"Text element {name!r}: {old_value!r} -> {value!r}.")
+        return summary
+
+    def cache_title_block(
+        self,
+        cache: MetadataCache = metadata_cache,
+        catalogue: Catalogue | None = None,
+    ) -> TitleBlockCacheModel | None:
+        """
+        Writes the title block values into the metadata cache and the catalogue of the \
+            workspace, if the drawing has no unsaved changes. Otherwise the values would \
+            not match the file on disk: Written values are cached when the drawing is \
+            saved by `save_drawing` or loaded again after it has been saved in CATIA.
+
+        Args:
+            cache (MetadataCache, optional): The cache. Defaults to the metadata cache.
+            catalogue (Catalogue | None, optional): The catalogue. Defaults to the \
+                catalogue of the workspace.
+
+        Returns:
+            TitleBlockCacheModel | None: The cache entry, None if nothing has been cached.
+        """
+        if not self.drawing_document.document.saved:
+            log.debug("Not caching title block: The drawing has unsaved changes.")
+            return None
+
+        items = resource.title_block_items
+        values = {
+            key: self.get_text_value_by_name(name) if name in self.text_index else None
+            for key, name in zip(items.keys, items.values)
+        }
+        linked_path = self._linked_snapshot.path if self._linked_snapshot else None
+        if (entry := cache.store(self.path, values, linked_path)) is None:
+            return None
+
+        try:
+            if catalogue is None:
+                catalogue = Catalogue.for_workspace(
+                    self.workspace.workspace_folder if self.workspace else None
+                )
+            catalogue.upsert(entry)
+        except (sqlite3.Error, OSError) as e:
+            log.warning(f"Failed to catalogue the drawing: {e}")
+        return entry
+
+    def _take_linked_snapshot(self) -> LinkedSnapshotModel:
+        """
+        Reads all standard and user defined properties of the linked product in one pass.
+
+        Returns:
+            LinkedSnapshotModel: The snapshot of the linked document.
+        """
+        assert self._linked_product is not None
+
+        path = self._linked_product.full_name
+        standard = {
+            "partnumber": self._linked_product.part_number,
+            "definition": self._linked_product.definition,
+            "revision": self._linked_product.revision,
+            "nomenclature": self._linked_product.nomenclature,
+            "source": str(self._linked_product.source),
+            "description": self._linked_product.description_reference,
+        }
+
+        user = {}
+        parameters = self._linked_product.user_ref_properties
+        for index in range(1, parameters.count + 1):
+            parameter = parameters.item(index)
+            # User properties are named like 'Part1\Properties\name'. The value is read
+            # like the properties' values are read and written, see `linked_properties`.
+            user[parameter.name.rsplit("\\", 1)[-1]] = parameter.value
+
+        mtime_ns, size = self._stat_linked(path)
+        log.info(
+            f"Took snapshot of {len(standard) + len(user)} properties from the linked "
+            "document."
+        )
+        return LinkedSnapshotModel(
+            path=path, mtime_ns=mtime_ns, size=size, standard=standard, user=user
+        )
+
+    @staticmethod
+    def _stat_linked(path: str) -> Tuple[int | None, int | None]:
+        """Returns the modification time and the size of the linked document file."""
+        try:
+            stat = os.stat(path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None, None
+
+    def linked_changed(self) -> bool:
+        """
+        Returns whether the linked document has changed since the snapshot has been taken. \
+            The linked document has changed if its file has been modified on disk, or if \
+            it has unsaved changes in the current CATIA session.
+        """
+        if self._linked_snapshot is None or self._linked_doc is None:
+            return False
+        if self._stat_linked(self._linked_snapshot.path) != (
+            self._linked_snapshot.mtime_ns,
+            self._linked_snapshot.size,
+        ):
+            return True
+        return not self._linked_doc.saved
+
+    def refresh_linked_snapshot(self, force: bool = False) -> bool:
+        """
+        Takes a new snapshot of the linked document's properties. Skips the fetch if the \
+            linked document hasn't changed since the last snapshot.
+
+        Args:
+            force (bool, optional): Fetch the properties, even if the linked document \
+                hasn't changed. Defaults to False.
+
+        Returns:
+            bool: True if a new snapshot has been taken.
+        """
+        if self._linked_product is None:
+            return False
+        if not force and not self.linked_changed():
+            log.debug("Linked document unchanged, skipped snapshot refresh.")
+            return False
+        self._linked_snapshot = self._take_linked_snapshot()
+        return True
+
     def get_property_from_linked_doc(self, name: str | None) -> str | None:
         """
         Returns a properties' value from the linked document. Returns None if one of \
@@ -265,6 +628,9 @@ class DocumentLoader:
          - No properties available
          - The property does not exist
 
+        The value is served from the snapshot of the linked document, see \
+            `refresh_linked_snapshot`.
+
         Args:
             name (str): The name of the property. Returns the CATIA standard \
                 properties when the name is `partnumber`, `definition`, `revision`, \
@@ -277,21 +643,9 @@ class DocumentLoader:
         if name is None:
             return None
 
-        if self.linked_product is not None and self.linked_properties is not None:
-            if name == "partnumber":
-                return self.linked_product.part_number
-            elif name == "definition":
-                return self.linked_product.definition
-            elif name == "revision":
-                return self.linked_product.revision
-            elif name == "nomenclature":
-                return self.linked_product.nomenclature
-            elif name == "source":
-                return str(self.linked_product.source)
-            elif name == "description":
-                return self.linked_product.description_reference
-            elif self.linked_properties.exists(name):
-                return self.linked_properties.get_by_name(name).value
+        if self._linked_snapshot is not None:
+            if (value := self._linked_snapshot.get(name)) is not None:
+                return value
         log.warning(f"No property {name!r} found in linked document.")
         return None
 
@@ -310,7 +664,10 @@ class DocumentLoader:
             linked_drawing_path = self.linked_properties.get_by_name(
                 PROP_DRAWING_PATH
             ).value
-            if linked_drawing_path != document_path and tkmsg.askyesno(
+            # A symlinked path and the absolute path of the same drawing are equal.
+            if not get_env_index().is_same_path(
+                linked_drawing_path, document_path
+            ) and tkmsg.askyesno(
                 title=resource.settings.title,
                 message=(
                     "A drawing file already exists for the linked document at "
@@ -0,0 +1,148 @@
+"""
+    Persistent cache of the title block contents of drawings.
+
+    Each drawing gets a compact json entry in the cache folder, keyed by the drawing's path.
+    An entry is only valid as long as the drawing file has the modification time and size
+    it had when the entry was written, so lookups never return outdated values and never
+    need CATIA.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+from typing import Tuple
+
+from const import CACHE
+from models.cache_model import TitleBlockCacheModel
+from pytia.log import log
+
+
+class MetadataCache:
+    """Cache of the title block contents of drawings."""
+
+    def __init__(self, folder: str | Path = Path(CACHE, "title_blocks")) -> None:
+        """
+        Inits the cache.
+
+        Args:
+            folder (str | Path, optional): The folder of the cache entries. Defaults to \
+                the cache folder in the appdata folder.
+        """
+        self.folder = Path(folder)
+
+    def _entry_path(self, path: str | Path) -> Path:
+        key = hashlib.sha1(os.path.normcase(str(path)).encode("utf8")).hexdigest()
+        return Path(self.folder, f"{key}.json")
+
+    @staticmethod
+    def _stat(path: str | Path) -> Tuple[int, int] | None:
+        """Returns the modification time and the size of the file, None if it's missing."""
+        try:
+            stat = os.stat(path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def store(
+        self,
+        path: str | Path,
+        values: Dict[str, str | None],
+        linked_path: str | None = None,
+    ) -> TitleBlockCacheModel | None:
+        """
+        Stores the title block values of the drawing. The values must match the saved \
+            file, the entry is keyed by the current modification time and size of the file.
+
+        Args:
+            path (str | Path): The path of the drawing.
+            values (Dict[str, str | None]): The title block values, mapped by the keys of \
+                the title block items.
+            linked_path (str | None, optional): The path of the linked document. Defaults \
+                to None.
+
+        Returns:
+            TitleBlockCacheModel | None: The stored entry, None if the drawing file \
+                doesn't exist.
+        """
+        if (stat := self._stat(path)) is None:
+            log.debug(f"Not caching title block of {str(path)!r}: File not found.")
+            return None
+
+        entry = TitleBlockCacheModel(
+            path=str(path),
+            mtime_ns=stat[0],
+            size=stat[1],
+            values=dict(values),
+            linked_path=linked_path,
+            created=datetime.now().isoformat(timespec="seconds"),
+        )
+        entry_path = self._entry_path(path)
+        # Write to a temporary file first, so that concurrent readers (e.g. the worker
+        # processes of the batch mode) never see a half written entry.
+        temp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(temp_path, "w", encoding="utf8") as f:
+                json.dump(asdict(entry), f, separators=(",", ":"))
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            log.warning(f"Failed to cache title block of {str(path)!r}: {e}")
+            return None
+        log.info(f"Cached title block of {str(path)!r}.")
+        return entry
+
+    def lookup(self, path: str | Path) -> TitleBlockCacheModel | None:
+        """
+        Returns the cached title block of the drawing, without CATIA.
+
+        Args:
+            path (str | Path): The path of the drawing.
+
+        Returns:
+            TitleBlockCacheModel | None: The entry, None if there's no entry or if the \
+                drawing file has changed since the entry has been written.
+        """
+        entry_path = self._entry_path(path)
+        try:
+            with open(entry_path, "r", encoding="utf8") as f:
+                entry = TitleBlockCacheModel(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            log.warning(f"Dropping corrupted cache entry of {str(path)!r}: {e}")
+            self.invalidate(path)
+            return None
+
+        if self._stat(path) != (entry.mtime_ns, entry.size):
+            log.debug(f"Cache entry of {str(path)!r} is outdated.")
+            return None
+        return entry
+
+    def get(self, path: str | Path, key: str) -> str | None:
+        """
+        Returns a single cached title block value of the drawing.
+
+        Args:
+            path (str | Path): The path of the drawing.
+            key (str): The key of the title block item, e.g. `partnumber`.
+
+        Returns:
+            str | None: The value, None if it's not cached or empty.
+        """
+        if (entry := self.lookup(path)) is None:
+            return None
+        return entry.get(key)
+
+    def invalidate(self, path: str | Path) -> None:
+        """Removes the cache entry of the drawing."""
+        try:
+            os.remove(self._entry_path(path))
+        except FileNotFoundError:
+            pass
+
+
+metadata_cache = MetadataCache()
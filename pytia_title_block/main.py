@@ -7,6 +7,7 @@
 
 import atexit
 import os
+import sys
 
 from const import APP_VERSION
 from const import LOG
@@ -20,19 +21,18 @@ from resources import resource
 def main() -> None:
     """Application entry point."""
 
+    # The config files are read while the dependencies are checked, which only need the
+    # settings.
+    resource.prefetch()
+
     # For the apps auto-install-feature, all required dependencies must be
     # imported after they have been checked.
     # So: First check if all required dependencies are installed.
     # Afterwards import those modules which depend on third party modules.
     deps.install_dependencies()
 
-    from gui import GUI  # pylint: disable=C0415
     from pytia.log import log  # pylint: disable=C0415
 
-    with open(PID_FILE, "w") as f:
-        f.write(str(PID))
-    atexit.register(lambda: os.remove(PID_FILE))
-
     os.makedirs(LOGS, exist_ok=True)
     if resource.settings.debug:
         log.set_level_debug()
@@ -40,6 +40,22 @@ def main() -> None:
     log.add_file_handler(folder=LOGS, filename=LOG)
     log.info(f"Running PYTIA Title Block Editor {APP_VERSION}, PID={PID}")
 
+    if sys.argv[1:2] == ["batch"]:
+        from batch import run_batch_cli  # pylint: disable=C0415
+
+        sys.exit(run_batch_cli(sys.argv[2:]))
+
+    if sys.argv[1:2] == ["export"]:
+        from batch import run_export_cli  # pylint: disable=C0415
+
+        sys.exit(run_export_cli(sys.argv[2:]))
+
+    from gui import GUI  # pylint: disable=C0415
+
+    with open(PID_FILE, "w") as f:
+        f.write(str(PID))
+    atexit.register(lambda: os.remove(PID_FILE))
+
     gui = GUI()
     gui.run()
 
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from dataclasses import field
+from enum import Enum
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+class BatchStatus(str, Enum):
+    """The outcome of the batch run for a single drawing."""
+
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+    OUT_OF_SYNC = "out_of_sync"
+    SKIPPED = "skipped"
+    EXPORTED = "exported"
+    FAILED = "failed"
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class BatchResultModel:
+    """
+    The result of the batch run for a single drawing.
+
+    `changed` maps the component name of each written text to its old and new value. In a \
+        dry run it maps the component name of each text, that differs from the linked \
+        document, to the title block value and the linked document's value. `exported` \
+        is the number of dimensions written by the tolerance export.
+    """
+
+    path: str
+    status: BatchStatus
+    changed: Dict[str, Tuple[str | None, str]] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+    message: str | None = None
+    exported: int = 0
+    duration: float = 0.0
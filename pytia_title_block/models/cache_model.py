@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class TitleBlockCacheModel:
+    """
+    Cached title block of a drawing, valid as long as the drawing file has the given \
+        modification time and size.
+
+    `values` maps the keys of the title block items (`partnumber`, `revision`, ...) to \
+        their text, None if the text is empty or missing in the drawing.
+    """
+
+    path: str
+    mtime_ns: int
+    size: int
+    values: Dict[str, str | None]
+    linked_path: str | None
+    created: str
+
+    def get(self, key: str) -> str | None:
+        """Returns the value of the title block item with the given key."""
+        return self.values.get(key)
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class TitleBlockDiffModel:
+    """
+    A title block item, whose text differs from the property of the linked document.
+
+    `key` is the key of the title block item (`partnumber`, ...), `name` the component \
+        name of the drawing text. `title_block` is None if the text is empty.
+    """
+
+    key: str
+    name: str
+    title_block: str | None
+    linked: str
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class LinkedSnapshotModel:
+    """
+    Immutable snapshot of all properties of the linked document.
+
+    The standard properties are mapped by the names accepted by \
+        `DocumentLoader.get_property_from_linked_doc` (`partnumber`, `definition`, ...), \
+        the user defined properties are mapped by their property name.
+    """
+
+    path: str
+    mtime_ns: int | None
+    size: int | None
+
+    standard: Mapping[str, str]
+    user: Mapping[str, str]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "standard", MappingProxyType(dict(self.standard)))
+        object.__setattr__(self, "user", MappingProxyType(dict(self.user)))
+
+    def get(self, name: str) -> str | None:
+        """Returns the value of a standard or user defined property, or None."""
+        if name in self.standard:
+            return self.standard[name]
+        return self.user.get(name)
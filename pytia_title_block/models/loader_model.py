@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+if TYPE_CHECKING:
+    from models.linked_model import LinkedSnapshotModel
+    from pytia_ui_tools.handlers.workspace_handler import Workspace
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class LoadedDocumentModel:
+    """
+    The plain data of a loaded drawing, without any COM object. COM objects can't be \
+        shared between threads, the receiving thread acquires them again, see \
+        `DocumentLoader`.
+
+    `text_locations` maps the component name of each title block text to the index of its \
+        view and its index within the texts of the view (both 1-based).
+    """
+
+    path: str
+    missing_items: List[str]
+    text_values: Dict[str, str]
+    text_locations: Dict[str, Tuple[int, int]]
+    linked_snapshot: LinkedSnapshotModel | None
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class LoadingResultModel:
+    """The result of the document loading, handed from the worker to the UI thread."""
+
+    document: LoadedDocumentModel
+    workspace: Workspace
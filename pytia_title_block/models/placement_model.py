@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class BoxModel:
+    """An axis aligned bounding box on the sheet, in mm."""
+
+    x_min: float
+    x_max: float
+    y_min: float
+    y_max: float
+
+    def intersects(self, other: "BoxModel", margin: float = 0) -> bool:
+        """Returns True if the boxes overlap or are closer than the margin."""
+        return (
+            self.x_min < other.x_max + margin
+            and other.x_min < self.x_max + margin
+            and self.y_min < other.y_max + margin
+            and other.y_min < self.y_max + margin
+        )
+
+    def contains(self, other: "BoxModel") -> bool:
+        """Returns True if the other box lies within this box."""
+        return (
+            self.x_min <= other.x_min
+            and other.x_max <= self.x_max
+            and self.y_min <= other.y_min
+            and other.y_max <= self.y_max
+        )
+
+    def moved(self, dx: float, dy: float) -> "BoxModel":
+        """Returns the box moved by the given offset."""
+        return BoxModel(
+            x_min=self.x_min + dx,
+            x_max=self.x_max + dx,
+            y_min=self.y_min + dy,
+            y_max=self.y_max + dy,
+        )
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class TextWriteSummaryModel:
+    """
+    Summary of a batched text write.
+
+    `changed` maps the component name of each written text to its old and new value.
+    """
+
+    changed: Dict[str, Tuple[str | None, str]] = field(default_factory=dict)
+    unchanged: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """Returns True if at least one text has been written."""
+        return bool(self.changed)
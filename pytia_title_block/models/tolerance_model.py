@@ -6,6 +6,7 @@ class ToleranceTableModel:
     base: str
     min: str
     max: str
+    count: int = 1
 
 
 @dataclass(kw_only=True, slots=True, frozen=True)
@@ -21,3 +22,34 @@ class ToleranceModel:
     tol_up_d: float
     tol_low_d: float
     tol_display: int
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ColumnFormatModel:
+    """The format of all cells of a table column, None keeps the default of the cell."""
+
+    font_size: float | None = None
+    alignment: int | None = None
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class GeneralToleranceModel:
+    """A general tolerance class of ISO 2768, e.g. `ISO 2768 1-m 2-K`."""
+
+    name: str
+    linear: str | None
+    geometric: str | None
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class TableBlockModel:
+    """
+    A block of table rows, see `table_layout`. `first` is the index of the first row of \
+        the block (without the header), `x` and `y` are the top left corner of the table.
+    """
+
+    index: int
+    first: int
+    rows: int
+    x: float
+    y: float
@@ -9,17 +9,22 @@ import atexit
 import importlib.resources
 import json
 import os
+import threading
 import tkinter.messagebox as tkmsg
 from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import fields
 from pathlib import Path
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from const import APP_VERSION
 from const import APPDATA
+from const import CACHE
 from const import CONFIG_APPDATA
 from const import CONFIG_INFOS
 from const import CONFIG_INFOS_DEFAULT
@@ -29,8 +34,19 @@ from const import CONFIG_SETTINGS
 from const import CONFIG_TB_ITEMS
 from const import CONFIG_TB_ITEMS_DEFAULT
 from const import CONFIG_USERS
+from const import CONFIG_USERS_CACHE
+from const import CONFIG_USERS_INDEX
 from const import LOGON
 from const import STYLES
+from resources import bundle
+from resources.user_directory import STORAGE_MEMORY
+from resources.user_directory import STORAGE_SQLITE
+from resources.user_directory import STORAGES
+from resources.user_directory import CachedUserDirectory
+from resources.user_directory import SqliteUserDirectory
+from resources.user_directory import UserDirectory
+from resources.user_sources import SOURCES as USER_SOURCES
+from resources.user_sources import get_source
 from resources.utils import expand_env_vars
 
 
@@ -50,6 +66,7 @@ class SettingsTablesTolerancesPositions:
     size: str
     x: int
     y: int
+    max_height: float | None = None
 
 
 @dataclass(slots=True, kw_only=True)
@@ -58,6 +75,11 @@ class SettingsTablesTolerances:
     header_min: str
     header_max: str
     positions: List[SettingsTablesTolerancesPositions]
+    group: bool = False
+    show_count: bool = False
+    local_limits: bool = False
+    general: bool = False
+    avoid_collisions: bool = False
 
     def __post_init__(self) -> None:
         self.positions = [SettingsTablesTolerancesPositions(**i) for i in self.positions]  # type: ignore
@@ -106,6 +128,32 @@ class SettingsMails:
     admin: str
 
 
+@dataclass(slots=True, kw_only=True, frozen=True)
+class SettingsUsers:
+    """Dataclass for the user directory (settings.json)."""
+
+    storage: str = STORAGE_MEMORY
+    case_sensitive: bool = True
+    source: str | None = None
+    path: str | None = None
+    attributes: Dict[str, str] = field(default_factory=dict)
+    ttl: int = 3600
+
+    def __post_init__(self) -> None:
+        if self.storage not in STORAGES:
+            raise ValueError(
+                f"Unknown user storage {self.storage!r}, use one of {STORAGES}."
+            )
+        if self.source is not None:
+            if self.source not in USER_SOURCES:
+                raise ValueError(
+                    f"Unknown user source {self.source!r}, "
+                    f"use one of {tuple(USER_SOURCES)}."
+                )
+            if not self.path:
+                raise ValueError(f"The user source {self.source!r} requires a path.")
+
+
 @dataclass(slots=True, kw_only=True)
 class Settings:  # pylint: disable=R0902
     """Dataclass for settings (settings.json)."""
@@ -120,6 +168,7 @@ class Settings:  # pylint: disable=R0902
     files: SettingsFiles
     urls: SettingsUrls
     mails: SettingsMails
+    users: SettingsUsers = field(default_factory=SettingsUsers)
 
     def __post_init__(self) -> None:
         self.restrictions = SettingsRestrictions(**dict(self.restrictions))  # type: ignore
@@ -128,6 +177,8 @@ class Settings:  # pylint: disable=R0902
         self.paths = SettingsPaths(**dict(self.paths))  # type: ignore
         self.urls = SettingsUrls(**dict(self.urls))  # type: ignore
         self.mails = SettingsMails(**dict(self.mails))  # type: ignore
+        if isinstance(self.users, dict):
+            self.users = SettingsUsers(**self.users)
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -201,6 +252,12 @@ class User:
         return [getattr(self, f.name) for f in fields(self)]
 
 
+def read_users() -> List[User]:
+    """Reads the users json from the resources folder."""
+    with importlib.resources.open_binary("resources", CONFIG_USERS) as f:
+        return [User(**i) for i in json.load(f)]
+
+
 @dataclass(slots=True, kw_only=True, frozen=True)
 class Info:
     """Dataclass for an info messages (information.json)."""
@@ -226,73 +283,195 @@ class AppData:
 
 
 class Resources:  # pylint: disable=R0902
-    """Class for handling resource files."""
+    """
+    Class for handling resource files.
+
+    Each section (settings, users, ...) is read on its first access and kept afterwards, \
+        importing this module reads nothing. The sections of the config files are loaded \
+        from the compiled bundle if it's up to date, see `resources.bundle`. Use \
+        `prefetch` to load sections in the background, before they are needed.
+    """
 
     __slots__ = (
-        "_settings",
-        "_title_block_items",
-        "_props",
-        "_users",
-        "_infos",
-        "_appdata",
+        "_sections",
+        "_lock",
+        "_stamp",
+        "_bundle_checked",
+        "_environment",
+    )
+
+    # The sections of the compiled bundle, plain config data only. The appdata isn't part
+    # of it: It's a local file already, and it changes with every start of the app. Neither
+    # is the user directory: It's built from the bundled `user_records`, its storages hold
+    # connections and threads.
+    BUNDLED = ("settings", "title_block_items", "props", "user_records", "infos")
+    SOURCES = (
+        CONFIG_SETTINGS,
+        CONFIG_TB_ITEMS,
+        CONFIG_TB_ITEMS_DEFAULT,
+        CONFIG_PROPS,
+        CONFIG_PROPS_DEFAULT,
+        CONFIG_USERS,
+        CONFIG_INFOS,
+        CONFIG_INFOS_DEFAULT,
     )
 
     def __init__(self) -> None:
-        self._read_settings()
-        self._read_title_block_items()
-        self._read_props()
-        self._read_users()
-        self._read_infos()
-        self._read_appdata()
+        self._sections: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._stamp: bundle.Stamp | None = None
+        self._bundle_checked = False
+        self._environment: Dict[str, str | None] = {}
 
         atexit.register(self._write_appdata)
 
+    def _get(self, name: str) -> Any:
+        """Returns the section, reads it on the first access."""
+        if (value := self._sections.get(name)) is not None:
+            return value
+
+        with self._lock:
+            if name in self.BUNDLED and not self._bundle_checked:
+                self._bundle_checked = True
+                self._stamp = bundle.get_stamp(
+                    __loader__, Path(__file__).parent, self.SOURCES
+                )
+                if (sections := bundle.load(self._stamp)) is not None:
+                    self._sections.update(sections)
+
+            if name not in self._sections:
+                self._sections[name] = getattr(self, f"_read_{name}")()
+                # Compile the bundle as soon as all of its sections have been read.
+                if name in self.BUNDLED and all(
+                    n in self._sections for n in self.BUNDLED
+                ):
+                    assert self._stamp is not None
+                    bundle.store(
+                        self._stamp,
+                        {n: self._sections[n] for n in self.BUNDLED},
+                        self._environment,
+                    )
+            return self._sections[name]
+
+    def prefetch(self, *names: str) -> threading.Thread:
+        """
+        Loads the sections in a background thread.
+
+        Args:
+            *names (str): The names of the sections, e.g. `users`. Defaults to the \
+                sections of the config files and the user directory. The appdata isn't \
+                prefetched by default, it may have to show a message.
+
+        Returns:
+            threading.Thread: The thread, already started.
+        """
+        names = names or (*self.BUNDLED, "user_directory")
+
+        def load() -> None:
+            for name in names:
+                try:
+                    self._get(name)
+                except Exception:  # pylint: disable=W0718
+                    # Errors are raised again, when the section is accessed.
+                    return
+
+        thread = threading.Thread(target=load, name="resources", daemon=True)
+        thread.start()
+        return thread
+
     @property
     def settings(self) -> Settings:
         """settings.json"""
-        return self._settings
+        return self._get("settings")
 
     @property
     def props(self) -> Props:
         """properties.json"""
-        return self._props
+        return self._get("props")
 
     @property
     def title_block_items(self) -> TitleBlockItems:
         """title_block_items.json"""
-        return self._title_block_items
+        return self._get("title_block_items")
 
     @property
     def users(self) -> List[User]:
         """users.json"""
-        return self._users
+        return list(self.user_directory)
+
+    @property
+    def user_directory(self) -> UserDirectory | SqliteUserDirectory:
+        """The users of the users.json or the external source, indexed by logon, name \
+            and id."""
+        return self._get("user_directory")
 
     @property
     def infos(self) -> List[Info]:
         """infos.json"""
-        return self._infos
+        return self._get("infos")
 
     @property
     def appdata(self) -> AppData:
         """Property for the appdata config file."""
-        return self._appdata
+        return self._get("appdata")
 
     def get_png(self, name: str) -> bytes:
         """Returns a png resource by its name."""
         with importlib.resources.open_binary("resources", name) as f:
             return f.read()
 
-    def _read_settings(self) -> None:
+    def _read_settings(self) -> Settings:
         """Reads the settings json from the resources folder."""
         with importlib.resources.open_binary("resources", CONFIG_SETTINGS) as f:
-            self._settings = Settings(**json.load(f))
+            text = f.read().decode("utf8")
+        # Expanded environment variables invalidate the bundle when they change.
+        self._environment = bundle.get_environment(text)
+        return Settings(**json.loads(text))
+
+    def _read_user_directory(self) -> UserDirectory | SqliteUserDirectory:
+        """Builds the user directory of the users json or the external source, see \
+            `SettingsUsers`."""
+        settings = self.settings.users
+        if settings.source is not None:
+            # The export is read in the background or if there's no cache yet, lookups
+            # are served from the local cache even if the share is offline.
+            return CachedUserDirectory(
+                Path(CACHE, CONFIG_USERS_CACHE),
+                source=get_source(
+                    settings.source,
+                    expand_env_vars(str(settings.path)),
+                    settings.attributes,
+                ),
+                user_type=User,
+                ttl=settings.ttl,
+                fallback=read_users,
+                case_sensitive=settings.case_sensitive,
+            )
+        if settings.storage == STORAGE_SQLITE:
+            # Only the stamp of the users json is read, the users are read only if the
+            # SQLite file has to be rebuilt.
+            return SqliteUserDirectory(
+                Path(CACHE, CONFIG_USERS_INDEX),
+                stamp=bundle.get_stamp(
+                    __loader__, Path(__file__).parent, [CONFIG_USERS]
+                ),
+                source=read_users,
+                user_type=User,
+                case_sensitive=settings.case_sensitive,
+            )
+        return UserDirectory(
+            self._get("user_records"), case_sensitive=settings.case_sensitive
+        )
 
-    def _read_users(self) -> None:
-        """Reads the users json from the resources folder."""
-        with importlib.resources.open_binary("resources", CONFIG_USERS) as f:
-            self._users = [User(**i) for i in json.load(f)]
+    def _read_user_records(self) -> Tuple[User, ...] | None:
+        """Reads the users json, if the users are kept in memory. None if the users are \
+            stored in SQLite or read from an external source, see `SettingsUsers`."""
+        settings = self.settings.users
+        if settings.source is not None or settings.storage == STORAGE_SQLITE:
+            return None
+        return tuple(read_users())
 
-    def _read_title_block_items(self) -> None:
+    def _read_title_block_items(self) -> TitleBlockItems:
         """Reads the title block items json from the resources folder."""
         tbi_resource = (
             CONFIG_TB_ITEMS
@@ -300,9 +479,9 @@ class Resources:  # pylint: disable=R0902
             else CONFIG_TB_ITEMS_DEFAULT
         )
         with importlib.resources.open_binary("resources", tbi_resource) as f:
-            self._title_block_items = TitleBlockItems(**json.load(f))
+            return TitleBlockItems(**json.load(f))
 
-    def _read_props(self) -> None:
+    def _read_props(self) -> Props:
         """Reads the props json from the resources folder."""
         props_resource = (
             CONFIG_PROPS
@@ -310,9 +489,9 @@ class Resources:  # pylint: disable=R0902
             else CONFIG_PROPS_DEFAULT
         )
         with importlib.resources.open_binary("resources", props_resource) as f:
-            self._props = Props(**json.load(f))
+            return Props(**json.load(f))
 
-    def _read_infos(self) -> None:
+    def _read_infos(self) -> List[Info]:
         """Reads the information json from the resources folder."""
         infos_resource = (
             CONFIG_INFOS
@@ -320,9 +499,9 @@ class Resources:  # pylint: disable=R0902
             else CONFIG_INFOS_DEFAULT
         )
         with importlib.resources.open_binary("resources", infos_resource) as f:
-            self._infos = [Info(**i) for i in json.load(f)]
+            return [Info(**i) for i in json.load(f)]
 
-    def _read_appdata(self) -> None:
+    def _read_appdata(self) -> AppData:
         """Reads the json config file from the appdata folder."""
         if os.path.exists(appdata_file := f"{APPDATA}\\{CONFIG_APPDATA}"):
             with open(appdata_file, "r", encoding="utf8") as f:
@@ -335,15 +514,16 @@ class Resources:  # pylint: disable=R0902
                         message="The AppData config file has been corrupted. \
                             You may need to apply your preferences again.",
                     )
-                self._appdata = value
-        else:
-            self._appdata = AppData()
+                return value
+        return AppData()
 
     def _write_appdata(self) -> None:
-        """Saves appdata config to file."""
+        """Saves appdata config to file, if it has been read."""
+        if (appdata := self._sections.get("appdata")) is None:
+            return
         os.makedirs(APPDATA, exist_ok=True)
         with open(f"{APPDATA}\\{CONFIG_APPDATA}", "w", encoding="utf8") as f:
-            json.dump(asdict(self._appdata), f)
+            json.dump(asdict(appdata), f)
 
     def get_user_by_logon(self, logon: Optional[str] = None) -> Optional[User]:
         """
@@ -359,11 +539,7 @@ class Resources:  # pylint: disable=R0902
         """
         if logon is None:
             logon = LOGON
-
-        for index, value in enumerate(self._users):
-            if value.logon == logon:
-                return self._users[index]
-        return None
+        return self.user_directory.get_by_logon(logon)
 
     def get_user_by_name(self, name: str) -> Optional[User]:
         """
@@ -375,10 +551,7 @@ class Resources:  # pylint: disable=R0902
         Returns:
             User: The user from the dataclass list that matches the provided name.
         """
-        for index, value in enumerate(self._users):
-            if value.name == name:
-                return self._users[index]
-        return None
+        return self.user_directory.get_by_name(name)
 
     def logon_exists(self, logon: Optional[str] = None) -> bool:
         """
@@ -393,11 +566,7 @@ class Resources:  # pylint: disable=R0902
         """
         if logon is None:
             logon = LOGON
-
-        for user in self._users:
-            if user.logon == logon:
-                return True
-        return False
+        return logon in self.user_directory
 
     def get_info_msg_by_counter(self) -> List[str]:
         """
@@ -407,9 +576,9 @@ class Resources:  # pylint: disable=R0902
             List[str]: A list of all messages that should be shown at the counter value.
         """
         values = []
-        for index, value in enumerate(self._infos):
-            if value.counter == self._appdata.counter:
-                values.append(self._infos[index].msg)
+        for index, value in enumerate(self.infos):
+            if value.counter == self.appdata.counter:
+                values.append(self.infos[index].msg)
         return values
 
 
@@ -0,0 +1,144 @@
+"""
+    Compiled bundle of the resource files.
+
+    The config files of the resources folder are read, parsed and validated once, the
+    resulting dataclasses are stored as a single pickle file in the local appdata folder.
+    Following starts of the app load all sections with a single local read, instead of
+    reading each config file from the (possibly remote) app.
+
+    The bundle is keyed by a stamp of its sources: The modification time and size of the
+    app archive (when running from a pyz) or of each config file, the app version and the
+    python version. Environment variables, which are expanded in the config files, are
+    stored with the bundle and compared as well. A stale or unreadable bundle is ignored
+    and rebuilt.
+
+    Important: Do not import third party modules here. This module
+    must work on its own without any other dependencies!
+"""
+
+import os
+import pickle
+import sys
+import zipimport
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Tuple
+
+from const import APP_VERSION
+from const import CACHE
+from const import CONFIG_BUNDLE
+from resources.env_index import ENV_VAR_PATTERN
+
+BUNDLE_VERSION = 1
+BUNDLE_FILE = Path(CACHE, CONFIG_BUNDLE)
+
+Stamp = Tuple[Any, ...]
+
+# Errors of reading or writing a missing, corrupted or unpicklable bundle. Other errors are
+# programming errors and are raised.
+BUNDLE_ERRORS = (OSError, EOFError, pickle.PickleError, TypeError, AttributeError)
+
+
+def _stat(path: str | Path) -> Tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+def get_stamp(loader: Any, folder: str | Path, names: Iterable[str]) -> Stamp:
+    """
+    Returns the stamp of the resource files.
+
+    Args:
+        loader (Any): The loader of the resources package. If it's a zipimporter, the \
+            stamp of the archive stands for all files.
+        folder (str | Path): The folder of the resources package.
+        names (Iterable[str]): The names of all config files, that may be read. Files \
+            that don't exist are part of the stamp as well.
+
+    Returns:
+        Stamp: The stamp.
+    """
+    if isinstance(loader, zipimport.zipimporter):
+        sources: Tuple[Any, ...] = (loader.archive, _stat(loader.archive))
+    else:
+        sources = tuple((name, _stat(Path(folder, name))) for name in names)
+    return (BUNDLE_VERSION, APP_VERSION, sys.version_info[:2], sources)
+
+
+def get_environment(text: str) -> Dict[str, str | None]:
+    """Returns the values of the environment variables referenced in the text."""
+    return {key: os.environ.get(key) for key in ENV_VAR_PATTERN.findall(text)}
+
+
+def load(stamp: Stamp, path: str | Path | None = None) -> Dict[str, Any] | None:
+    """
+    Loads the sections of the bundle.
+
+    Args:
+        stamp (Stamp): The current stamp of the sources, see `get_stamp`.
+        path (str | Path | None, optional): The path of the bundle. Defaults to \
+            `BUNDLE_FILE`.
+
+    Returns:
+        Dict[str, Any] | None: The sections, mapped by their name. None if there's no \
+            bundle, if it's stale or can't be read.
+    """
+    try:
+        with open(path or BUNDLE_FILE, "rb") as f:
+            bundle = pickle.load(f)
+        if bundle["stamp"] != stamp:
+            return None
+        if any(os.environ.get(k) != v for k, v in bundle["environment"].items()):
+            return None
+        return bundle["sections"]
+    except (*BUNDLE_ERRORS, ImportError):
+        # Missing, corrupted or written by an incompatible version (whose classes or
+        # modules don't exist anymore): Rebuild it.
+        return None
+
+
+def store(
+    stamp: Stamp,
+    sections: Dict[str, Any],
+    environment: Dict[str, str | None],
+    path: str | Path | None = None,
+) -> bool:
+    """
+    Stores the sections as bundle. The file is replaced atomically, concurrent instances \
+        of the app never read a partially written bundle.
+
+    Args:
+        stamp (Stamp): The stamp of the sources, see `get_stamp`.
+        sections (Dict[str, Any]): The sections, mapped by their name.
+        environment (Dict[str, str | None]): The environment variables the sections \
+            depend on, see `get_environment`.
+        path (str | Path | None, optional): The path of the bundle. Defaults to \
+            `BUNDLE_FILE`.
+
+    Returns:
+        bool: True if the bundle has been written.
+    """
+    path = Path(path or BUNDLE_FILE)
+    temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        os.makedirs(path.parent, exist_ok=True)
+        with open(temp, "wb") as f:
+            pickle.dump(
+                {"stamp": stamp, "environment": environment, "sections": sections},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp, path)
+        return True
+    except BUNDLE_ERRORS:
+        # The bundle is an optimization only, the app works without it. Unpicklable
+        # sections raise TypeError or AttributeError as well.
+        with suppress(OSError):
+            temp.unlink(missing_ok=True)
+        return False
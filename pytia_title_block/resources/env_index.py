@@ -0,0 +1,168 @@
+"""
+    Reverse index of the environment variables, that hold a directory.
+
+    Maps the normalized directories of the environment variables to their names, e.g.
+    `c:\\users\\...\\onedrive` to `ONEDRIVE`. The directories are stored in a trie of their
+    path components, a lookup walks the components of a path once and returns the variable
+    of its longest matching parent. Paths are compared like windows does: case insensitive,
+    with `/` and `\\` as separators and without trailing separators.
+
+    The index is built once per session, see `get_env_index`, and is used both ways: To
+    replace the parent of a path with its variable (`%ONEDRIVE%\\foo\\bar`) and to resolve
+    such a path back to the absolute path.
+
+    Important: Do not import third party modules here. This module
+    must work on its own without any other dependencies!
+"""
+
+from __future__ import annotations
+
+import ntpath
+import os
+import re
+from functools import lru_cache
+from pathlib import PurePath
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Tuple
+
+ENV_VAR_PATTERN = re.compile(r"\%(.*?)\%")
+
+# Key of the variable name in a node of the trie, path components are never empty.
+_NAME = ""
+
+
+def split_path(path: str | PurePath) -> Tuple[str, List[str]]:
+    """
+    Splits the path into its drive and its components, like windows does.
+
+    Returns:
+        Tuple[str, List[str]]: The drive (e.g. `C:` or `\\\\server\\share`) and the \
+            components of the path, both with their original case.
+    """
+    drive, rest = ntpath.splitdrive(ntpath.normpath(str(path)))
+    return drive, [part for part in rest.split("\\") if part]
+
+
+class EnvIndex:
+    """Reverse index of the environment variables, that hold an absolute directory."""
+
+    __slots__ = ("_root", "_variables")
+
+    def __init__(self, environ: Mapping[str, str] | None = None) -> None:
+        """
+        Builds the index.
+
+        Args:
+            environ (Mapping[str, str] | None, optional): The environment variables. \
+                Defaults to `os.environ`. If multiple variables hold the same directory, \
+                the first one wins.
+        """
+        environ = os.environ if environ is None else environ
+        self._root: Dict[str, Any] = {}
+        self._variables: Dict[str, str] = {}
+
+        for name, value in environ.items():
+            self._variables.setdefault(name.upper(), value)
+            # Lists like the PATH and drive letters (e.g. HOMEDRIVE) are no symlinks,
+            # network shares are.
+            if ";" in value or not ntpath.isabs(value):
+                continue
+            drive, parts = split_path(value)
+            if not drive or (not parts and not drive.startswith("\\\\")):
+                continue
+            node = self._root
+            for part in (drive, *parts):
+                node = node.setdefault(ntpath.normcase(part), {})
+            node.setdefault(_NAME, name)
+
+    def find(self, path: str | PurePath) -> Tuple[str, int] | None:
+        """
+        Returns the variable of the deepest parent of the path.
+
+        Args:
+            path (str | PurePath): The absolute path, e.g. of a file.
+
+        Returns:
+            Tuple[str, int] | None: The name of the variable and the number of components \
+                of the path below the variable's directory. None if no parent of the path \
+                is held by a variable.
+        """
+        drive, parts = split_path(path)
+        node = self._root.get(ntpath.normcase(drive))
+        found: Tuple[str, int] | None = None
+        if node is not None and _NAME in node and parts:
+            # A network share, e.g. `\\\\server\\share`.
+            found = node[_NAME], len(parts)
+        # The path itself isn't checked, only its parents.
+        for index, part in enumerate(parts[:-1]):
+            if node is None:
+                break
+            node = node.get(ntpath.normcase(part))
+            if node is not None and _NAME in node:
+                found = node[_NAME], len(parts) - index - 1
+        return found
+
+    def symlink(self, path: str | PurePath) -> Tuple[str, str, str] | None:
+        """
+        Replaces the deepest parent of the path with its environment variable.
+
+        E.g.: Replaces `C:\\Users\\...\\OneDrive\\foo\\bar` with `%ONEDRIVE%\\foo\\bar`
+
+        Args:
+            path (str | PurePath): The absolute path.
+
+        Returns:
+            Tuple[str, str, str] | None: The name of the variable, the parent it replaces \
+                and the symlinked path. None if no parent of the path is held by a \
+                variable.
+        """
+        if (found := self.find(path)) is None:
+            return None
+        name, depth = found
+        drive, parts = split_path(path)
+        parent = drive + "".join(f"\\{part}" for part in parts[:-depth])
+        return name, parent, ntpath.join(f"%{name}%", *parts[-depth:])
+
+    def get(self, name: str) -> str | None:
+        """Returns the value of the variable, the name is case insensitive."""
+        return self._variables.get(name.upper())
+
+    def expand(self, value: str) -> str:
+        """
+        Expands the environment variables in the value.
+
+        E.g.: Expands `%ONEDRIVE%\\foo\\bar` to `C:\\Users\\...\\OneDrive\\foo\\bar`
+
+        Raises:
+            KeyError: A variable isn't set.
+        """
+
+        def replace(match: re.Match) -> str:
+            if (result := self.get(match.group(1))) is None:
+                raise KeyError(match.group(1))
+            return result
+
+        return ENV_VAR_PATTERN.sub(replace, value)
+
+    def is_same_path(self, a: str | PurePath, b: str | PurePath) -> bool:
+        """Returns True if both paths point to the same file once their variables are \
+            expanded. Unknown variables are kept as they are."""
+
+        def normalize(path: str | PurePath) -> str:
+            try:
+                path = self.expand(str(path))
+            except KeyError:
+                path = str(path)
+            return ntpath.normcase(ntpath.normpath(path))
+
+        return normalize(a) == normalize(b)
+
+
+@lru_cache(maxsize=None)
+def get_env_index() -> EnvIndex:
+    """Returns the index of the environment variables of this session, it's built on \
+        the first call. Use `get_env_index.cache_clear()` to rebuild it."""
+    return EnvIndex()
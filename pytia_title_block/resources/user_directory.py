@@ -0,0 +1,449 @@
+"""
+    Indexed directory of the users.
+
+    The users are indexed by their logon, name and id, a lookup is a hash lookup instead of
+    a scan over all users. Matching is case sensitive by default, case insensitive
+    directories match the casefolded values.
+
+    Two storages are available:
+
+    - `UserDirectory` holds all users in memory.
+    - `SqliteUserDirectory` holds the users in an indexed SQLite file in the local cache
+      folder. The file is built from the source once and rebuilt when the source changes,
+      following starts don't parse the users at all. Meant for exports of the corporate
+      directory with tens of thousands of users.
+    - `CachedUserDirectory` holds the users of an external source (see `user_sources`) in
+      a local SQLite file, which is refreshed incrementally after a TTL.
+
+    Important: Do not import third party modules here. This module
+    must work on its own without any other dependencies!
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from typing import Type
+
+from resources.user_sources import READ_ERRORS
+
+if TYPE_CHECKING:
+    from resources import User
+    from resources.user_sources import UserSource
+
+STORAGE_MEMORY = "memory"
+STORAGE_SQLITE = "sqlite"
+STORAGES = (STORAGE_MEMORY, STORAGE_SQLITE)
+
+SCHEMA_VERSION = 1
+KEYS = ("logon", "name", "id")
+
+INSERT_USERS = (
+    "INSERT INTO users (logon, id, name, mail, logon_key, name_key, id_key) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _key(value: str, case_sensitive: bool) -> str:
+    return value if case_sensitive else value.casefold()
+
+
+class UserDirectory:
+    """In-memory directory of the users."""
+
+    __slots__ = ("case_sensitive", "_users", "_indexes")
+
+    def __init__(self, users: Iterable[User], case_sensitive: bool = True) -> None:
+        """
+        Builds the indexes.
+
+        Args:
+            users (Iterable[User]): The users.
+            case_sensitive (bool, optional): Match the logon, name and id case \
+                sensitive. Defaults to True.
+        """
+        self.case_sensitive = case_sensitive
+        self._users: List[User] = list(users)
+        self._indexes: Dict[str, Dict[str, User]] = {key: {} for key in KEYS}
+        # The first user wins, like the scan over the list did.
+        for user in reversed(self._users):
+            for key in KEYS:
+                self._indexes[key][_key(getattr(user, key), case_sensitive)] = user
+
+    def _get(self, key: str, value: str | None) -> User | None:
+        if value is None:
+            return None
+        return self._indexes[key].get(_key(value, self.case_sensitive))
+
+    def get_by_logon(self, logon: str | None) -> User | None:
+        """Returns the user with the logon, None if there's none."""
+        return self._get("logon", logon)
+
+    def get_by_name(self, name: str | None) -> User | None:
+        """Returns the user with the name, None if there's none."""
+        return self._get("name", name)
+
+    def get_by_id(self, user_id: str | None) -> User | None:
+        """Returns the user with the id, None if there's none."""
+        return self._get("id", user_id)
+
+    def __contains__(self, logon: object) -> bool:
+        return isinstance(logon, str) and self.get_by_logon(logon) is not None
+
+    def __iter__(self) -> Iterator[User]:
+        return iter(self._users)
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+
+class SqliteUserDirectory:
+    """
+    Directory of the users in an indexed SQLite file.
+
+    The file is opened on the first lookup. If it's missing or has been built from another \
+        version of the source, it's rebuilt from the source. Instances can be pickled, \
+        the source must be a module level function then.
+    """
+
+    __slots__ = (
+        "path",
+        "stamp",
+        "source",
+        "user_type",
+        "case_sensitive",
+        "_connection",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        path: str | Path,
+        stamp: Any,
+        source: Callable[[], Iterable[User]],
+        user_type: Type[User],
+        case_sensitive: bool = True,
+    ) -> None:
+        """
+        Inits the directory.
+
+        Args:
+            path (str | Path): The path of the SQLite file.
+            stamp (Any): The stamp of the source, e.g. its modification time and size. \
+                The file is rebuilt if it doesn't match.
+            source (Callable[[], Iterable[User]]): Returns the users of the source.
+            user_type (Type[User]): The class of the users returned by lookups.
+            case_sensitive (bool, optional): Match the logon, name and id case \
+                sensitive. Defaults to True.
+        """
+        self.path = Path(path)
+        self.stamp = repr(stamp)
+        self.source = source
+        self.user_type = user_type
+        self.case_sensitive = case_sensitive
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return self.path, self.stamp, self.source, self.user_type, self.case_sensitive
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        self.path, self.stamp, self.source, self.user_type, self.case_sensitive = state
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _is_valid(self, connection: sqlite3.Connection) -> bool:
+        try:
+            row = connection.execute(
+                "SELECT schema, stamp, case_sensitive FROM meta"
+            ).fetchone()
+        except sqlite3.DatabaseError:
+            return False
+        return row == (SCHEMA_VERSION, self.stamp, int(self.case_sensitive))
+
+    def _rows(self, users: Iterable[User]) -> Iterator[Tuple[str, ...]]:
+        """Yields the rows of the users table, without the position."""
+        for user in users:
+            yield (
+                user.logon,
+                user.id,
+                user.name,
+                user.mail,
+                *(_key(getattr(user, k), self.case_sensitive) for k in KEYS),
+            )
+
+    def _replace(self, fill: Callable[[sqlite3.Connection], None]) -> None:
+        """Creates a new file, fills it and replaces the current file atomically."""
+        temp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        os.makedirs(self.path.parent, exist_ok=True)
+        if temp.exists():
+            temp.unlink()
+
+        connection = sqlite3.connect(temp)
+        try:
+            connection.executescript(
+                """
+                CREATE TABLE users (
+                    position INTEGER PRIMARY KEY,
+                    logon TEXT, id TEXT, name TEXT, mail TEXT,
+                    logon_key TEXT, name_key TEXT, id_key TEXT
+                );
+                CREATE TABLE meta (schema INTEGER, stamp TEXT, case_sensitive INTEGER);
+                """
+            )
+            fill(connection)
+            for key in KEYS:
+                connection.execute(
+                    f"CREATE INDEX users_{key} ON users ({key}_key, position)"
+                )
+            connection.execute(
+                "INSERT INTO meta VALUES (?, ?, ?)",
+                (SCHEMA_VERSION, self.stamp, int(self.case_sensitive)),
+            )
+            connection.commit()
+        finally:
+            connection.close()
+        os.replace(temp, self.path)
+
+    def build(self) -> None:
+        """Builds the file from the source. The file is replaced atomically."""
+        self._replace(
+            lambda connection: connection.executemany(
+                INSERT_USERS, self._rows(self.source())
+            )
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            with self._lock:
+                if self._connection is None:
+                    connection = sqlite3.connect(self.path, check_same_thread=False)
+                    if not self._is_valid(connection):
+                        connection.close()
+                        self.build()
+                        connection = sqlite3.connect(self.path, check_same_thread=False)
+                    self._connection = connection
+        return self._connection
+
+    def _to_user(self, row: Tuple[str, ...]) -> User:
+        return self.user_type(logon=row[0], id=row[1], name=row[2], mail=row[3])
+
+    def _get(self, key: str, value: str | None) -> User | None:
+        if value is None:
+            return None
+        connection = self._connect()
+        with self._lock:
+            row = connection.execute(
+                f"SELECT logon, id, name, mail FROM users WHERE {key}_key = ? "
+                "ORDER BY position LIMIT 1",
+                (_key(value, self.case_sensitive),),
+            ).fetchone()
+        return self._to_user(row) if row else None
+
+    def get_by_logon(self, logon: str | None) -> User | None:
+        """Returns the user with the logon, None if there's none."""
+        return self._get("logon", logon)
+
+    def get_by_name(self, name: str | None) -> User | None:
+        """Returns the user with the name, None if there's none."""
+        return self._get("name", name)
+
+    def get_by_id(self, user_id: str | None) -> User | None:
+        """Returns the user with the id, None if there's none."""
+        return self._get("id", user_id)
+
+    def __contains__(self, logon: object) -> bool:
+        return isinstance(logon, str) and self.get_by_logon(logon) is not None
+
+    def __iter__(self) -> Iterator[User]:
+        connection = self._connect()
+        with self._lock:
+            rows = connection.execute(
+                "SELECT logon, id, name, mail FROM users ORDER BY position"
+            ).fetchall()
+        return map(self._to_user, rows)
+
+    def __len__(self) -> int:
+        connection = self._connect()
+        with self._lock:
+            return connection.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def close(self) -> None:
+        """Closes the file."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class CachedUserDirectory(SqliteUserDirectory):
+    """
+    Directory of the users of an external source, cached in a local SQLite file.
+
+    Lookups are always served from the cache, the source is never read on a lookup. When \
+        the cache is older than the TTL, the source is checked in a background thread: If \
+        the export has changed, only the changed users are written into the cache. If the \
+        source can't be reached, the cache is used as it is and checked again after the \
+        next TTL.
+    """
+
+    __slots__ = ("ttl", "fallback", "_checked", "_refresh_thread")
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        path: str | Path,
+        source: UserSource,
+        user_type: Type[User],
+        ttl: float,
+        fallback: Callable[[], Iterable[User]] | None = None,
+        case_sensitive: bool = True,
+    ) -> None:
+        """
+        Inits the directory.
+
+        Args:
+            path (str | Path): The path of the cache file.
+            source (UserSource): The source of the users. Switching to another source \
+                rebuilds the cache.
+            user_type (Type[User]): The class of the users returned by lookups.
+            ttl (float): The time in seconds, after which the source is checked again.
+            fallback (Callable[[], Iterable[User]] | None, optional): Returns the users, \
+                if there's no cache yet and the source can't be reached. The cache is \
+                built from the source as soon as it's available. Defaults to None.
+            case_sensitive (bool, optional): Match the logon, name and id case \
+                sensitive. Defaults to True.
+        """
+        super().__init__(path, source, source, user_type, case_sensitive)
+        self.ttl = ttl
+        self.fallback = fallback
+        self._checked: float | None = None
+        self._refresh_thread: threading.Thread | None = None
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return (*super().__getstate__(), self.ttl, self.fallback)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        super().__setstate__(state[:-2])
+        self.ttl, self.fallback = state[-2:]
+        self._checked = None
+        self._refresh_thread = None
+
+    def _is_valid(self, connection: sqlite3.Connection) -> bool:
+        try:
+            connection.execute("SELECT stamp, checked FROM sync").fetchone()
+        except sqlite3.DatabaseError:
+            return False
+        return super()._is_valid(connection)
+
+    def build(self) -> None:
+        """Builds the cache from the source, or from the fallback if the source can't \
+            be reached or read. Users with the same logon are stored once, the first \
+            one wins. The file is replaced atomically."""
+        try:
+            stamp: str | None = repr(self.source.stamp())
+            rows = self._unique_rows(self.source.read(self.user_type))
+            checked = time.time()
+        except READ_ERRORS:
+            if self.fallback is None:
+                raise
+            # Unreachable or an incomplete export: The source is tried again on the next
+            # lookup.
+            stamp, rows, checked = None, self._unique_rows(self.fallback()), 0.0
+
+        def fill(connection: sqlite3.Connection) -> None:
+            connection.executemany(INSERT_USERS, rows.values())
+            connection.execute("CREATE TABLE sync (stamp TEXT, checked REAL)")
+            connection.execute("INSERT INTO sync VALUES (?, ?)", (stamp, checked))
+
+        self._replace(fill)
+
+    def _unique_rows(self, users: Iterable[User]) -> Dict[str, Tuple[str, ...]]:
+        """Returns the rows of the users by their logon key, the first user wins."""
+        rows: Dict[str, Tuple[str, ...]] = {}
+        for row in self._rows(users):
+            rows.setdefault(row[4], row)
+        return rows
+
+    def refresh(self) -> int:
+        """
+        Checks the source and writes the changed users into the cache. The export is \
+            read only if its stamp has changed. The users are compared by their logon: \
+            Only new and changed users are written, only missing users are deleted.
+
+        Raises:
+            OSError: The source can't be reached.
+            ValueError: The export can't be parsed, e.g. while it's written.
+
+        Returns:
+            int: The number of added, changed and removed users.
+        """
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            stamp = repr(self.source.stamp())
+            changes = 0
+            if connection.execute("SELECT stamp FROM sync").fetchone()[0] != stamp:
+                rows = self._unique_rows(self.source.read(self.user_type))
+                cached = {
+                    row[5]: (row[0], row[1:])
+                    for row in connection.execute(
+                        "SELECT position, logon, id, name, mail, logon_key, name_key, "
+                        "id_key FROM users ORDER BY position DESC"
+                    )
+                }
+                removed = [(cached[key][0],) for key in cached.keys() - rows.keys()]
+                changed = [
+                    (*row, cached[key][0])
+                    for key, row in rows.items()
+                    if key in cached and cached[key][1] != row
+                ]
+                added = [row for key, row in rows.items() if key not in cached]
+                connection.executemany("DELETE FROM users WHERE position = ?", removed)
+                connection.executemany(
+                    "UPDATE users SET logon = ?, id = ?, name = ?, mail = ?, "
+                    "logon_key = ?, name_key = ?, id_key = ? WHERE position = ?",
+                    changed,
+                )
+                connection.executemany(INSERT_USERS, added)
+                changes = len(removed) + len(changed) + len(added)
+            connection.execute(
+                "UPDATE sync SET stamp = ?, checked = ?", (stamp, time.time())
+            )
+            connection.commit()
+            return changes
+        finally:
+            connection.close()
+
+    def _refresh_quietly(self) -> None:
+        try:
+            self.refresh()
+        except Exception:  # pylint: disable=W0718
+            # Slow, offline or broken: The cache stays as it is.
+            pass
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = super()._connect()
+        if self._checked is None:
+            with self._lock:
+                self._checked = connection.execute(
+                    "SELECT checked FROM sync"
+                ).fetchone()[0]
+        if time.time() - self._checked >= self.ttl:  # type: ignore
+            with self._lock:
+                if self._refresh_thread is None or not self._refresh_thread.is_alive():
+                    self._checked = time.time()
+                    self._refresh_thread = threading.Thread(
+                        target=self._refresh_quietly, name="users", daemon=True
+                    )
+                    self._refresh_thread.start()
+        return connection
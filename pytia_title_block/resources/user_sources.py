@@ -0,0 +1,207 @@
+"""
+    External sources of the users.
+
+    Instead of the users.json of the app, the users can be read from an export of the
+    corporate directory, e.g. a LDIF or CSV file on a share. The source is never read on a
+    lookup: The users are cached locally, see `user_directory.CachedUserDirectory`.
+
+    Each source maps the fields of the `User` (logon, id, name, mail) to the attributes
+    (LDIF) or columns (CSV, JSON) of the export. Records without a logon are skipped.
+
+    Important: Do not import third party modules here. This module
+    must work on its own without any other dependencies!
+"""
+
+from __future__ import annotations
+
+import abc
+import base64
+import csv
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Iterator
+from typing import Tuple
+from typing import Type
+
+if TYPE_CHECKING:
+    from resources import User
+
+SOURCE_JSON = "json"
+SOURCE_CSV = "csv"
+SOURCE_LDIF = "ldif"
+
+FIELDS = ("logon", "id", "name", "mail")
+
+# Errors of reading an export that is unreachable, incomplete or malformed. Decoding errors
+# (json, base64, unicode) are ValueErrors.
+READ_ERRORS = (OSError, ValueError, csv.Error)
+
+
+class UserSource(abc.ABC):
+    """Base class of the sources, a single export file."""
+
+    __slots__ = ("path", "attributes")
+
+    DEFAULT_ATTRIBUTES: Dict[str, str] = {name: name for name in FIELDS}
+
+    def __init__(self, path: str | Path, attributes: Dict[str, str] | None = None):
+        """
+        Inits the source.
+
+        Args:
+            path (str | Path): The path of the export file.
+            attributes (Dict[str, str] | None, optional): Maps the fields of the user to \
+                the attributes or columns of the export. Missing fields use the \
+                `DEFAULT_ATTRIBUTES`. Defaults to None.
+        """
+        self.path = Path(path)
+        self.attributes = {**self.DEFAULT_ATTRIBUTES, **(attributes or {})}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r}, {self.attributes!r})"
+
+    def stamp(self) -> Tuple[int, int]:
+        """
+        Returns the modification time and size of the export. Only the file's metadata is \
+            read, use it to check if the export has changed.
+
+        Raises:
+            OSError: The export can't be reached.
+        """
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    @abc.abstractmethod
+    def records(self) -> Iterator[Dict[str, str]]:
+        """Yields the records of the export, mapped by their attribute names."""
+
+    def read(self, user_type: Type[User]) -> Iterator[User]:
+        """
+        Yields the users of the export.
+
+        Args:
+            user_type (Type[User]): The class of the users.
+
+        Raises:
+            OSError: The export can't be read.
+            ValueError: The export can't be parsed.
+            csv.Error: The CSV export can't be parsed.
+        """
+        for record in self.records():
+            values = {
+                name: str(record.get(self.attributes[name]) or "") for name in FIELDS
+            }
+            if values["logon"]:
+                yield user_type(**values)
+
+
+class JsonUserSource(UserSource):
+    """A json file in the format of the users.json, e.g. a local stand-in of the export."""
+
+    __slots__ = ()
+
+    def records(self) -> Iterator[Dict[str, str]]:
+        with open(self.path, "r", encoding="utf8") as f:
+            yield from json.load(f)
+
+
+class CsvUserSource(UserSource):
+    """A CSV file with a header row. The delimiter (`,`, `;` or tab) is detected."""
+
+    __slots__ = ()
+
+    def records(self) -> Iterator[Dict[str, str]]:
+        with open(self.path, "r", encoding="utf-8-sig", newline="") as f:
+            try:
+                dialect = csv.Sniffer().sniff(f.readline(), delimiters=",;\t")
+            except csv.Error:
+                dialect = csv.excel  # type: ignore
+            f.seek(0)
+            yield from csv.DictReader(f, dialect=dialect)
+
+
+class LdifUserSource(UserSource):
+    """
+    A LDIF file (RFC 2849), e.g. exported with `ldifde` or `ldapsearch`.
+
+    Attribute names are case insensitive, multi valued attributes use their first value. \
+        Defaults to the attributes of the Active Directory.
+    """
+
+    __slots__ = ()
+
+    DEFAULT_ATTRIBUTES = {
+        "logon": "samaccountname",
+        "id": "employeeid",
+        "name": "displayname",
+        "mail": "mail",
+    }
+
+    def __init__(self, path: str | Path, attributes: Dict[str, str] | None = None):
+        super().__init__(path, attributes)
+        self.attributes = {k: v.lower() for k, v in self.attributes.items()}
+
+    @staticmethod
+    def _parse(line: str) -> Tuple[str, str]:
+        name, _, value = line.partition(":")
+        if value.startswith(":"):
+            value = base64.b64decode(value[1:].strip()).decode("utf8")
+        elif value.startswith("<"):
+            value = ""  # URL references aren't resolved
+        else:
+            value = value.strip()
+        return name.strip().lower(), value
+
+    def records(self) -> Iterator[Dict[str, str]]:
+        record: Dict[str, str] = {}
+        line = ""
+        with open(self.path, "r", encoding="utf-8-sig") as f:
+            for raw in f:
+                raw = raw.rstrip("\r\n")
+                if raw.startswith(" "):
+                    # Folded line: continues the previous line.
+                    line += raw[1:]
+                    continue
+                if line and not line.startswith("#"):
+                    name, value = self._parse(line)
+                    record.setdefault(name, value)
+                line = raw
+                if not raw:
+                    if record:
+                        yield record
+                    record = {}
+        if line and not line.startswith("#"):
+            name, value = self._parse(line)
+            record.setdefault(name, value)
+        if record:
+            yield record
+
+
+SOURCES: Dict[str, Type[UserSource]] = {
+    SOURCE_JSON: JsonUserSource,
+    SOURCE_CSV: CsvUserSource,
+    SOURCE_LDIF: LdifUserSource,
+}
+
+
+def get_source(
+    kind: str, path: str | Path, attributes: Dict[str, str] | None = None
+) -> UserSource:
+    """
+    Returns the source of the users.
+
+    Args:
+        kind (str): The kind of the source, one of the `SOURCES`.
+        path (str | Path): The path of the export file.
+        attributes (Dict[str, str] | None, optional): Maps the fields of the user to the \
+            attributes or columns of the export. Defaults to None.
+
+    Raises:
+        ValueError: The kind is unknown.
+    """
+    if kind not in SOURCES:
+        raise ValueError(f"Unknown user source {kind!r}, use one of {tuple(SOURCES)}.")
+    return SOURCES[kind](path, attributes)
@@ -5,75 +5,72 @@
     must work on its own without any other dependencies!
 """
 
-import os
-import re
 import sys
 from pathlib import Path
 from tkinter import messagebox as tkmsg
 
+from resources.env_index import get_env_index
+
 
 def expand_env_vars(value: str) -> str:
     """
     Expands windows environment variables.
     E.g.: Expands `%ONEDRIVE%/foo/bar` to `C:/Users/.../OneDrive/foo/bar`
 
-    The variable to replace must be between two percentage symbols.
+    The variable to replace must be between two percentage symbols. Variable names are \
+        case insensitive, the variables are read from the index of the session, see \
+        `resources.env_index`.
 
     Terminates the app if the given value has a variable, that
     cannot be found in the system variables.
     """
-    output = value
-    filter_result = re.findall(r"\%(.*?)\%", value)
-    for key in filter_result:
-        if key in os.environ:
-            output = value.replace(f"%{key}%", os.environ[key])  # type: ignore
-        else:
-            tkmsg.showerror(
-                title="Environment Variables",
-                message=(
-                    f"The environment variable {key!r} is not set on your machine. "
-                    "Depending on your system it may be required to setup the "
-                    "environment variable in capitals only.\n\n"
-                    "Please contact your system administrator."
-                ),
-            )
-            sys.exit()
-    return output
+    try:
+        return get_env_index().expand(value)
+    except KeyError as e:
+        tkmsg.showerror(
+            title="Environment Variables",
+            message=(
+                f"The environment variable {e.args[0]!r} is not set on your machine. "
+                "Depending on your system it may be required to setup the "
+                "environment variable in capitals only.\n\n"
+                "Please contact your system administrator."
+            ),
+        )
+        sys.exit()
 
 
 def create_path_symlink(path: Path, alway_apply_symlink: bool) -> str:
     """
     Replaces paths of the given path with the environment variable, if exists
-    and the users agrees. Starts with the deepest folder and runs upwards.
+    and the users agrees. Uses the deepest folder, that is held by a variable.
 
     E.g.: Replaces `C:/Users/.../OneDrive/foo/bar` with `%ONEDRIVE%/foo/bar`
 
-    The environment variable will be encapsuled within two percentage symbols.
+    The environment variable will be encapsuled within two percentage symbols. Folders \
+        are compared case insensitive, see `resources.env_index`.
 
     Return the original path if no symlink is found.
     """
     path_str = str(path)
 
-    for parent in path.parents:
-        for key, value in os.environ.items():
-            if str(parent) == value:
-                symlinked = path_str.replace(str(parent), f"%{key}%")
-                if alway_apply_symlink or tkmsg.askyesno(
-                    title="Symlink has been found.",
-                    message=(
-                        "A symlink has been found for the drawing documents path:\n"
-                        f" - Path: {str(parent)!r}.\n"
-                        f" - Symlink: {key!r}\n\n"
-                        "Do you want to save the symlink to the linked documents path?\n\n"
-                        "Depending on your choice, the following path will be written "
-                        "to the linked document:\n"
-                        f" - Yes: {symlinked!r}\n"
-                        f" - No:  {path_str!r}"
-                    ),
-                ):
-                    return symlinked
-                else:
-                    return path_str
+    if (found := get_env_index().symlink(path)) is None:
+        return path_str
+
+    key, parent, symlinked = found
+    if alway_apply_symlink or tkmsg.askyesno(
+        title="Symlink has been found.",
+        message=(
+            "A symlink has been found for the drawing documents path:\n"
+            f" - Path: {parent!r}.\n"
+            f" - Symlink: {key!r}\n\n"
+            "Do you want to save the symlink to the linked documents path?\n\n"
+            "Depending on your choice, the following path will be written "
+            "to the linked document:\n"
+            f" - Yes: {symlinked!r}\n"
+            f" - No:  {path_str!r}"
+        ),
+    ):
+        return symlinked
     return path_str
 
 
@@ -0,0 +1,182 @@
+"""
+    ISO 2768 general tolerances, computed locally.
+
+    Holds the permissible deviations of ISO 2768-1 (classes f, m, c, v) for linear
+    dimensions, external radii and angular dimensions. The tables are precomputed into
+    sorted tuples of range bounds, a lookup is a bisect on the bounds.
+    The general geometrical tolerances of ISO 2768-2 apply to features, not to dimensions:
+    Their class is parsed, but not applied to the dimensions.
+
+    The general tolerance class is parsed from the text of the `tolerance` field, e.g.
+    `ISO 2768 1-m 2-K`, `ISO 2768-mK` or `ISO 2768-m`. All values are in mm, angles are in
+    degrees.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Dict
+from typing import Tuple
+
+from models.tolerance_model import GeneralToleranceModel
+
+# Linear dimensions (ISO 2768-1): Upper bounds of the nominal size ranges, the lower bound
+# of the first range is 0.5 mm. None means that the class has no deviation for the range.
+LINEAR_RANGES = (3, 6, 30, 120, 400, 1000, 2000, 4000)
+LINEAR_MIN_NOMINAL_SIZE = 0.5
+LINEAR: Dict[str, Tuple[float | None, ...]] = {
+    "f": (0.05, 0.05, 0.1, 0.15, 0.2, 0.3, 0.5, None),
+    "m": (0.1, 0.1, 0.2, 0.3, 0.5, 0.8, 1.2, 2),
+    "c": (0.2, 0.3, 0.5, 0.8, 1.2, 2, 3, 4),
+    "v": (None, 0.5, 1, 1.5, 2.5, 4, 6, 8),
+}
+
+# External radii (ISO 2768-1) by the nominal size, the last range is open. Classes f and
+# m share their deviations, so do c and v. Chamfer heights share the table, but chamfer
+# dimensions get no general tolerance, see `tolerance_tools`.
+RADIUS_RANGES = (3, 6)
+RADIUS: Dict[str, Tuple[float, ...]] = {
+    "f": (0.2, 0.5, 1),
+    "m": (0.2, 0.5, 1),
+    "c": (0.4, 1, 2),
+    "v": (0.4, 1, 2),
+}
+
+# Angular dimensions (ISO 2768-1) by the length of the shorter leg in mm, the last range
+# is open. The deviations are in degrees.
+ANGULAR_RANGES = (10, 50, 120, 400)
+ANGULAR: Dict[str, Tuple[float, ...]] = {
+    "f": (1, 30 / 60, 20 / 60, 10 / 60, 5 / 60),
+    "m": (1, 30 / 60, 20 / 60, 10 / 60, 5 / 60),
+    "c": (1.5, 1, 30 / 60, 15 / 60, 10 / 60),
+    "v": (3, 2, 1, 30 / 60, 20 / 60),
+}
+
+CLASS_PATTERNS = (
+    # ISO 2768 1-m 2-K, ISO 2768-1 m, ...
+    re.compile(
+        r"ISO\s*2768(?:\s*-?\s*1\s*-?\s*(?P<linear>[fmcv]))?"
+        r"(?:\s*-?\s*2\s*-?\s*(?P<geometric>[HKL]))?\s*$",
+        re.IGNORECASE,
+    ),
+    # ISO 2768-mK, ISO 2768 m
+    re.compile(
+        r"ISO\s*2768\s*-?\s*(?P<linear>[fmcv])(?P<geometric>[HKL])?\s*$",
+        re.IGNORECASE,
+    ),
+)
+
+
+def parse_class(text: str | None) -> GeneralToleranceModel | None:
+    """
+    Returns the general tolerance class of the text of the `tolerance` field.
+
+    Args:
+        text (str | None): The text, e.g. `ISO 2768 1-m 2-K` or `ISO 2768-mK`.
+
+    Returns:
+        GeneralToleranceModel | None: The class, None if the text isn't an ISO 2768 \
+            general tolerance.
+    """
+    if not text:
+        return None
+    for pattern in CLASS_PATTERNS:
+        if (match := pattern.search(text.strip())) is None:
+            continue
+        linear, geometric = match.group("linear"), match.group("geometric")
+        if linear is None and geometric is None:
+            continue
+        return GeneralToleranceModel(
+            name=text.strip(),
+            linear=linear.lower() if linear else None,
+            geometric=geometric.upper() if geometric else None,
+        )
+    return None
+
+
+def _lookup(
+    bounds: Tuple[int, ...], values: Tuple[float | None, ...], nominal: float
+) -> float | None:
+    index = bisect_left(bounds, nominal)
+    return values[index] if index < len(values) else None
+
+
+def get_linear_deviation(linear: str, nominal: float) -> float | None:
+    """
+    Returns the permissible deviation of a linear dimension.
+
+    Args:
+        linear (str): The tolerance class of ISO 2768-1 (`f`, `m`, `c` or `v`).
+        nominal (float): The nominal size in mm.
+
+    Returns:
+        float | None: The deviation (±) in mm, None if the class has no deviation for \
+            the nominal size.
+    """
+    if linear not in LINEAR or abs(nominal) < LINEAR_MIN_NOMINAL_SIZE:
+        return None
+    return _lookup(LINEAR_RANGES, LINEAR[linear], abs(nominal))
+
+
+def get_linear_limits(
+    general: GeneralToleranceModel, nominal: float
+) -> Tuple[float, float] | None:
+    """
+    Returns the limits of size of a linear dimension with the general tolerance.
+
+    Args:
+        general (GeneralToleranceModel): The general tolerance class.
+        nominal (float): The nominal size in mm.
+
+    Returns:
+        Tuple[float, float] | None: The minimum and the maximum size in mm, None if the \
+            class has no deviation for the nominal size.
+    """
+    if general.linear is None:
+        return None
+    if (deviation := get_linear_deviation(general.linear, nominal)) is None:
+        return None
+    return round(nominal - deviation, 6), round(nominal + deviation, 6)
+
+
+def get_radius_deviation(linear: str, nominal: float) -> float | None:
+    """
+    Returns the permissible deviation of an external radius.
+
+    Args:
+        linear (str): The tolerance class of ISO 2768-1 (`f`, `m`, `c` or `v`).
+        nominal (float): The nominal size in mm.
+
+    Returns:
+        float | None: The deviation (±) in mm, None if the class has no deviation for \
+            the nominal size.
+    """
+    if linear not in RADIUS or abs(nominal) < LINEAR_MIN_NOMINAL_SIZE:
+        return None
+    return _lookup(RADIUS_RANGES, RADIUS[linear], abs(nominal))
+
+
+def get_angular_deviation(linear: str, leg_length: float | None = None) -> float | None:
+    """
+    Returns the permissible deviation of an angular dimension.
+
+    Args:
+        linear (str): The tolerance class of ISO 2768-1 (`f`, `m`, `c` or `v`).
+        leg_length (float | None, optional): The length of the shorter leg in mm. \
+            Defaults to None: The deviation of the shortest legs (up to 10 mm), which \
+            is the widest one.
+
+    Returns:
+        float | None: The deviation (±) in degrees, None if the class is unknown.
+    """
+    if linear not in ANGULAR:
+        return None
+    if leg_length is None:
+        return ANGULAR[linear][0]
+    return _lookup(ANGULAR_RANGES, ANGULAR[linear], abs(leg_length))
+
+
+def format_angle(degrees: float) -> str:
+    """Returns the angle in degrees and minutes, e.g. `1°` or `0°30'`."""
+    minutes = round(abs(degrees) * 60)
+    whole, rest = divmod(minutes, 60)
+    return f"{whole}°{rest}'" if rest else f"{whole}°"
@@ -0,0 +1,198 @@
+"""
+    ISO 286 limits of sizes, computed locally.
+
+    Holds the standard tolerance grades (IT1 to IT18) and the fundamental deviations of the
+    common shafts (c to s) and holes (C to S) for nominal sizes up to 500 mm. The tables are
+    precomputed into sorted tuples of range bounds, a lookup is a bisect on the bounds.
+
+    All table values are in µm, the deviations and limits returned are in mm.
+"""
+
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict
+from typing import Tuple
+
+MAX_NOMINAL_SIZE = 500
+
+# Upper bounds of the main nominal size ranges (the lower bound is exclusive, except for
+# the first range). The intermediate ranges split some of the main ranges.
+MAIN_RANGES = (3, 6, 10, 18, 30, 50, 80, 120, 180, 250, 315, 400, 500)
+INTERMEDIATE_RANGES = (
+    *(3, 6, 10, 18, 30, 40, 50, 65, 80, 100, 120, 140, 160, 180),
+    *(200, 225, 250, 280, 315, 355, 400, 450, 500),
+)
+
+# Standard tolerance grades IT1 to IT18 per main range.
+# fmt: off
+IT_GRADES: Tuple[Tuple[float, ...], ...] = (
+    (0.8, 1.2, 2, 3, 4, 6, 10, 14, 25, 40, 60, 100, 140, 250, 400, 600, 1000, 1400),
+    (1, 1.5, 2.5, 4, 5, 8, 12, 18, 30, 48, 75, 120, 180, 300, 480, 750, 1200, 1800),
+    (1, 1.5, 2.5, 4, 6, 9, 15, 22, 36, 58, 90, 150, 220, 360, 580, 900, 1500, 2200),
+    (1.2, 2, 3, 5, 8, 11, 18, 27, 43, 70, 110, 180, 270, 430, 700, 1100, 1800, 2700),
+    (1.5, 2.5, 4, 6, 9, 13, 21, 33, 52, 84, 130, 210, 330, 520, 840, 1300, 2100, 3300),
+    (1.5, 2.5, 4, 7, 11, 16, 25, 39, 62, 100, 160, 250, 390, 620, 1000, 1600, 2500, 3900),
+    (2, 3, 5, 8, 13, 19, 30, 46, 74, 120, 190, 300, 460, 740, 1200, 1900, 3000, 4600),
+    (2.5, 4, 6, 10, 15, 22, 35, 54, 87, 140, 220, 350, 540, 870, 1400, 2200, 3500, 5400),
+    (3.5, 5, 8, 12, 18, 25, 40, 63, 100, 160, 250, 400, 630, 1000, 1600, 2500, 4000, 6300),
+    (4.5, 7, 10, 14, 20, 29, 46, 72, 115, 185, 290, 460, 720, 1150, 1850, 2900, 4600, 7200),
+    (6, 8, 12, 16, 23, 32, 52, 81, 130, 210, 320, 520, 810, 1300, 2100, 3200, 5200, 8100),
+    (7, 9, 13, 18, 25, 36, 57, 89, 140, 230, 360, 570, 890, 1400, 2300, 3600, 5700, 8900),
+    (8, 10, 15, 20, 27, 40, 63, 97, 155, 250, 400, 630, 970, 1550, 2500, 4000, 6300, 9700),
+)
+# fmt: on
+
+# Upper deviations (es) of the shafts c to h, per main or intermediate range.
+SHAFT_UPPER: Dict[str, Tuple[int, ...]] = {
+    "c": (
+        *(-60, -70, -80, -95, -110, -120, -130, -140, -150, -170, -180, -200),
+        *(-210, -230, -240, -260, -280, -300, -330, -360, -400, -440, -480),
+    ),
+    "d": (-20, -30, -40, -50, -65, -80, -100, -120, -145, -170, -190, -210, -230),
+    "e": (-14, -20, -25, -32, -40, -50, -60, -72, -85, -100, -110, -125, -135),
+    "f": (-6, -10, -13, -16, -20, -25, -30, -36, -43, -50, -56, -62, -68),
+    "g": (-2, -4, -5, -6, -7, -9, -10, -12, -14, -15, -17, -18, -20),
+    "h": (0,) * 13,
+}
+
+# Lower deviations (ei) of the shafts k to s, per main or intermediate range. The values of
+# k apply to the grades IT4 to IT7, all other grades of k have the lower deviation 0.
+SHAFT_LOWER: Dict[str, Tuple[int, ...]] = {
+    "k": (0, 1, 1, 1, 2, 2, 2, 3, 3, 4, 4, 4, 5),
+    "m": (2, 4, 6, 7, 8, 9, 11, 13, 15, 17, 20, 21, 23),
+    "n": (4, 8, 10, 12, 15, 17, 20, 23, 27, 31, 34, 37, 40),
+    "p": (6, 12, 15, 18, 22, 26, 32, 37, 43, 50, 56, 62, 68),
+    "r": (
+        *(10, 15, 19, 23, 28, 34, 34, 41, 43, 51, 54, 63),
+        *(65, 68, 77, 80, 84, 94, 98, 108, 114, 126, 132),
+    ),
+    "s": (
+        *(14, 19, 23, 28, 35, 43, 43, 53, 59, 71, 79, 92),
+        *(100, 108, 122, 130, 140, 158, 170, 190, 208, 232, 252),
+    ),
+}
+
+TOLERANCE_PATTERN = re.compile(r"^(js|JS|[a-zA-Z])(\d{1,2})$")
+
+
+def _bounds(deviations: Tuple[int, ...]) -> Tuple[int, ...]:
+    return MAIN_RANGES if len(deviations) == len(MAIN_RANGES) else INTERMEDIATE_RANGES
+
+
+def _range_index(bounds: Tuple[int, ...], nominal: float) -> int:
+    """Returns the index of the range that contains the nominal size."""
+    return bisect_left(bounds, nominal)
+
+
+def get_it_grade(grade: int, nominal: float) -> float | None:
+    """
+    Returns the standard tolerance of the grade for the nominal size.
+
+    Args:
+        grade (int): The grade, e.g. `7` for IT7.
+        nominal (float): The nominal size in mm.
+
+    Returns:
+        float | None: The standard tolerance in µm, None if the grade or the nominal \
+            size is out of the table.
+    """
+    if not 1 <= grade <= 18 or not 0 < nominal <= MAX_NOMINAL_SIZE:
+        return None
+    return IT_GRADES[_range_index(MAIN_RANGES, nominal)][grade - 1]
+
+
+def _shaft_deviations(letter: str, grade: int, nominal: float) -> Tuple[float, float]:
+    it = get_it_grade(grade, nominal)
+    assert it is not None
+    if letter == "js":
+        return it / 2, -it / 2
+    if letter in SHAFT_UPPER:
+        values = SHAFT_UPPER[letter]
+        upper = values[_range_index(_bounds(values), nominal)]
+        return upper, upper - it
+    values = SHAFT_LOWER[letter]
+    lower = values[_range_index(_bounds(values), nominal)]
+    if letter == "k" and not 4 <= grade <= 7:
+        lower = 0
+    return lower + it, lower
+
+
+def _hole_deviations(letter: str, grade: int, nominal: float) -> Tuple[float, float]:
+    it = get_it_grade(grade, nominal)
+    assert it is not None
+    shaft = letter.lower()
+    if shaft == "js":
+        return it / 2, -it / 2
+    if shaft in SHAFT_UPPER:
+        # The holes A to H mirror the shafts: EI = -es
+        values = SHAFT_UPPER[shaft]
+        lower = -values[_range_index(_bounds(values), nominal)]
+        return lower + it, lower
+
+    values = SHAFT_LOWER[shaft]
+    mirrored = -values[_range_index(_bounds(values), nominal)]
+    # The fine grades of K to N (up to IT8) and P to S (up to IT7) are corrected by
+    # delta = ITn - IT(n-1), so that equal fits result for hole and shaft basis.
+    delta_limit = 8 if shaft in ("k", "m", "n") else 7
+    delta = 0.0
+    if nominal > 3 and 3 <= grade <= delta_limit:
+        delta = it - (get_it_grade(grade - 1, nominal) or 0)
+
+    if shaft == "k":
+        upper = mirrored + delta if grade <= 8 else 0
+    elif shaft == "n" and grade > 8:
+        upper = mirrored if nominal <= 3 else 0
+    else:
+        upper = mirrored + delta
+    return upper, upper - it
+
+
+@lru_cache(maxsize=4096)
+def get_deviations(tolerance: str, nominal: float) -> Tuple[float, float] | None:
+    """
+    Returns the deviations of the ISO tolerance for the nominal size.
+
+    Args:
+        tolerance (str): The tolerance, e.g. `H7` (hole) or `g6` (shaft).
+        nominal (float): The nominal size in mm.
+
+    Returns:
+        Tuple[float, float] | None: The upper and the lower deviation in mm, None if \
+            the tolerance is not supported or the nominal size is out of the table.
+    """
+    if (match := TOLERANCE_PATTERN.match(tolerance.strip())) is None:
+        return None
+    letter, grade = match.group(1), int(match.group(2))
+    if get_it_grade(grade, nominal) is None:
+        return None
+
+    if letter.islower() and (
+        letter == "js" or letter in SHAFT_UPPER or letter in SHAFT_LOWER
+    ):
+        upper, lower = _shaft_deviations(letter, grade, nominal)
+    elif letter.isupper() and (
+        letter == "JS" or letter.lower() in SHAFT_UPPER or letter.lower() in SHAFT_LOWER
+    ):
+        upper, lower = _hole_deviations(letter, grade, nominal)
+    else:
+        return None
+    return round(upper / 1000, 5), round(lower / 1000, 5)
+
+
+def get_limits(tolerance: str, nominal: float) -> Tuple[float, float] | None:
+    """
+    Returns the limits of size of the ISO tolerance for the nominal size.
+
+    Args:
+        tolerance (str): The tolerance, e.g. `H7` (hole) or `g6` (shaft).
+        nominal (float): The nominal size in mm.
+
+    Returns:
+        Tuple[float, float] | None: The minimum and the maximum size in mm, None if \
+            the tolerance is not supported or the nominal size is out of the table.
+    """
+    if (deviations := get_deviations(tolerance, nominal)) is None:
+        return None
+    upper, lower = deviations
+    return round(nominal + lower, 6), round(nominal + upper, 6)
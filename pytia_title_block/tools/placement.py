@@ -0,0 +1,261 @@
+"""
+    Collision free placement of elements on the sheet.
+
+    The bounding boxes of all views and of the texts and tables of the background view are
+    read once per sheet into a uniform grid. A placement request searches the free position
+    nearest to the desired one, in rings of growing distance, and only checks the boxes of
+    the grid cells it covers. The index of a sheet is cached, repeated placements don't read
+    the geometry again.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import lru_cache
+from math import floor
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+
+from models.placement_model import BoxModel
+from pytia.log import log
+
+if TYPE_CHECKING:
+    from loader.doc_loader import DocumentLoader
+
+GRID_CELL_SIZE = 20  # mm
+SEARCH_STEP = 5  # mm
+SEARCH_DISTANCE = 300  # mm
+SHEET_MARGIN = 5  # mm
+CLEARANCE = 2  # mm, between placed elements and obstacles
+
+# Texts have no bounding box in the drafting API, it's estimated from the text.
+TEXT_CHAR_WIDTH = 2.5  # mm
+TEXT_LINE_HEIGHT = 5  # mm
+
+
+def text_box(x: float, y: float, text: str) -> BoxModel:
+    """Returns the estimated bounding box of a text anchored at its bottom left corner."""
+    lines = text.splitlines() or [""]
+    return BoxModel(
+        x_min=x,
+        x_max=x + max(len(line) for line in lines) * TEXT_CHAR_WIDTH,
+        y_min=y,
+        y_max=y + len(lines) * TEXT_LINE_HEIGHT,
+    )
+
+
+@lru_cache(maxsize=8)
+def _search_offsets(step: float, distance: float) -> Tuple[Tuple[float, float], ...]:
+    """Returns all grid offsets within the distance, ordered by their distance."""
+    steps = int(distance // step)
+    offsets = [
+        (i * step, j * step)
+        for i in range(-steps, steps + 1)
+        for j in range(-steps, steps + 1)
+        if i * i + j * j <= steps * steps
+    ]
+    return tuple(sorted(offsets, key=lambda o: (o[0] ** 2 + o[1] ** 2, -o[1], o[0])))
+
+
+class GridIndex:
+    """Uniform grid of bounding boxes."""
+
+    def __init__(self, cell_size: float = GRID_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.boxes: List[BoxModel] = []
+        self.cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+
+    def _cells(self, box: BoxModel) -> Iterator[Tuple[int, int]]:
+        size = self.cell_size
+        for i in range(floor(box.x_min / size), floor(box.x_max / size) + 1):
+            for j in range(floor(box.y_min / size), floor(box.y_max / size) + 1):
+                yield i, j
+
+    def insert(self, box: BoxModel) -> None:
+        """Adds the box to the index."""
+        self.boxes.append(box)
+        for cell in self._cells(box):
+            self.cells[cell].append(len(self.boxes) - 1)
+
+    def intersects(self, box: BoxModel, margin: float = 0) -> bool:
+        """Returns True if the box overlaps any box of the index."""
+        seen: Set[int] = set()
+        grown = BoxModel(
+            x_min=box.x_min - margin,
+            x_max=box.x_max + margin,
+            y_min=box.y_min - margin,
+            y_max=box.y_max + margin,
+        )
+        for cell in self._cells(grown):
+            for index in self.cells.get(cell, ()):
+                if index not in seen:
+                    seen.add(index)
+                    if self.boxes[index].intersects(box, margin):
+                        return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+
+class SheetIndex:
+    """The obstacles of a sheet."""
+
+    def __init__(self, sheet: BoxModel, obstacles: Iterable[BoxModel]) -> None:
+        """
+        Inits the index.
+
+        Args:
+            sheet (BoxModel): The usable area of the sheet.
+            obstacles (Iterable[BoxModel]): The bounding boxes of the sheet's elements.
+        """
+        self.sheet = sheet
+        self.grid = GridIndex()
+        for box in obstacles:
+            self.grid.insert(box)
+
+    def is_free(self, box: BoxModel, extra: Sequence[BoxModel] = ()) -> bool:
+        """Returns True if the box lies on the sheet and doesn't overlap any obstacle."""
+        return (
+            self.sheet.contains(box)
+            and not self.grid.intersects(box, CLEARANCE)
+            and not any(other.intersects(box, CLEARANCE) for other in extra)
+        )
+
+    def find_free(
+        self,
+        box: BoxModel,
+        extra: Sequence[BoxModel] = (),
+        step: float = SEARCH_STEP,
+        distance: float = SEARCH_DISTANCE,
+    ) -> BoxModel | None:
+        """
+        Returns the free position of the box nearest to its current position.
+
+        Args:
+            box (BoxModel): The box at its desired position.
+            extra (Sequence[BoxModel], optional): Additional obstacles, that aren't part \
+                of the sheet (yet), e.g. tables placed before. Defaults to ().
+            step (float, optional): The step of the search grid. Defaults to 5 mm.
+            distance (float, optional): The maximum distance. Defaults to 300 mm.
+
+        Returns:
+            BoxModel | None: The box at the free position, None if there's none within \
+                the distance.
+        """
+        for dx, dy in _search_offsets(step, distance):
+            candidate = box.moved(dx, dy)
+            if self.is_free(candidate, extra):
+                return candidate
+        log.warning(f"No free position found for {box}.")
+        return None
+
+
+def read_sheet_index(
+    doc_loader: DocumentLoader, exclude: Iterable[str] = ()
+) -> SheetIndex:
+    """
+    Reads the bounding boxes of the active sheet's elements: The views (except the main \
+        and the background view), and the texts and tables of the background view.
+
+    Args:
+        doc_loader (DocumentLoader): The doc loader instance.
+        exclude (Iterable[str], optional): Names of texts and tables, that are no \
+            obstacles, e.g. the elements that are to be placed. Names ending with `*` \
+            are prefixes. Defaults to ().
+
+    Returns:
+        SheetIndex: The index.
+    """
+    exclude = tuple(exclude)
+
+    def is_excluded(name: str) -> bool:
+        return any(
+            name.startswith(e[:-1]) if e.endswith("*") else name == e for e in exclude
+        )
+
+    sheet = doc_loader.sheet
+    obstacles: List[BoxModel] = []
+
+    views = doc_loader.views
+    for view_index in range(3, views.count + 1):
+        x_min, x_max, y_min, y_max = views.item(view_index).size()
+        obstacles.append(BoxModel(x_min=x_min, x_max=x_max, y_min=y_min, y_max=y_max))
+
+    texts = doc_loader.bg_texts
+    for index in range(1, texts.count + 1):
+        text = texts.item(index)
+        if not is_excluded(text.name):
+            obstacles.append(text_box(text.x, text.y, text.text))
+
+    for table in doc_loader.background_view.tables:
+        if is_excluded(table.name):
+            continue
+        x, y = table.x, table.y
+        width = table.number_of_columns * table.get_column_size(1)
+        height = table.number_of_rows * table.get_row_size(1)
+        obstacles.append(BoxModel(x_min=x, x_max=x + width, y_min=y - height, y_max=y))
+
+    sheet_box = BoxModel(
+        x_min=SHEET_MARGIN,
+        x_max=sheet.get_paper_width() - SHEET_MARGIN,
+        y_min=SHEET_MARGIN,
+        y_max=sheet.get_paper_height() - SHEET_MARGIN,
+    )
+    log.info(f"Indexed {len(obstacles)} elements of the sheet for placement.")
+    return SheetIndex(sheet_box, obstacles)
+
+
+class SheetIndexCache:
+    """Caches the index of each sheet, see `read_sheet_index`."""
+
+    def __init__(self) -> None:
+        self._indexes: Dict[Tuple[str, str, Tuple[str, ...]], SheetIndex] = {}
+
+    @staticmethod
+    def _get_sheet_key(doc_loader: DocumentLoader) -> Tuple[str, str]:
+        return str(doc_loader.path), doc_loader.sheet.name
+
+    def get(
+        self, doc_loader: DocumentLoader, exclude: Iterable[str] = ()
+    ) -> SheetIndex:
+        """
+        Returns the index of the active sheet, reads it on the first request. Each set \
+            of excluded names has its own index.
+
+        Args:
+            doc_loader (DocumentLoader): The doc loader instance.
+            exclude (Iterable[str], optional): See `read_sheet_index`. Defaults to ().
+
+        Returns:
+            SheetIndex: The index.
+        """
+        exclude = tuple(exclude)
+        key = (*self._get_sheet_key(doc_loader), exclude)
+        if key not in self._indexes:
+            self._indexes[key] = read_sheet_index(doc_loader, exclude)
+        return self._indexes[key]
+
+    def invalidate(self, doc_loader: DocumentLoader | None = None) -> None:
+        """
+        Drops the indexes, e.g. after the sheet has been modified in CATIA.
+
+        Args:
+            doc_loader (DocumentLoader | None, optional): Only drops the indexes of the \
+                doc loader's active sheet. Defaults to None (all indexes).
+        """
+        if doc_loader is None:
+            self._indexes.clear()
+            return
+        sheet_key = self._get_sheet_key(doc_loader)
+        for key in [key for key in self._indexes if key[:2] == sheet_key]:
+            del self._indexes[key]
+
+
+sheet_indexes = SheetIndexCache()
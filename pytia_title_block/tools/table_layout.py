@@ -0,0 +1,63 @@
+"""
+    Layout of tables that don't fit the sheet.
+
+    The rows of a table are split into blocks that fit the available height. The blocks are
+    placed side by side, each block repeats the header. The layout is computed in one pass
+    from the geometry alone, so that every table is created or moved exactly once.
+"""
+
+from math import ceil
+from typing import List
+
+from models.tolerance_model import TableBlockModel
+
+
+def layout_blocks(
+    rows: int,
+    anchor_x: float,
+    anchor_y: float,
+    available_height: float,
+    row_height: float,
+    block_width: float,
+    gap: float = 0,
+) -> List[TableBlockModel]:
+    """
+    Splits the rows into blocks that fit the available height.
+
+    The blocks grow upwards from the anchor (bottom right corner of the right most block) \
+        and are placed side by side to the left, in reading order. The rows are spread \
+        evenly over the blocks.
+
+    Args:
+        rows (int): The number of rows, without the header.
+        anchor_x (float): The x coordinate of the bottom right corner of all blocks.
+        anchor_y (float): The y coordinate of the bottom right corner of all blocks.
+        available_height (float): The height above the anchor, that can be used.
+        row_height (float): The height of a row.
+        block_width (float): The width of a block.
+        gap (float, optional): The space between two blocks. Defaults to 0.
+
+    Returns:
+        List[TableBlockModel]: The blocks, at least one. A block holds at least one row, \
+            even if the available height is too small for it.
+    """
+    rows_per_block = max(1, int(available_height // row_height) - 1)
+    count = max(1, ceil(rows / rows_per_block))
+    size, extra = divmod(rows, count)
+    left = anchor_x - count * block_width - (count - 1) * gap
+
+    blocks: List[TableBlockModel] = []
+    first = 0
+    for index in range(count):
+        block_rows = size + (1 if index < extra else 0)
+        blocks.append(
+            TableBlockModel(
+                index=index,
+                first=first,
+                rows=block_rows,
+                x=left + index * (block_width + gap),
+                y=anchor_y + (block_rows + 1) * row_height,
+            )
+        )
+        first += block_rows
+    return blocks
@@ -0,0 +1,115 @@
+"""
+    Writer for drawing tables.
+
+    The cell contents are written first, the formatting is applied column by column
+    afterwards. The drafting API has neither bulk writes nor a column or table wide font
+    size and alignment: Each cell costs one call for its contents, each formatted cell up
+    to three more (cell object, font size, alignment). Unformatted columns and rows that
+    are already formatted cost no formatting calls. Table computation and (optionally) the
+    display refresh are suspended while writing, so CATIA updates the table once instead
+    of after each call.
+"""
+
+from contextlib import contextmanager
+from typing import Any
+from typing import Iterator
+from typing import Sequence
+
+from models.tolerance_model import ColumnFormatModel
+from pytia.log import log
+
+# CatTableComputeMode
+TABLE_COMPUTE_ON = 0
+TABLE_COMPUTE_OFF = 1
+
+
+class TableWriter:
+    """Writes rows of strings into a drawing table, cell by cell."""
+
+    def __init__(
+        self,
+        table: Any,
+        formats: Sequence[ColumnFormatModel] = (),
+        application: Any | None = None,
+    ) -> None:
+        """
+        Inits the writer.
+
+        Args:
+            table (Any): The drawing table.
+            formats (Sequence[ColumnFormatModel], optional): The format of each column, \
+                columns without format keep the default format. Defaults to ().
+            application (Any | None, optional): The application. If given, the display \
+                refresh is suspended while writing. Defaults to None.
+        """
+        self.table = table
+        self.formats = formats
+        self.application = application
+        self._suspended = False
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """
+        Suspends the table computation and the display refresh, restores both after. \
+            Nested calls don't suspend again.
+        """
+        if self._suspended:
+            yield
+            return
+
+        compute_mode = self.table.compute_mode
+        refresh_display = None
+        if self.application is not None:
+            refresh_display = self.application.refresh_display
+            if refresh_display:
+                self.application.refresh_display = False
+        if compute_mode != TABLE_COMPUTE_OFF:
+            self.table.compute_mode = TABLE_COMPUTE_OFF
+        self._suspended = True
+        try:
+            yield
+        finally:
+            self._suspended = False
+            if compute_mode != TABLE_COMPUTE_OFF:
+                self.table.compute_mode = compute_mode
+            if refresh_display:
+                self.application.refresh_display = refresh_display
+
+    def write(
+        self,
+        rows: Sequence[Sequence[str]],
+        first_row: int = 1,
+        apply_formats: bool = True,
+    ) -> None:
+        """
+        Writes the rows into the table and formats them.
+
+        Args:
+            rows (Sequence[Sequence[str]]): The cell strings, row by row.
+            first_row (int, optional): The table row of the first row. Defaults to 1.
+            apply_formats (bool, optional): Applies the column formats to the rows. Rows that \
+                have already been formatted only need their contents. Defaults to True.
+        """
+        with self.suspended():
+            for row, values in enumerate(rows, first_row):
+                for column, value in enumerate(values, 1):
+                    self.table.set_cell_string(row, column, value)
+            if apply_formats:
+                self.format_rows(first_row, len(rows))
+        log.debug(f"Wrote {len(rows)} table rows.")
+
+    def format_rows(self, first_row: int, count: int) -> None:
+        """
+        Applies the column formats to the given rows.
+
+        Args:
+            first_row (int): The first row to format.
+            count (int): The number of rows to format.
+        """
+        for column, column_format in enumerate(self.formats, 1):
+            for row in range(first_row, first_row + count):
+                if column_format.font_size is not None:
+                    cell = self.table.get_cell_object(row, column)
+                    cell.set_font_size(0, 0, column_format.font_size)
+                if column_format.alignment is not None:
+                    self.table.set_cell_alignment(row, column, column_format.alignment)
@@ -0,0 +1,152 @@
+"""
+    Columnar representation of tolerated dimensions.
+
+    Holds the values, deviations and precisions of all tolerated dimensions as NumPy arrays
+    (a structure of arrays), so that limits, rounding to the precision of each dimension
+    and deduplication are computed in vectorized form. This pays off for drawings with
+    thousands of dimensions, see `ToleranceTools.prepare_table_data`.
+
+    NumPy is opt-in: It's no requirement of the app and isn't installed by it. If it's
+    not installed, `HAS_NUMPY` is False and the tolerance tools fall back to the
+    row-by-row implementation.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+from typing import List
+
+from models.tolerance_model import ToleranceModel
+from models.tolerance_model import ToleranceTableModel
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+
+# The base value is displayed with 3 decimals, the limits with 4. Dimensions are
+# duplicates if their displayed base value and tolerance are equal.
+BASE_SCALE = 1_000
+
+
+class ToleranceColumns:
+    """The tolerated dimensions as structure of arrays."""
+
+    def __init__(
+        self,
+        value: np.ndarray,
+        upper: np.ndarray,
+        lower: np.ndarray,
+        precision: np.ndarray,
+        tolerance: np.ndarray,
+    ) -> None:
+        """
+        Inits the columns. All arrays must have the same length.
+
+        Args:
+            value (np.ndarray): The nominal values (float).
+            upper (np.ndarray): The upper deviations (float).
+            lower (np.ndarray): The lower deviations (float).
+            precision (np.ndarray): The display precisions (float).
+            tolerance (np.ndarray): The tolerance names, e.g. `H7` (str).
+        """
+        self.value = value
+        self.upper = upper
+        self.lower = lower
+        self.precision = precision
+        self.tolerance = tolerance
+
+    @classmethod
+    def from_dimensions(cls, dimensions: Iterable[ToleranceModel]) -> ToleranceColumns:
+        """Returns the columns of the given tolerated dimensions."""
+        dimensions = list(dimensions)
+        return cls(
+            value=np.fromiter((d.value for d in dimensions), float, len(dimensions)),
+            upper=np.fromiter((d.tol_up_d for d in dimensions), float, len(dimensions)),
+            lower=np.fromiter(
+                (d.tol_low_d for d in dimensions), float, len(dimensions)
+            ),
+            precision=np.fromiter(
+                (d.precision for d in dimensions), float, len(dimensions)
+            ),
+            tolerance=np.array([d.tol_up_s for d in dimensions], dtype=str),
+        )
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    @property
+    def displayed(self) -> np.ndarray:
+        """Returns the values rounded to the precision of each dimension, like CATIA \
+            displays them. Values without a precision are kept."""
+        precision = np.where(self.precision > 0, self.precision, 1.0)
+        return np.where(
+            self.precision > 0, np.round(self.value / precision) * precision, self.value
+        )
+
+    @property
+    def minimum(self) -> np.ndarray:
+        """Returns the lower limits of the displayed values."""
+        return self.displayed + self.lower
+
+    @property
+    def maximum(self) -> np.ndarray:
+        """Returns the upper limits of the displayed values."""
+        return self.displayed + self.upper
+
+    def to_table_rows(
+        self, group: bool = False, show_count: bool = False
+    ) -> List[ToleranceTableModel]:
+        """
+        Returns one table row per unique tolerated value, like \
+            `ToleranceTools.prepare_table_data` (without the header).
+
+        Args:
+            group (bool, optional): Groups the rows by tolerance, ordered by value. \
+                Otherwise the rows keep the order of the dimensions. Defaults to False.
+            show_count (bool, optional): Prefixes the base value of rows with multiple \
+                dimensions with their count. Defaults to False.
+
+        Returns:
+            List[ToleranceTableModel]: The rows.
+        """
+        if not len(self):
+            return []
+
+        # Deduplicate by the displayed base value and the tolerance.
+        value = self.displayed
+        tolerances, tolerance_codes = np.unique(self.tolerance, return_inverse=True)
+        tolerance_codes = tolerance_codes.reshape(-1)
+        # A single integer key per dimension: Sorting it is much faster than sorting
+        # records of value and tolerance. The key is parsed from the displayed text, so
+        # that half-way values are rounded the same way as in the table.
+        texts = np.char.mod("%.3f", value)
+        keys = np.rint(texts.astype(float) * BASE_SCALE).astype(np.int64)
+        keys = keys * len(tolerances) + tolerance_codes
+        _, first, counts = np.unique(keys, return_index=True, return_counts=True)
+
+        if group:
+            order = np.lexsort((value[first], tolerance_codes[first]))
+        else:
+            order = np.argsort(first, kind="stable")
+        first, counts = first[order], counts[order]
+
+        bases = np.char.add(
+            np.char.add(texts[first], " "),
+            self.tolerance[first],
+        )
+        minimums = np.char.mod("%.4f", value[first] + self.lower[first])
+        maximums = np.char.mod("%.4f", value[first] + self.upper[first])
+
+        rows: List[ToleranceTableModel] = []
+        for base, minimum, maximum, count in zip(
+            bases.tolist(), minimums.tolist(), maximums.tolist(), counts.tolist()
+        ):
+            if show_count and count > 1:
+                base = f"{count}× {base}"
+            rows.append(
+                ToleranceTableModel(base=base, min=minimum, max=maximum, count=count)
+            )
+        return rows
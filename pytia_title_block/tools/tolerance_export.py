@@ -0,0 +1,148 @@
+"""
+    Export of the tolerated dimensions as data.
+
+    The dimensions are streamed from the extraction (see
+    `ToleranceTools.iter_tolerated_dimensions`) into the file record by record, no list of
+    all dimensions is built. Supported formats are CSV and JSON Lines (one json object per
+    line). Each record holds the path of the drawing, all fields of the `ToleranceModel`
+    and the limits of size.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import fields
+from pathlib import Path
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
+
+from models.tolerance_model import ToleranceModel
+from pytia.log import log
+
+if TYPE_CHECKING:
+    from tools.tolerance_tools import ToleranceTools
+
+EXPORT_FORMATS = ("csv", "jsonl")
+EXPORT_FIELDS = (
+    "drawing",
+    *(f.name for f in fields(ToleranceModel)),
+    "minimum",
+    "maximum",
+)
+
+
+def get_format(path: str | Path) -> str:
+    """
+    Returns the export format of the file by its suffix.
+
+    Raises:
+        ValueError: The suffix is not one of the `EXPORT_FORMATS`.
+    """
+    fmt = Path(path).suffix.lower().lstrip(".")
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Cannot export to {str(path)!r}: Use one of {', '.join(EXPORT_FORMATS)}."
+        )
+    return fmt
+
+
+def iter_records(
+    drawing: str, dimensions: Iterable[ToleranceModel]
+) -> Iterator[Tuple[Any, ...]]:
+    """Yields the record of each dimension, in the order of the `EXPORT_FIELDS`."""
+    names = EXPORT_FIELDS[1:-2]
+    for dimension in dimensions:
+        yield (
+            drawing,
+            *(getattr(dimension, name) for name in names),
+            round(dimension.value + dimension.tol_low_d, 6),
+            round(dimension.value + dimension.tol_up_d, 6),
+        )
+
+
+def write_csv(file: IO[str], records: Iterable[Tuple[Any, ...]], header: bool) -> int:
+    """Writes the records as CSV rows, returns the number of records."""
+    writer = csv.writer(file, lineterminator="\n")
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    count = 0
+    for record in records:
+        writer.writerow(record)
+        count += 1
+    return count
+
+
+def write_jsonl(
+    file: IO[str],
+    records: Iterable[Tuple[Any, ...]],
+    header: bool,  # pylint: disable=W0613
+) -> int:
+    """Writes the records as JSON Lines, returns the number of records. JSON Lines have \
+        no header."""
+    count = 0
+    for record in records:
+        file.write(json.dumps(dict(zip(EXPORT_FIELDS, record)), ensure_ascii=False))
+        file.write("\n")
+        count += 1
+    return count
+
+
+WRITERS: Dict[str, Callable[[IO[str], Iterable[Tuple[Any, ...]], bool], int]] = {
+    "csv": write_csv,
+    "jsonl": write_jsonl,
+}
+
+
+def export_tolerances(
+    tools: ToleranceTools,
+    file: IO[str],
+    fmt: str,
+    header: bool = True,
+) -> int:
+    """
+    Streams the tolerated dimensions of the drawing into the open file.
+
+    Uses the same dimensions as the tolerance table: With the `general` setting the \
+        dimensions with the general tolerance of the title block are exported as well.
+
+    Args:
+        tools (ToleranceTools): The tolerance tools of the drawing.
+        file (IO[str]): The file, opened as text with `newline=""`.
+        fmt (str): The format, one of the `EXPORT_FORMATS`.
+        header (bool, optional): Writes the CSV header. Set it to False for all but the \
+            first drawing of a file. Defaults to True.
+
+    Returns:
+        int: The number of exported dimensions.
+    """
+    drawing = str(tools.doc.path)
+    dimensions = tools.iter_tolerated_dimensions(
+        tools.get_configured_general_tolerance()
+    )
+    count = WRITERS[fmt](file, iter_records(drawing, dimensions), header)
+    log.info(f"Exported {count} tolerated dimensions of {drawing!r} as {fmt}.")
+    return count
+
+
+def export_to_file(tools: ToleranceTools, path: str | Path) -> int:
+    """
+    Exports the tolerated dimensions of the drawing into a new file, see \
+        `export_tolerances`. The format is given by the suffix of the path.
+
+    Args:
+        tools (ToleranceTools): The tolerance tools of the drawing.
+        path (str | Path): The path of the file, `.csv` or `.jsonl`.
+
+    Returns:
+        int: The number of exported dimensions.
+    """
+    fmt = get_format(path)
+    with open(path, "w", encoding="utf8", newline="") as f:
+        return export_tolerances(tools, f, fmt)
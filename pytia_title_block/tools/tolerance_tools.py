@@ -2,17 +2,59 @@
     Tool for creating tolerance tables.
 """
 
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import replace
+from difflib import SequenceMatcher
 from tkinter import messagebox as tkmsg
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Tuple
 
+from const import TOLERANCE_COLUMNAR_THRESHOLD
+from const import TOLERANCE_TABLE_ALIGNMENT
 from const import TOLERANCE_TABLE_CELL_HEIGHT
 from const import TOLERANCE_TABLE_CELL_WIDTH
+from const import TOLERANCE_TABLE_FONT_SIZE
+from const import TOLERANCE_TABLE_GAP
 from const import TOLERANCE_TABLE_NAME
+from const import TOLERANCE_TABLE_TOP_MARGIN
 from helper.translators import translate_paper_size
 from loader.doc_loader import DocumentLoader
+from models.placement_model import BoxModel
+from models.tolerance_model import ColumnFormatModel
+from models.tolerance_model import GeneralToleranceModel
+from models.tolerance_model import TableBlockModel
 from models.tolerance_model import ToleranceModel
 from models.tolerance_model import ToleranceTableModel
+from pytia.log import log
 from resources import resource
+from tools import iso286
+from tools import iso2768
+from tools.placement import SheetIndex
+from tools.placement import sheet_indexes
+from tools.placement import text_box
+from tools.table_layout import layout_blocks
+from tools.table_writer import TableWriter
+from tools.tolerance_columns import HAS_NUMPY
+from tools.tolerance_columns import ToleranceColumns
+
+if TYPE_CHECKING:
+    from pycatia.drafting_interfaces.drawing_table import DrawingTable
+
+# Deviations of CATIA may differ from ISO 286 by rounding, but not by more than 0.5 µm.
+DEVIATION_CHECK_LIMIT = 0.0005
+
+# Dimension types (CatDimType) by their general tolerance of ISO 2768-1. Other types, e.g.
+# chamfers, slopes and coordinates, have no general tolerance.
+DIM_TYPES_LINEAR = frozenset((0, 1, 2, 3, *range(13, 18), *range(20, 29)))
+DIM_TYPES_ANGULAR = frozenset((4,))
+DIM_TYPES_RADIUS = frozenset(range(5, 13))
 
 
 class ToleranceTools:
@@ -21,68 +63,168 @@ class ToleranceTools:
     A tolerance table is a collection of all tolerated dimensions of the active sheet.
     """
 
-    def __init__(self, doc_loader: DocumentLoader) -> None:
+    def __init__(
+        self,
+        doc_loader: DocumentLoader,
+        progress: Callable[[int, int], None] | None = None,
+        local_limits: bool | None = None,
+    ) -> None:
         """
         Inits the class.
 
         Args:
             doc_loader (DocumentLoader): The doc loader instance.
+            progress (Callable[[int, int], None] | None, optional): Called with the number \
+                of read dimensions and the number of all dimensions, while the dimensions \
+                are read. Defaults to None.
+            local_limits (bool | None, optional): Computes the deviations of ISO \
+                tolerances locally (see `iso286`) instead of using the values of CATIA. \
+                Defaults to None: The value of the settings.json.
         """
         self.doc = doc_loader
         self.views = doc_loader.views
+        self.progress = progress
+        self.local_limits = (
+            resource.settings.tables.tolerances.local_limits
+            if local_limits is None
+            else local_limits
+        )
 
     @staticmethod
     def prepare_table_data(
         tolerated_dimensions: List[ToleranceModel],
+        group: bool = False,
+        show_count: bool = False,
+        columnar: bool | None = None,
     ) -> List[ToleranceTableModel]:
         """
         Moves data from the ToleranceModel to the ToleranceTableModel.
-        Does some filtering and creates header cells.
+        Removes duplicates and creates header cells.
+
+        The values are rounded to the precision of each dimension, like CATIA displays \
+            them, the limits are computed from the rounded values. Dimensions are \
+            duplicates if their displayed values and tolerances are equal. The rows are \
+            deduplicated in a single pass, each row holds the number of its dimensions \
+            in `count`.
 
         Args:
-            tolerated_dimensions (List[ToleranceModel]): _description_
+            tolerated_dimensions (List[ToleranceModel]): The tolerated dimensions.
+            group (bool, optional): Groups the rows by tolerance, ordered by value. \
+                Otherwise the rows keep the order of the dimensions. Defaults to False.
+            show_count (bool, optional): Prefixes the base value of rows with multiple \
+                dimensions with their count, e.g. `3× 30.000 H7`. Defaults to False.
+            columnar (bool | None, optional): Computes the rows in vectorized form with \
+                NumPy, see `ToleranceColumns`. Defaults to None: Columnar, if NumPy is \
+                installed and there are many dimensions.
 
         Returns:
-            List[ToleranceTableModel]: _description_
+            List[ToleranceTableModel]: The header row followed by one row per unique \
+                tolerated value.
         """
-        table_data: List[ToleranceTableModel] = []
-
         # Add table header
-        table_data.append(
+        table_data: List[ToleranceTableModel] = [
             ToleranceTableModel(
                 base=resource.settings.tables.tolerances.header_base,
                 min=resource.settings.tables.tolerances.header_min,
                 max=resource.settings.tables.tolerances.header_max,
             )
-        )
+        ]
+
+        if columnar is None:
+            columnar = (
+                HAS_NUMPY and len(tolerated_dimensions) >= TOLERANCE_COLUMNAR_THRESHOLD
+            )
+        if columnar:
+            columns = ToleranceColumns.from_dimensions(tolerated_dimensions)
+            table_data.extend(columns.to_table_rows(group=group, show_count=show_count))
+            return table_data
+
+        rows: Dict[Tuple[str, str], Tuple[ToleranceModel, float]] = {}
+        counts: Counter[Tuple[str, str]] = Counter()
 
-        # Add table data
         for item in tolerated_dimensions:
-            base = f"{item.value:.3f} {item.tol_up_s}"
-            min = f"{(item.value+item.tol_low_d):.4f}"
-            max = f"{(item.value+item.tol_up_d):.4f}"
-
-            # Don't add the same value twice
-            add = True
-            for datum in table_data:
-                if datum.base == base:
-                    add = False
-            if add:
-                table_data.append(ToleranceTableModel(base=base, min=min, max=max))
+            value = (
+                round(item.value / item.precision) * item.precision
+                if item.precision > 0
+                else item.value
+            )
+            key = (f"{value:.3f}", item.tol_up_s)
+            counts[key] += 1
+            rows.setdefault(key, (item, value))
+
+        keys: Iterable[Tuple[str, str]] = rows
+        if group:
+            keys = sorted(rows, key=lambda k: (k[1], rows[k][1]))
+
+        # Add table data
+        for key in keys:
+            (item, value), count = rows[key], counts[key]
+            base = f"{key[0]} {key[1]}"
+            if show_count and count > 1:
+                base = f"{count}× {base}"
+            table_data.append(
+                ToleranceTableModel(
+                    base=base,
+                    min=f"{(value+item.tol_low_d):.4f}",
+                    max=f"{(value+item.tol_up_d):.4f}",
+                    count=count,
+                )
+            )
 
         return table_data
 
-    def get_all_tolerated_dimensions(self) -> List[ToleranceModel]:
+    def iter_tolerated_dimensions(
+        self, general: GeneralToleranceModel | None = None
+    ) -> Iterator[ToleranceModel]:
         """
-        Returns all dimensions that have a tolerated value of type `2`.
+        Yields all dimensions that have a tolerated value of type `2`, while they are read.
 
-        Returns:
-            List[ToleranceModel]: All tolerated dimensions.
+        Each view and each value object is resolved once, and the tolerance type is \
+            checked before anything else is read: An untoleranced dimension costs two COM \
+            calls, a toleranced dimension six. Reports the progress to the `progress` \
+            callback, if given.
+
+        Args:
+            general (GeneralToleranceModel | None, optional): The general tolerance class. \
+                If given, all other dimensions are yielded as well: Untoleranced \
+                dimensions with the deviations of ISO 2768-1 by their type (tolerance \
+                type `0`, e.g. `±0.2`, see `_get_general_tolerances`), numerically \
+                toleranced dimensions with their own deviations. Defaults to None.
+
+        Yields:
+            Iterator[ToleranceModel]: The tolerated dimensions.
         """
-        dimensions = []
+        collections = []
         for view_index in range(1, self.views.count + 1):
-            for dim_index in range(1, self.views.item(view_index).dimensions.count + 1):
-                dimension = self.views.item(view_index).dimensions.item(dim_index)
+            dimensions = self.views.item(view_index).dimensions
+            collections.append((dimensions, dimensions.count))
+        total = sum(count for _, count in collections)
+
+        done = 0
+        for dimensions, count in collections:
+            for dim_index in range(1, count + 1):
+                dimension = dimensions.item(dim_index)
+                tolerances = dimension.get_tolerances()
+                done += 1
+                if self.progress is not None:
+                    self.progress(done, total)
+
+                # Tolerance type 2 means tolerated with iso value, 0 untoleranced.
+                if tolerances[0] != 2 and general is None:
+                    continue
+
+                value = dimension.get_value()
+                nominal = value.value
+                if tolerances[0] == 0:
+                    assert general is not None
+                    if (
+                        general_tolerances := self._get_general_tolerances(
+                            dimension.dim_type, nominal, general
+                        )
+                    ) is None:
+                        log.debug(f"No general tolerance for {value.name!r}.")
+                        continue
+                    tolerances = general_tolerances
                 (
                     tol_type,
                     tol_name,
@@ -91,35 +233,143 @@ class ToleranceTools:
                     tol_up_d,
                     tol_low_d,
                     tol_display,
-                ) = dimension.get_tolerances()
-
-                # Tolerance type 2 means tolerated with iso value.
-                if tol_type == 2:
-                    dimensions.append(
-                        ToleranceModel(
-                            name=dimension.get_value().name,
-                            value=dimension.get_value().value,
-                            precision=dimension.get_value().get_format_precision(1),
-                            tol_type=tol_type,
-                            tol_name=tol_name,
-                            tol_up_s=tol_up_s,
-                            tol_low_s=tol_low_s,
-                            tol_up_d=tol_up_d,
-                            tol_low_d=tol_low_d,
-                            tol_display=tol_display,
-                        )
+                ) = tolerances
+                if self.local_limits and tol_type == 2:
+                    tol_up_d, tol_low_d = self._check_deviations(
+                        tol_up_s, nominal, tol_up_d, tol_low_d
                     )
-        return dimensions
+                yield ToleranceModel(
+                    name=value.name,
+                    value=nominal,
+                    precision=value.get_format_precision(1),
+                    tol_type=tol_type,
+                    tol_name=tol_name,
+                    tol_up_s=tol_up_s,
+                    tol_low_s=tol_low_s,
+                    tol_up_d=tol_up_d,
+                    tol_low_d=tol_low_d,
+                    tol_display=tol_display,
+                )
 
-    def add_table(self) -> None:
+    @staticmethod
+    def _get_general_tolerances(
+        dim_type: int, nominal: float, general: GeneralToleranceModel
+    ) -> Tuple[int, str, str, str, float, float, int] | None:
         """
-        Adds the table to the sheet's background view according to the config of the settings.json.
-        Removes existing tolerance tables first.
+        Returns the tolerances of an untoleranced dimension by the general tolerance of \
+            ISO 2768-1, in the form of `get_tolerances`.
+
+        Linear dimensions and diameters use the table of linear dimensions, radii the \
+            table of external radii and angles the table of angular dimensions. The \
+            length of the legs of an angle isn't known, its deviation is the one of the \
+            shortest legs (the widest one).
+
+        Args:
+            dim_type (int): The type of the dimension (CatDimType).
+            nominal (float): The nominal value, in mm or degrees.
+            general (GeneralToleranceModel): The general tolerance class.
+
+        Returns:
+            Tuple[int, str, str, str, float, float, int] | None: The tolerances, None if \
+                the type of the dimension or its nominal value isn't covered.
+        """
+        if general.linear is None:
+            return None
+        if dim_type in DIM_TYPES_LINEAR:
+            deviation = iso2768.get_linear_deviation(general.linear, nominal)
+        elif dim_type in DIM_TYPES_RADIUS:
+            deviation = iso2768.get_radius_deviation(general.linear, nominal)
+        elif dim_type in DIM_TYPES_ANGULAR:
+            deviation = iso2768.get_angular_deviation(general.linear)
+        else:
+            return None
+        if deviation is None:
+            return None
+
+        if dim_type in DIM_TYPES_ANGULAR:
+            text = f"±{iso2768.format_angle(deviation)}"
+        else:
+            text = f"±{deviation:g}"
+        return 0, general.name, text, text, deviation, -deviation, 0
+
+    @staticmethod
+    def _check_deviations(
+        tolerance: str, nominal: float, upper: float, lower: float
+    ) -> Tuple[float, float]:
+        """
+        Returns the deviations of the ISO tolerance computed by `iso286`, or the given \
+            deviations of CATIA if the tolerance is not supported. Logs a warning if the \
+            deviations of CATIA don't match.
+        """
+        if (deviations := iso286.get_deviations(tolerance, nominal)) is None:
+            return upper, lower
+        if (
+            abs(deviations[0] - upper) > DEVIATION_CHECK_LIMIT
+            or abs(deviations[1] - lower) > DEVIATION_CHECK_LIMIT
+        ):
+            log.warning(
+                f"Deviations of {nominal} {tolerance} don't match ISO 286: "
+                f"CATIA {upper:+.4f}/{lower:+.4f}, "
+                f"ISO {deviations[0]:+.4f}/{deviations[1]:+.4f}."
+            )
+        return deviations
+
+    def get_all_tolerated_dimensions(
+        self, general: GeneralToleranceModel | None = None
+    ) -> List[ToleranceModel]:
+        """
+        Returns all dimensions that have a tolerated value of type `2`, see \
+            `iter_tolerated_dimensions`.
+
+        Args:
+            general (GeneralToleranceModel | None, optional): The general tolerance class, \
+                see `iter_tolerated_dimensions`. Defaults to None.
+
+        Returns:
+            List[ToleranceModel]: All tolerated dimensions.
+        """
+        return list(self.iter_tolerated_dimensions(general))
+
+    def get_general_tolerance(self) -> GeneralToleranceModel | None:
+        """
+        Returns the general tolerance class of the `tolerance` field of the title block.
+
+        Returns:
+            GeneralToleranceModel | None: The class, None if the field is empty or isn't \
+                an ISO 2768 general tolerance.
+        """
+        text = self.doc.get_text_value_by_name(resource.title_block_items.tolerance)
+        if (general := iso2768.parse_class(text)) is None:
+            log.info(f"No ISO 2768 general tolerance in {text!r}.")
+        return general
+
+    def get_configured_general_tolerance(self) -> GeneralToleranceModel | None:
+        """
+        Returns the general tolerance class of the title block if the `general` setting \
+            is enabled, see `get_general_tolerance`. Returns None otherwise.
+        """
+        if not resource.settings.tables.tolerances.general:
+            return None
+        return self.get_general_tolerance()
+
+    def add_table(self, suspend_refresh: bool = True) -> None:
         """
-        self.remove_table()
+        Adds the table to the sheet's background view according to the config of the settings.json.
+        Rows that don't fit the sheet are spread over several tables, see `get_layout`.
+        Updates existing tolerance tables instead, see `update_table`.
 
-        dimensions = self.get_all_tolerated_dimensions()
-        data = self.prepare_table_data(dimensions)
+        Args:
+            suspend_refresh (bool, optional): Suspends the display refresh of CATIA while \
+                the table is written. Defaults to True.
+        """
+        dimensions = self.get_all_tolerated_dimensions(
+            self.get_configured_general_tolerance()
+        )
+        data = self.prepare_table_data(
+            dimensions,
+            group=resource.settings.tables.tolerances.group,
+            show_count=resource.settings.tables.tolerances.show_count,
+        )
 
         if not data:
             tkmsg.showinfo(
@@ -128,49 +378,260 @@ class ToleranceTools:
             )
             return
 
-        paper_size = translate_paper_size(self.doc.sheets.active_sheet.paper_size)
-        table_x = 0
-        table_y = 0
-        for position in resource.settings.tables.tolerances.positions:
-            if position.size == paper_size:
-                table_x = position.x - 3 * TOLERANCE_TABLE_CELL_WIDTH
-                table_y = position.y + len(data) * TOLERANCE_TABLE_CELL_HEIGHT
-                break
-
-        # Add the table to the sheet
-        table = self.doc.background_view.tables.add(
-            table_x,
-            table_y,
-            len(data),
-            3,
-            TOLERANCE_TABLE_CELL_HEIGHT,
-            TOLERANCE_TABLE_CELL_WIDTH,
+        header, *rows = [(datum.base, datum.min, datum.max) for datum in data]
+        blocks = self.get_layout(len(rows))
+        tables = self.find_tables()
+        # All tables are moved if the number of tables changes.
+        relayout = len(tables) != len(blocks)
+        moved = relayout
+
+        for index, _ in sorted(tables[len(blocks) :], key=lambda t: t[0], reverse=True):
+            self.doc.background_view.tables.remove(index)
+
+        for block in blocks:
+            block_rows = [header, *rows[block.first : block.first + block.rows]]
+            if block.index < len(tables):
+                moved |= self.update_table(
+                    tables[block.index][1],
+                    block_rows,
+                    block,
+                    move=relayout,
+                    suspend_refresh=suspend_refresh,
+                )
+                continue
+
+            # Add the table to the sheet
+            table = self.doc.background_view.tables.add(
+                block.x,
+                block.y,
+                len(block_rows),
+                3,
+                TOLERANCE_TABLE_CELL_HEIGHT,
+                TOLERANCE_TABLE_CELL_WIDTH,
+            )
+            table.name = self._get_table_name(block.index)
+
+            # Fill the table with the data
+            self._get_writer(table, suspend_refresh).write(block_rows)
+            moved = True
+
+        if moved:
+            self._fit_notes(blocks)
+        # The tables and the notes are obstacles of other placements.
+        sheet_indexes.invalidate(self.doc)
+
+    def update_table(
+        self,
+        table: DrawingTable,
+        rows: List[Tuple[str, str, str]],
+        block: TableBlockModel,
+        move: bool = False,
+        suspend_refresh: bool = True,
+    ) -> bool:
+        """
+        Updates the existing tolerance table with the given rows: Only rows that differ \
+            are inserted, deleted or rewritten. The table is moved only if the number of \
+            rows changes, or if `move` is True.
+
+        Args:
+            table (DrawingTable): The tolerance table.
+            rows (List[Tuple[str, str, str]]): The cell strings, including the header.
+            block (TableBlockModel): The block of the table, see `get_layout`.
+            move (bool, optional): Moves the table to the position of the block, even if \
+                the number of rows doesn't change. Defaults to False.
+            suspend_refresh (bool, optional): Suspends the display refresh of CATIA while \
+                the table is written. Defaults to True.
+
+        Returns:
+            bool: True if the table has been moved.
+        """
+        existing = self.read_table(table)
+        move |= len(existing) != len(rows)
+        if existing == rows and not move:
+            log.info(f"Tolerance table {block.index + 1} is up to date.")
+            return False
+
+        writer = self._get_writer(table, suspend_refresh)
+        matcher = SequenceMatcher(a=existing, b=rows, autojunk=False)
+        with writer.suspended():
+            # Apply the changes from the bottom up, so that the row numbers of the
+            # pending changes stay valid.
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag == "equal":
+                    continue
+                common = min(i2 - i1, j2 - j1)
+                writer.write(
+                    rows[j1 : j1 + common], first_row=i1 + 1, apply_formats=False
+                )
+                for row in range(i2, i1 + common, -1):
+                    table.remove_row(row)
+                inserted = rows[j1 + common : j2]
+                for index in range(len(inserted)):
+                    # Each row is added below the previous one.
+                    table.add_row(i1 + common + index)
+                    table.set_row_size(
+                        i1 + common + index + 1, TOLERANCE_TABLE_CELL_HEIGHT
+                    )
+                writer.write(inserted, first_row=i1 + common + 1)
+
+            if move:
+                table.x, table.y = block.x, block.y
+        log.info(
+            f"Updated tolerance table {block.index + 1}: {len(existing)} rows before, "
+            f"{len(rows)} rows now."
         )
-        table.name = TOLERANCE_TABLE_NAME
+        return move
 
-        # Fill the table with the data
-        for row, datum in enumerate(data):
-            table.set_cell_string(row + 1, 1, datum.base)
-            table.set_cell_string(row + 1, 2, str(datum.min))
-            table.set_cell_string(row + 1, 3, str(datum.max))
+    @staticmethod
+    def read_table(table: DrawingTable) -> List[Tuple[str, ...]]:
+        """Returns the cell strings of the table, row by row."""
+        columns = table.number_of_columns
+        return [
+            tuple(
+                table.get_cell_string(row, column) for column in range(1, columns + 1)
+            )
+            for row in range(1, table.number_of_rows + 1)
+        ]
 
-            for col in range(3):
-                cell = table.get_cell_object(row + 1, col + 1)
-                cell.set_font_size(0, 0, 2)
-                table.set_cell_alignment(row + 1, col + 1, 4)
+    @staticmethod
+    def _get_table_name(index: int) -> str:
+        """Returns the name of the n-th tolerance table, e.g. `tolerance_table.2`."""
+        return (
+            TOLERANCE_TABLE_NAME
+            if index == 0
+            else f"{TOLERANCE_TABLE_NAME}.{index + 1}"
+        )
 
-        # Fit the notes above the table
-        notes = self.doc.get_text_by_name(resource.title_block_items.notes)
-        if notes and notes.y < table_y + 2.5:
-            notes.y = table_y + 2.5
+    def find_tables(self) -> List[Tuple[int, DrawingTable]]:
+        """
+        Returns the tolerance tables of the background view with their index in the \
+            tables collection, in the order of their names. Only the tables of an \
+            unbroken sequence of names are returned, see `_get_table_name`.
+        """
+        found: Dict[str, Tuple[int, DrawingTable]] = {}
+        for index, table in enumerate(self.doc.background_view.tables):
+            name = table.name
+            if name == TOLERANCE_TABLE_NAME or name.startswith(
+                f"{TOLERANCE_TABLE_NAME}."
+            ):
+                found[name] = (index + 1, table)
+
+        tables: List[Tuple[int, DrawingTable]] = []
+        while (name := self._get_table_name(len(tables))) in found:
+            tables.append(found[name])
+        return tables
 
     def remove_table(self) -> None:
         """Removes existing tolerance tables."""
-        rm_index = None
+        for index, _ in sorted(self.find_tables(), key=lambda t: t[0], reverse=True):
+            self.doc.background_view.tables.remove(index)
 
-        for index, table in enumerate(self.doc.background_view.tables):
-            if table.name == TOLERANCE_TABLE_NAME:
-                rm_index = index + 1
+    def get_layout(self, rows: int) -> List[TableBlockModel]:
+        """
+        Returns the layout of the tolerance tables for the given number of rows (without \
+            the header), according to the positions of the settings.json.
+
+        The available height is given by the position (`max_height`) or reaches from the \
+            anchor to the top of the sheet, minus a margin for the frame and the notes. \
+            Rows that don't fit are spread over several tables side by side. With \
+            `avoid_collisions` the tables are moved to the nearest free position, see \
+            `tools.placement`.
+
+        Args:
+            rows (int): The number of rows, without the header.
+
+        Returns:
+            List[TableBlockModel]: The blocks of the tables.
+        """
+        sheet = self.doc.sheets.active_sheet
+        paper_size = translate_paper_size(sheet.paper_size)
+        for position in resource.settings.tables.tolerances.positions:
+            if position.size == paper_size:
+                available_height = (
+                    position.max_height
+                    if position.max_height is not None
+                    else sheet.get_paper_height()
+                    - position.y
+                    - TOLERANCE_TABLE_TOP_MARGIN
+                )
+                blocks = layout_blocks(
+                    rows,
+                    anchor_x=position.x,
+                    anchor_y=position.y,
+                    available_height=available_height,
+                    row_height=TOLERANCE_TABLE_CELL_HEIGHT,
+                    block_width=3 * TOLERANCE_TABLE_CELL_WIDTH,
+                    gap=TOLERANCE_TABLE_GAP,
+                )
+                if resource.settings.tables.tolerances.avoid_collisions:
+                    blocks = self._place_blocks(blocks)
+                return blocks
+        return [TableBlockModel(index=0, first=0, rows=rows, x=0, y=0)]
+
+    def _get_sheet_index(self) -> SheetIndex:
+        # The tolerance tables and the notes are placed, they are no obstacles.
+        return sheet_indexes.get(
+            self.doc,
+            exclude=(
+                resource.title_block_items.notes,
+                TOLERANCE_TABLE_NAME,
+                f"{TOLERANCE_TABLE_NAME}.*",
+            ),
+        )
+
+    @staticmethod
+    def _get_block_box(block: TableBlockModel) -> BoxModel:
+        return BoxModel(
+            x_min=block.x,
+            x_max=block.x + 3 * TOLERANCE_TABLE_CELL_WIDTH,
+            y_min=block.y - (block.rows + 1) * TOLERANCE_TABLE_CELL_HEIGHT,
+            y_max=block.y,
+        )
+
+    def _place_blocks(self, blocks: List[TableBlockModel]) -> List[TableBlockModel]:
+        """Moves all blocks by the same offset to the nearest free position."""
+        boxes = [self._get_block_box(block) for block in blocks]
+        group = BoxModel(
+            x_min=min(box.x_min for box in boxes),
+            x_max=max(box.x_max for box in boxes),
+            y_min=min(box.y_min for box in boxes),
+            y_max=max(box.y_max for box in boxes),
+        )
+        if (free := self._get_sheet_index().find_free(group)) is None:
+            return blocks
+        dx, dy = free.x_min - group.x_min, free.y_min - group.y_min
+        return [replace(block, x=block.x + dx, y=block.y + dy) for block in blocks]
+
+    def _get_writer(self, table: DrawingTable, suspend_refresh: bool) -> TableWriter:
+        # All columns share the same format
+        column_format = ColumnFormatModel(
+            font_size=TOLERANCE_TABLE_FONT_SIZE, alignment=TOLERANCE_TABLE_ALIGNMENT
+        )
+        return TableWriter(
+            table,
+            formats=[column_format] * 3,
+            application=self.doc.application if suspend_refresh else None,
+        )
+
+    def _fit_notes(self, blocks: List[TableBlockModel]) -> None:
+        """
+        Moves the notes above the tables. With `avoid_collisions` the notes are moved to \
+            the nearest position, where they overlap neither the tables nor the sheet's \
+            other elements.
+        """
+        notes = self.doc.get_text_by_name(resource.title_block_items.notes)
+        if not notes:
+            return
+        table_y = max(block.y for block in blocks)
+        y = max(notes.y, table_y + 2.5)
+
+        if resource.settings.tables.tolerances.avoid_collisions:
+            box = text_box(notes.x, y, notes.text)
+            tables = [self._get_block_box(block) for block in blocks]
+            if (
+                free := self._get_sheet_index().find_free(box, extra=tables)
+            ) is not None:
+                notes.x, y = free.x_min, free.y_min
 
-        if rm_index is not None:
-            self.doc.background_view.tables.remove(rm_index)
+        if notes.y != y:
+            notes.y = y
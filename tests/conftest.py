@@ -0,0 +1,95 @@
+"""
+    Shared fixtures for the tests against the in-memory CATIA backend.
+"""
+
+from typing import Dict
+
+import pytest
+
+from pytia_title_block.backend.fake import FakeApplication
+from pytia_title_block.backend.fake import FakeBackend
+from pytia_title_block.backend.fake import FakeDimension
+from pytia_title_block.backend.fake import FakeDrawingDocument
+from pytia_title_block.backend.fake import FakeProduct
+from pytia_title_block.backend.fake import FakeSession
+from pytia_title_block.backend.fake import create_drawing
+from pytia_title_block.resources import resource
+
+DRAWING_PATH = "C:\\drawings\\P-001.CATDrawing"
+PART_PATH = "C:\\parts\\P-001.CATPart"
+
+
+def title_block_texts(**values: str) -> Dict[str, str]:
+    """Returns the texts of a title block, mapped by component name."""
+    items = resource.title_block_items
+    texts = {name: "-" for name in items.values}
+    for key, value in values.items():
+        texts[getattr(items, key)] = value
+    return texts
+
+
+def tolerated_dimension(
+    session: FakeSession,
+    name: str,
+    value: float,
+    tol_name: str = "H7",
+    upper: float = 0.021,
+    lower: float = 0.0,
+) -> FakeDimension:
+    """Returns a dimension with an ISO tolerance (tolerance type 2)."""
+    return FakeDimension(
+        session,
+        name,
+        value,
+        precision=0.001,
+        tolerances=(2, tol_name, tol_name, "", upper, lower, 0),
+    )
+
+
+@pytest.fixture
+def product() -> FakeProduct:
+    """A part with all properties of the properties.json set."""
+    props = resource.props
+    return FakeProduct(
+        FakeSession(),
+        PART_PATH,
+        part_number="P-001",
+        definition="Shaft",
+        revision="2",
+        properties={
+            props.product: "M-100",
+            props.material: "1.4301",
+            props.base_size: "D30x120",
+            props.tolerance: "ISO 2768 1-m 2-K",
+            props.creator_3d: "admin",
+        },
+    )
+
+
+@pytest.fixture
+def application(product: FakeProduct) -> FakeApplication:
+    """The application with the drawing of the product as active document."""
+    application = FakeApplication(product.session)
+    create_drawing(
+        application,
+        DRAWING_PATH,
+        title_block=title_block_texts(partnumber="P-001", revision="1"),
+        product=product,
+        dimensions=[
+            lambda s: tolerated_dimension(s, "Length.1", 30.0),
+            lambda s: tolerated_dimension(s, "Length.2", 12.0, "g6", -0.006, -0.017),
+            lambda s: tolerated_dimension(s, "Length.3", 30.0),
+            lambda s: FakeDimension(s, "Length.4", 120.0),
+        ],
+    )
+    return application
+
+
+@pytest.fixture
+def backend(application: FakeApplication) -> FakeBackend:
+    return FakeBackend(application)
+
+
+@pytest.fixture
+def drawing(backend: FakeBackend) -> FakeDrawingDocument:
+    return backend.get_active_drawing()
@@ -0,0 +1,262 @@
+"""
+    Test the headless batch mode against the in-memory CATIA backend.
+"""
+
+import json
+from dataclasses import replace
+
+import pytest
+
+from tests.conftest import title_block_texts
+
+from pytia_title_block.backend.fake import FakeApplication
+from pytia_title_block.backend.fake import FakeBackend
+from pytia_title_block.backend.fake import FakeProduct
+from pytia_title_block.backend.fake import create_drawing
+from pytia_title_block.resources import resource
+
+LINKED = "C:\\drawings\\P-100.CATDrawing"
+UNLINKED = "C:\\drawings\\P-200.CATDrawing"
+MISSING = "C:\\drawings\\P-300.CATDrawing"
+
+
+def create_backend() -> FakeBackend:
+    """
+    Creates the backend with a linked and an unlinked drawing, both closed. Must be \
+        picklable.
+    """
+    application = FakeApplication()
+    product = FakeProduct(
+        application.session,
+        "C:\\parts\\P-100.CATPart",
+        part_number="P-100",
+        revision="3",
+        properties={resource.props.product: "M-100"},
+    )
+    create_drawing(
+        application,
+        LINKED,
+        title_block=title_block_texts(partnumber="P-100", revision="2"),
+        product=product,
+    )
+    create_drawing(application, UNLINKED, title_block=title_block_texts())
+    for document in application.documents.files.values():
+        document.closed = True
+    return FakeBackend(application)
+
+
+def test_sync_drawings():
+    from pytia_title_block.batch import run_batch
+    from pytia_title_block.models.batch_model import BatchStatus
+
+    backend = create_backend()
+    results = run_batch([LINKED, UNLINKED, MISSING], backend_factory=lambda: backend)
+
+    assert [r.status for r in results] == [
+        BatchStatus.UPDATED,
+        BatchStatus.SKIPPED,
+        BatchStatus.FAILED,
+    ]
+    items = resource.title_block_items
+    assert results[0].changed[items.revision] == ("2", "3")
+    assert results[0].changed[items.product] == ("-", "M-100")
+    assert items.partnumber not in results[0].changed
+
+    drawing = backend.application.documents.files[LINKED]
+    assert drawing.save_count == 1
+    assert drawing.closed
+
+    # A second run finds the title block in sync and doesn't save the drawing again.
+    results = run_batch([LINKED], backend_factory=lambda: backend)
+    assert results[0].status == BatchStatus.UNCHANGED
+    assert drawing.save_count == 1
+
+
+def test_sync_drawings_in_worker_processes(tmp_path):
+    from pytia_title_block.batch import run_batch
+    from pytia_title_block.batch import write_report
+
+    results = run_batch(
+        [LINKED, UNLINKED, MISSING], backend_factory=create_backend, workers=2
+    )
+    report = json.loads(write_report(results, tmp_path / "report.json").read_text())
+
+    assert report["summary"] == {"updated": 1, "skipped": 1, "failed": 1}
+    assert [r["path"] for r in report["results"]] == [LINKED, UNLINKED, MISSING]
+
+
+def test_sync_shared_catia(monkeypatch):
+    from pytia_title_block import batch
+    from pytia_title_block.models.batch_model import BatchStatus
+
+    # The CATIA application is shared by all workers: The drawings are synced in this
+    # process, the backend of the lambda isn't picklable.
+    backend = create_backend()
+    monkeypatch.setattr(batch, "_create_catia_backend", lambda: backend)
+    results = batch.run_batch([LINKED, UNLINKED], workers=2)
+    assert [r.status for r in results] == [BatchStatus.UPDATED, BatchStatus.SKIPPED]
+
+
+def test_sync_open_drawing():
+    from pytia_title_block.batch import sync_drawing
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.models.batch_model import BatchStatus
+
+    backend = create_backend()
+    documents = backend.application.documents
+    drawing = documents.open(LINKED)
+
+    # The user activates another drawing: The loader keeps the given drawing.
+    documents.open(UNLINKED)
+    doc_loader = DocumentLoader(backend=backend, drawing_document=drawing)
+    assert doc_loader.linked_snapshot is not None
+
+    # A drawing the user had open stays open.
+    assert sync_drawing(backend, LINKED).status == BatchStatus.UPDATED
+    assert not drawing.closed
+    assert drawing.save_count == 1
+
+
+def test_sync_restrictions(monkeypatch):
+    from pytia_title_block import batch
+    from pytia_title_block.models.batch_model import BatchStatus
+
+    backend = create_backend()
+    drawing = backend.application.documents.files[LINKED]
+
+    class Workspace(batch.Workspace):
+        def read_yaml(self) -> None:
+            super().read_yaml()
+            self.elements.editors = ["someone-else"]
+
+    monkeypatch.setattr(batch, "Workspace", Workspace)
+    # The app modules use their own resource instance.
+    settings = batch.resource.settings
+    monkeypatch.setattr(
+        settings,
+        "restrictions",
+        replace(settings.restrictions, allow_all_editors=False),
+    )
+    result = batch.sync_drawing(backend, LINKED)
+    assert result.status == BatchStatus.SKIPPED
+    assert "workspace configuration" in result.message
+    assert drawing.save_count == 0 and drawing.closed
+
+    # A dry run only reads the drawing.
+    result = batch.sync_drawing(backend, LINKED, dry_run=True)
+    assert result.status == BatchStatus.OUT_OF_SYNC
+
+    class OutsideWorkspace(batch.Workspace):
+        def read_yaml(self) -> None:
+            raise batch.PytiaUiToolsOutsideWorkspaceError("No workspace found.")
+
+    monkeypatch.setattr(batch, "Workspace", OutsideWorkspace)
+    result = batch.sync_drawing(backend, LINKED)
+    assert result.status == BatchStatus.SKIPPED
+    assert drawing.save_count == 0 and drawing.closed
+
+
+def test_dry_run():
+    from pytia_title_block.batch import run_batch
+    from pytia_title_block.models.batch_model import BatchStatus
+
+    backend = create_backend()
+    results = run_batch([LINKED], backend_factory=lambda: backend, dry_run=True)
+
+    items = resource.title_block_items
+    assert results[0].status == BatchStatus.OUT_OF_SYNC
+    assert results[0].changed == {
+        items.revision: ("2", "3"),
+        items.product: (None, "M-100"),
+    }
+    assert backend.session.count("DrawingText.text=") == 0
+    assert backend.application.documents.files[LINKED].save_count == 0
+
+
+def test_export(tmp_path):
+    import csv
+    from pathlib import Path
+
+    from tests.conftest import tolerated_dimension
+
+    from pytia_title_block.batch import run_export
+    from pytia_title_block.models.batch_model import BatchStatus
+
+    backend = create_backend()
+    drawing = backend.application.documents.files[LINKED]
+    view = drawing._sheets._items[0]._views._items[2]
+    for index in range(3):
+        view._dimensions._append(
+            tolerated_dimension(
+                backend.application.session, f"Length.{index}", 10 + index
+            )
+        )
+
+    output = tmp_path / "tolerances.csv"
+    results = run_export(
+        [LINKED, UNLINKED, MISSING], output, backend_factory=lambda: backend
+    )
+    assert [(r.status, r.exported) for r in results] == [
+        (BatchStatus.EXPORTED, 3),
+        (BatchStatus.EXPORTED, 0),
+        (BatchStatus.FAILED, 0),
+    ]
+    assert backend.application.documents.files[LINKED].closed
+
+    with open(output, encoding="utf8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 3
+    assert rows[0]["drawing"] == str(Path(LINKED).resolve())
+    assert (rows[0]["name"], rows[0]["tol_name"]) == ("Length.0", "H7")
+    assert (float(rows[0]["minimum"]), float(rows[0]["maximum"])) == (10, 10.021)
+
+    output = tmp_path / "tolerances.jsonl"
+    run_export([LINKED], output, backend_factory=lambda: backend)
+    records = [json.loads(line) for line in output.read_text("utf8").splitlines()]
+    assert [r["name"] for r in records] == ["Length.0", "Length.1", "Length.2"]
+    assert records[2]["maximum"] == 12.021
+
+
+@pytest.mark.parametrize("report", [False, True])
+def test_batch_cli(tmp_path, monkeypatch, report):
+    from pytia_title_block import batch
+
+    backend = create_backend()
+    monkeypatch.setattr(batch, "_create_catia_backend", lambda: backend)
+    monkeypatch.setattr(batch, "LOGS", str(tmp_path / "logs"))
+    argv = [LINKED, UNLINKED]
+    if report:
+        argv += ["--report", str(tmp_path / "report.json")]
+
+    assert batch.run_batch_cli(argv) == 0
+    if report:
+        path = tmp_path / "report.json"
+    else:
+        (path,) = (tmp_path / "logs").glob("batch_*.json")
+    assert json.loads(path.read_text())["summary"] == {"updated": 1, "skipped": 1}
+
+    assert batch.run_batch_cli([MISSING]) == 1
+
+
+@pytest.mark.parametrize("report", [False, True])
+def test_export_cli(tmp_path, monkeypatch, report):
+    from pytia_title_block import batch
+
+    backend = create_backend()
+    monkeypatch.setattr(batch, "_create_catia_backend", lambda: backend)
+    monkeypatch.setattr(batch, "LOGS", str(tmp_path / "logs"))
+    argv = [LINKED, "--output", str(tmp_path / "tolerances.jsonl")]
+    if report:
+        argv += ["--report", str(tmp_path / "report.json")]
+
+    assert batch.run_export_cli(argv) == 0
+    assert (tmp_path / "tolerances.jsonl").exists()
+
+    if report:
+        path = tmp_path / "report.json"
+    else:
+        (path,) = (tmp_path / "logs").glob("export_*.json")
+    assert json.loads(path.read_text())["summary"] == {"exported": 1}
+
+    with pytest.raises(SystemExit):
+        batch.run_export_cli([LINKED, "--output", str(tmp_path / "tolerances.txt")])
@@ -0,0 +1,119 @@
+"""
+    Test the SQLite catalogue of title blocks.
+"""
+
+from datetime import date
+
+from pytia_title_block.models.cache_model import TitleBlockCacheModel
+
+
+def _entry(
+    path: str, linked_path: str | None = None, **values: str
+) -> TitleBlockCacheModel:
+    return TitleBlockCacheModel(
+        path=path,
+        mtime_ns=1,
+        size=1,
+        values=values,
+        linked_path=linked_path,
+        created="2024-01-01T00:00:00",
+    )
+
+
+def test_queries(tmp_path):
+    from pytia_title_block.loader.catalogue import Catalogue
+
+    catalogue = Catalogue(tmp_path / "catalogue.sqlite")
+    catalogue.upsert(
+        _entry(
+            "C:\\a.CATDrawing",
+            "C:\\a.CATPart",
+            product="M-1",
+            release_date="01.02.2024",
+        )
+    )
+    catalogue.upsert(
+        _entry(
+            "C:\\b.CATDrawing",
+            "C:\\b.CATPart",
+            product="M-1",
+            release_date="01.06.2024",
+        )
+    )
+    catalogue.upsert(
+        _entry("C:\\c.CATDrawing", "C:\\c.CATPart", product="M-2", release_date="-")
+    )
+    assert len(catalogue) == 3
+
+    released = catalogue.find(product="M-1", released_after=date(2024, 3, 1))
+    assert [e.path for e in released] == ["C:\\b.CATDrawing"]
+    assert [e.path for e in catalogue.find(product="M-1")] == [
+        "C:\\a.CATDrawing",
+        "C:\\b.CATDrawing",
+    ]
+    assert [e.path for e in catalogue.find_by_linked("C:\\c.CATPart")] == [
+        "C:\\c.CATDrawing"
+    ]
+
+    # Upserting a drawing again replaces it.
+    catalogue.upsert(_entry("C:\\c.CATDrawing", "C:\\c.CATPart", product="M-1"))
+    assert len(catalogue) == 3
+    assert catalogue.get("C:\\c.CATDrawing").get("product") == "M-1"
+
+    catalogue.remove("C:\\c.CATDrawing")
+    assert catalogue.get("C:\\c.CATDrawing") is None
+
+
+def test_scan(tmp_path):
+    from pytia_title_block.loader.catalogue import Catalogue
+    from pytia_title_block.loader.metadata_cache import MetadataCache
+
+    cache = MetadataCache(tmp_path / "cache")
+    catalogue = Catalogue(tmp_path / "catalogue.sqlite")
+    folder = tmp_path / "project"
+    folder.mkdir()
+    cached, uncached = folder / "a.CATDrawing", folder / "b.CATDrawing"
+    cached.write_bytes(b"a")
+    uncached.write_bytes(b"b")
+    cache.store(cached, {"partnumber": "A"})
+
+    count, outdated = catalogue.scan(folder, cache)
+    assert count == 1
+    assert outdated == [uncached]
+    assert catalogue.get(cached).get("partnumber") == "A"
+
+    # Removed drawings are removed from the catalogue.
+    cached.unlink()
+    catalogue.scan(folder, cache)
+    assert len(catalogue) == 0
+
+    # Drawings of a sibling folder with the same prefix are kept.
+    sibling = tmp_path / "project-b"
+    sibling.mkdir()
+    (sibling / "c.CATDrawing").write_bytes(b"c")
+    cache.store(sibling / "c.CATDrawing", {"partnumber": "C"})
+    catalogue.scan(sibling, cache)
+    catalogue.scan(folder, cache)
+    assert catalogue.get(sibling / "c.CATDrawing") is not None
+
+
+def test_schema(tmp_path, monkeypatch):
+    from pytia_title_block.loader import catalogue as catalogue_module
+    from pytia_title_block.loader.catalogue import Catalogue
+
+    catalogue = Catalogue(tmp_path / "catalogue.sqlite")
+    catalogue.upsert(_entry("C:\\a.CATDrawing", product="M-1"))
+
+    # A new title block item without a schema version bump recreates the table.
+    monkeypatch.setattr(catalogue, "columns", [*catalogue.columns, "new_item"])
+    catalogue._create_schema()
+    assert len(catalogue) == 0
+    catalogue.upsert(_entry("C:\\a.CATDrawing", product="M-1", new_item="X"))
+    assert catalogue.get("C:\\a.CATDrawing").get("new_item") == "X"
+
+    # The catalogue of a workspace is opened once.
+    monkeypatch.setattr(catalogue_module, "CACHE", str(tmp_path))
+    monkeypatch.setattr(Catalogue, "_workspaces", {})
+    workspace = Catalogue.for_workspace(tmp_path / "workspace")
+    assert Catalogue.for_workspace(tmp_path / "workspace") is workspace
+    assert Catalogue.for_workspace(None) is not workspace
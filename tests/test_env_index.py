@@ -0,0 +1,132 @@
+"""
+    Test the reverse index of the environment variables.
+"""
+
+import ntpath
+import time
+from pathlib import PureWindowsPath
+
+import pytest
+
+ENVIRON = {
+    "ONEDRIVE": "C:\\Users\\jdoe\\OneDrive - Company",
+    "PROJECTS": "C:\\Users\\jdoe\\OneDrive - Company\\Projects\\",
+    "CAD_SHARE": "\\\\fileserver\\cad",
+    "SYSTEMDRIVE": "C:",
+    "PATH": "C:\\Windows;C:\\Windows\\System32",
+    "RELEASE": "c:/users/JDOE/onedrive - company/release",
+    "NUMBER_OF_PROCESSORS": "8",
+}
+
+
+def test_symlink():
+    from pytia_title_block.resources.env_index import EnvIndex
+
+    index = EnvIndex(ENVIRON)
+
+    # The deepest parent wins, the folders are compared case insensitive.
+    assert index.symlink(
+        "c:\\users\\JDOE\\onedrive - company\\projects\\P-100.CATPart"
+    ) == (
+        "PROJECTS",
+        "c:\\users\\JDOE\\onedrive - company\\projects",
+        "%PROJECTS%\\P-100.CATPart",
+    )
+    assert index.symlink(
+        PureWindowsPath("C:/Users/jdoe/OneDrive - Company/foo/bar/P-100.CATDrawing")
+    ) == (
+        "ONEDRIVE",
+        "C:\\Users\\jdoe\\OneDrive - Company",
+        "%ONEDRIVE%\\foo\\bar\\P-100.CATDrawing",
+    )
+    assert index.symlink("C:\\Users\\jdoe\\OneDrive - Company\\Release\\A.CATDrawing")[
+        2
+    ] == ("%RELEASE%\\A.CATDrawing")
+    assert index.symlink("\\\\FileServer\\CAD\\parts\\P-100.CATPart")[2] == (
+        "%CAD_SHARE%\\parts\\P-100.CATPart"
+    )
+
+    # Drives, lists and the path itself are no symlinks.
+    assert index.symlink("C:\\Windows\\notepad.exe") is None
+    assert index.symlink("C:\\Users\\jdoe\\OneDrive - Company") is None
+    assert index.symlink("D:\\Users\\jdoe\\OneDrive - Company\\A.CATDrawing") is None
+    assert index.symlink("8\\A.CATDrawing") is None
+
+
+def test_expand():
+    from pytia_title_block.resources.env_index import EnvIndex
+
+    index = EnvIndex(ENVIRON)
+    path = "C:\\Users\\jdoe\\OneDrive - Company\\foo\\P-100.CATDrawing"
+    symlinked = index.symlink(path)[2]
+
+    assert index.expand(symlinked) == path
+    assert index.expand("%onedrive%\\%Number_Of_Processors%") == ntpath.join(
+        ENVIRON["ONEDRIVE"], "8"
+    )
+    assert index.is_same_path(symlinked, path.upper())
+    assert index.is_same_path("%UNKNOWN%\\a", "%unknown%/a")
+    assert not index.is_same_path(symlinked, "C:\\foo\\P-100.CATDrawing")
+    with pytest.raises(KeyError):
+        index.expand("%UNKNOWN%\\foo")
+
+
+def test_session_index(monkeypatch):
+    from pytia_title_block.resources import utils
+
+    monkeypatch.setenv("PYTIA_TEST_DRAWINGS", "C:\\Drawings")
+    utils.get_env_index.cache_clear()
+    # The index is built once and shared by the app's modules.
+    assert utils.get_env_index() is utils.get_env_index()
+
+    path = PureWindowsPath("c:\\drawings\\P-100.CATDrawing")
+    assert utils.create_path_symlink(path, True) == (
+        "%PYTIA_TEST_DRAWINGS%\\P-100.CATDrawing"
+    )
+    assert utils.expand_env_vars("%pytia_test_drawings%\\a") == "C:\\Drawings\\a"
+    utils.get_env_index.cache_clear()
+
+
+def test_collect_drawings(tmp_path, monkeypatch):
+    from pytia_title_block import batch
+
+    (tmp_path / "P-100.CATDrawing").touch()
+    monkeypatch.setenv("PYTIA_TEST_DRAWINGS", str(tmp_path))
+    batch.get_env_index.cache_clear()
+
+    drawings = batch.collect_drawings(["%PYTIA_TEST_DRAWINGS%", "%PYTIA_UNSET%"])
+    assert drawings == [tmp_path / "P-100.CATDrawing"]
+    batch.get_env_index.cache_clear()
+
+
+def test_benchmark():
+    from pytia_title_block.resources.env_index import EnvIndex
+
+    environ = {f"VAR_{i}": f"C:\\Folder {i}\\Sub {i}" for i in range(200)}
+    environ["TARGET"] = "C:\\Users\\jdoe\\OneDrive"
+    path = PureWindowsPath("C:\\Users\\jdoe\\OneDrive\\a\\b\\c\\d\\e\\P.CATDrawing")
+
+    def scan() -> str | None:
+        # The former lookup: Each parent against each variable.
+        for parent in path.parents:
+            for key, value in environ.items():
+                if str(parent) == value:
+                    return key
+        return None
+
+    runs = 1000
+    start = time.perf_counter()
+    for _ in range(runs):
+        assert scan() == "TARGET"
+    scanned = (time.perf_counter() - start) / runs
+
+    index = EnvIndex(environ)
+    start = time.perf_counter()
+    for _ in range(runs):
+        assert index.find(path)[0] == "TARGET"
+    indexed = (time.perf_counter() - start) / runs
+
+    print(
+        f"Symlink lookup: {scanned * 1e6:.1f} µs scanned, {indexed * 1e6:.1f} µs indexed"
+    )
+    assert indexed < scanned
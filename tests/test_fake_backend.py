@@ -0,0 +1,229 @@
+"""
+    Test the load/edit/save cycle against the in-memory CATIA backend.
+"""
+
+import time
+import tkinter
+
+import pytest
+
+from tests.conftest import DRAWING_PATH
+from tests.conftest import title_block_texts
+
+from pytia_title_block.backend.fake import FakeApplication
+from pytia_title_block.backend.fake import FakeBackend
+from pytia_title_block.backend.fake import FakeSession
+from pytia_title_block.backend.fake import create_drawing
+from pytia_title_block.resources import resource
+
+
+def test_load(backend):
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+
+    doc_loader = DocumentLoader(backend=backend)
+    items = resource.title_block_items
+
+    assert doc_loader.get_text_value_by_name(items.partnumber) == "P-001"
+    assert doc_loader.get_text_value_by_name(items.product) is None
+    assert doc_loader.get_property_from_linked_doc("partnumber") == "P-001"
+    assert doc_loader.get_property_from_linked_doc(resource.props.product) == "M-100"
+    assert doc_loader.get_property_from_linked_doc("not existing") is None
+    assert not doc_loader.locked
+
+    # The snapshot holds the values of the linked properties.
+    assert backend.session.count("Parameter.value_as_string") == 0
+    for name in doc_loader.linked_snapshot.user:
+        assert (
+            doc_loader.get_property_from_linked_doc(name)
+            == doc_loader.linked_properties.get_by_name(name).value
+        )
+
+
+def test_reload_texts(backend, drawing):
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+
+    doc_loader = DocumentLoader(backend=backend)
+    items = resource.title_block_items
+    assert doc_loader.read_text_values()[items.partnumber] == "P-001"
+
+    # The user renames the text in CATIA while the app is open.
+    texts = drawing._sheets._items[0]._views._items[1]._texts
+    text = next(t for t in texts if t._name == items.partnumber)
+    text._name = "Renamed"
+    assert doc_loader.read_text_values()[items.partnumber] == "P-001"
+
+    doc_loader.invalidate_text_index()
+    assert items.partnumber in doc_loader.check_title_block()
+    assert items.partnumber not in doc_loader.read_text_values()
+
+
+def test_save_writes_changed_texts_only(backend, drawing):
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+
+    doc_loader = DocumentLoader(backend=backend)
+    items = resource.title_block_items
+    for name in items.values:
+        doc_loader.get_text_value_by_name(name)
+
+    backend.session.reset()
+    doc_loader.queue_text_value(value="P-001", name=items.partnumber)
+    doc_loader.queue_text_value(value="3", name=items.revision)
+    doc_loader.queue_text_value(value="", name=items.product)
+    summary = doc_loader.write_text_values()
+
+    assert summary.changed == {items.revision: ("1", "3")}
+    assert sorted(summary.unchanged) == sorted([items.partnumber, items.product])
+    assert backend.session.calls["DrawingText.text="] == 1
+
+    drawing.save()
+    assert drawing.save_count == 1
+
+
+def test_save_untouched_title_block(backend):
+    from pytia_title_block.loader.data_loader import DataLoader
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+
+    from pytia_title_block.app.vars import Variables
+
+    doc_loader = DocumentLoader(backend=backend)
+    variables = Variables(root=tkinter.Tcl())
+    data_loader = DataLoader(variables=variables, layout=None, doc_loader=doc_loader)  # type: ignore
+
+    # Save once, everything that differs from the drawing is written.
+    first = data_loader.load_into_title_block()
+    assert first.has_changes
+
+    # Saving again without changes must not write anything.
+    backend.session.reset()
+    second = data_loader.load_into_title_block()
+    assert not second.has_changes
+    assert backend.session.count("DrawingText.text=") == 0
+
+
+def test_differences(backend, drawing):
+    from pytia_title_block.loader.data_loader import DataLoader
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+
+    doc_loader = DocumentLoader(backend=backend)
+    data_loader = DataLoader(variables=None, layout=None, doc_loader=doc_loader)
+    backend.session.reset()
+    differences = {
+        d.key: (d.title_block, d.linked) for d in data_loader.get_differences()
+    }
+
+    assert differences == {
+        "product": (None, "M-100"),
+        "revision": ("1", "2"),
+        "definition": (None, "Shaft"),
+        "material": (None, "1.4301"),
+        "base_size": (None, "D30x120"),
+        "tolerance": (None, "ISO 2768 1-m 2-K"),
+    }
+    # One read per linked title block item, nothing is written.
+    assert backend.session.count("DrawingText.text") == 7
+    assert backend.session.count("DrawingText.text=") == 0
+    assert drawing.saved
+
+
+def test_tolerance_table(backend):
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    doc_loader = DocumentLoader(backend=backend)
+    ToleranceTools(doc_loader=doc_loader).add_table()
+
+    tables = doc_loader.background_view._tables._items
+    assert len(tables) == 1
+    assert tables[0].values == [
+        [
+            resource.settings.tables.tolerances.header_base,
+            resource.settings.tables.tolerances.header_min,
+            resource.settings.tables.tolerances.header_max,
+        ],
+        ["30.000 H7", "30.0000", "30.0210"],
+        ["12.000 g6", "11.9830", "11.9940"],
+    ]
+
+
+def test_latency():
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+
+    application = FakeApplication(FakeSession(latency=0.001))
+    create_drawing(application, DRAWING_PATH, title_block=title_block_texts())
+    backend = FakeBackend(application)
+    backend.session.reset()
+
+    start = time.perf_counter()
+    DocumentLoader(backend=backend)
+    elapsed = time.perf_counter() - start
+
+    assert backend.session.total > 0
+    assert elapsed >= backend.session.total * 0.001
+
+
+def _drain(loader) -> list:
+    messages = []
+    while not loader.messages.empty():
+        messages.append(loader.messages.get_nowait())
+    return messages
+
+
+def test_background_loader(backend):
+    from pytia_title_block.loader.background_loader import BackgroundLoader
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+
+    loader = BackgroundLoader(backend=backend)
+    loader.start()
+    loader.join(timeout=10)
+    assert not loader.is_alive
+
+    *stages, result = _drain(loader)
+    assert stages and all(isinstance(stage, str) for stage in stages)
+    assert type(result).__name__ == "LoadingResultModel"
+
+    # The result holds no COM objects, the UI thread acquires its own. The title block
+    # and the linked document have been read by the worker.
+    assert result.document.text_values
+    backend.session.reset()
+    doc_loader = DocumentLoader(backend=backend, loaded=result.document)
+    items = resource.title_block_items
+    assert doc_loader.get_text_value_by_name(items.partnumber) == "P-001"
+    assert doc_loader.get_property_from_linked_doc("partnumber") == "P-001"
+    assert backend.session.count("DrawingText.") == 0
+    assert backend.session.count("Product.user_ref_properties") == 0
+
+    # The title block texts are fetched at their known locations, not enumerated.
+    doc_loader.queue_text_value("P-002", items.partnumber)
+    assert doc_loader.write_text_values().changed == {
+        items.partnumber: ("P-001", "P-002")
+    }
+    assert backend.session.count("DrawingText.name") == len(
+        result.document.text_locations
+    )
+
+
+def test_background_loader_other_document(backend):
+    from pytia.exceptions import PytiaDifferentDocumentError
+
+    from pytia_title_block.loader.background_loader import BackgroundLoader
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+
+    loader = BackgroundLoader(backend=backend)
+    loader.start()
+    loader.join(timeout=10)
+    *_, result = _drain(loader)
+
+    # The user activates another drawing while the document is loaded.
+    create_drawing(backend.application, "C:\\B.CATDrawing", title_block={})
+    with pytest.raises(PytiaDifferentDocumentError):
+        DocumentLoader(backend=backend, loaded=result.document)
+
+
+def test_background_loader_error():
+    from pytia_title_block.loader.background_loader import BackgroundLoader
+
+    loader = BackgroundLoader(backend=FakeBackend(FakeApplication()))
+    loader.start()
+    loader.join(timeout=10)
+
+    assert isinstance(_drain(loader)[-1], Exception)
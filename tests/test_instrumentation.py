@@ -0,0 +1,35 @@
+"""
+    Test the COM call instrumentation against the in-memory CATIA backend.
+"""
+
+import json
+
+
+def test_instrumented_document_loader(backend, tmp_path):
+    from pytia_title_block.backend.instrumentation import ComStats
+    from pytia_title_block.backend.instrumentation import instrument
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.resources import resource
+
+    stats = ComStats()
+    backend.session.reset()
+    doc_loader = DocumentLoader(backend=instrument(backend, stats))
+    doc_loader.get_text_value_by_name(resource.title_block_items.partnumber)
+
+    # Every call of the stand-in is recorded by the proxy.
+    assert (
+        stats.methods["FakeText.name"].count
+        == backend.session.calls["DrawingText.name"]
+    )
+    assert (
+        stats.methods["FakeTexts.item"].count
+        == backend.session.calls["DrawingTexts.item"]
+    )
+    assert stats.methods["FakeText.text"].count == 1
+    assert "get_text_value_by_name" in "".join(stats.method_call_sites["FakeText.text"])
+
+    path = stats.write_report(tmp_path)
+    with open(path, "r", encoding="utf8") as f:
+        report = json.load(f)
+    assert report["total_calls"] == stats.total_calls
+    assert sum(report["methods"]["FakeText.text"]["histogram"].values()) == 1
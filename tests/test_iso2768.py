@@ -0,0 +1,130 @@
+"""
+    Test the local ISO 2768 general tolerances.
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "text, linear, geometric",
+    [
+        ("ISO 2768 1-m 2-K", "m", "K"),
+        ("ISO 2768 1-f 2-H", "f", "H"),
+        ("ISO 2768-mK", "m", "K"),
+        ("ISO 2768-c", "c", None),
+        ("ISO 2768 1-v", "v", None),
+    ],
+)
+def test_parse_class(text, linear, geometric):
+    from pytia_title_block.tools.iso2768 import parse_class
+
+    general = parse_class(text)
+    assert general is not None
+    assert (general.name, general.linear, general.geometric) == (
+        text,
+        linear,
+        geometric,
+    )
+
+
+@pytest.mark.parametrize("text", [None, "", "-", "ISO 2768", "DIN 7168-m", "H7"])
+def test_parse_class_invalid(text):
+    from pytia_title_block.tools.iso2768 import parse_class
+
+    assert parse_class(text) is None
+
+
+@pytest.mark.parametrize(
+    "linear, nominal, deviation",
+    [
+        ("m", 0.5, 0.1),
+        ("m", 3, 0.1),
+        ("m", 3.5, 0.1),
+        ("m", 30, 0.2),
+        ("m", 120, 0.3),
+        ("m", 120.5, 0.5),
+        ("f", 1500, 0.5),
+        ("c", 4000, 4),
+        ("v", 2, None),
+        ("f", 3000, None),
+        ("m", 0.4, None),
+        ("m", 4001, None),
+    ],
+)
+def test_linear_deviation(linear, nominal, deviation):
+    from pytia_title_block.tools.iso2768 import get_linear_deviation
+
+    assert get_linear_deviation(linear, nominal) == deviation
+
+
+@pytest.mark.parametrize(
+    "linear, nominal, deviation",
+    [("m", 2, 0.2), ("m", 6, 0.5), ("f", 8, 1), ("c", 3, 0.4), ("v", 50, 2)],
+)
+def test_radius_deviation(linear, nominal, deviation):
+    from pytia_title_block.tools.iso2768 import get_radius_deviation
+
+    assert get_radius_deviation(linear, nominal) == deviation
+
+
+def test_angular_deviation():
+    from pytia_title_block.tools import iso2768
+
+    assert iso2768.get_angular_deviation("m") == 1
+    assert iso2768.get_angular_deviation("m", 30) == 0.5
+    assert iso2768.get_angular_deviation("c", 500) == 10 / 60
+    assert iso2768.get_angular_deviation("x") is None
+    assert iso2768.format_angle(0.5) == "0°30'"
+    assert iso2768.format_angle(1.5) == "1°30'"
+    assert iso2768.format_angle(3) == "3°"
+
+
+def test_general_dimensions(backend):
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.tools.iso2768 import parse_class
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    tools = ToleranceTools(doc_loader=DocumentLoader(backend=backend))
+    dimensions = tools.get_all_tolerated_dimensions(parse_class("ISO 2768 1-m 2-K"))
+
+    assert len(dimensions) == 4
+    general = dimensions[-1]
+    assert (general.name, general.tol_type, general.tol_up_s) == ("Length.4", 0, "±0.3")
+    assert (general.tol_up_d, general.tol_low_d) == (0.3, -0.3)
+
+    _, *rows = ToleranceTools.prepare_table_data(dimensions)
+    assert (rows[-1].base, rows[-1].min, rows[-1].max) == (
+        "120.000 ±0.3",
+        "119.7000",
+        "120.3000",
+    )
+
+
+def test_general_dimension_types(backend):
+    from pytia_title_block.backend.fake import FakeDimension
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.tools.iso2768 import parse_class
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    session = backend.application.session
+    drawing = backend.application.active_document
+    view = drawing._sheets._items[0]._views._items[2]
+    for name, value, dim_type in (
+        ("Angle.1", 45.0, 4),
+        ("Radius.1", 5.0, 5),
+        ("Diameter.1", 20.0, 13),
+        ("Chamfer.1", 2.0, 18),
+    ):
+        view._dimensions._append(FakeDimension(session, name, value, dim_type=dim_type))
+
+    tools = ToleranceTools(doc_loader=DocumentLoader(backend=backend))
+    dimensions = {
+        d.name: d
+        for d in tools.get_all_tolerated_dimensions(parse_class("ISO 2768-mK"))
+    }
+
+    assert dimensions["Angle.1"].tol_up_s == "±1°"
+    assert dimensions["Angle.1"].tol_up_d == 1
+    assert dimensions["Radius.1"].tol_up_s == "±0.5"
+    assert dimensions["Diameter.1"].tol_up_s == "±0.2"
+    assert "Chamfer.1" not in dimensions
@@ -0,0 +1,85 @@
+"""
+    Test the local ISO 286 limits against values of the standard.
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "tolerance, nominal, upper, lower",
+    [
+        ("H7", 30, 21, 0),
+        ("H7", 3, 10, 0),
+        ("H11", 100, 220, 0),
+        ("g6", 12, -6, -17),
+        ("h6", 30, 0, -13),
+        ("js6", 30, 6.5, -6.5),
+        ("k6", 30, 15, 2),
+        ("m6", 30, 21, 8),
+        ("n6", 30, 28, 15),
+        ("p6", 30, 35, 22),
+        ("r6", 60, 60, 41),
+        ("s6", 45, 59, 43),
+        ("f7", 25, -20, -41),
+        ("e8", 40, -50, -89),
+        ("c11", 70, -150, -340),
+        ("F8", 30, 53, 20),
+        ("G7", 30, 28, 7),
+        ("E9", 50, 112, 50),
+        ("D10", 30, 149, 65),
+        ("K7", 30, 6, -15),
+        ("K7", 2, 0, -10),
+        ("K8", 30, 10, -23),
+        ("M7", 30, 0, -21),
+        ("N7", 30, -7, -28),
+        ("N9", 30, 0, -52),
+        ("P7", 30, -14, -35),
+        ("P9", 30, -22, -74),
+        ("S7", 30, -27, -48),
+    ],
+)
+def test_deviations(tolerance, nominal, upper, lower):
+    from pytia_title_block.tools.iso286 import get_deviations
+
+    assert get_deviations(tolerance, nominal) == (upper / 1000, lower / 1000)
+
+
+def test_limits():
+    from pytia_title_block.tools.iso286 import get_limits
+
+    assert get_limits("H7", 30) == (30.0, 30.021)
+    assert get_limits("g6", 12) == (11.983, 11.994)
+
+
+@pytest.mark.parametrize(
+    "tolerance, nominal", [("H7", 600), ("H7", 0), ("H19", 30), ("z6", 30), ("7H", 30)]
+)
+def test_unsupported(tolerance, nominal):
+    from pytia_title_block.tools.iso286 import get_deviations
+
+    assert get_deviations(tolerance, nominal) is None
+
+
+def test_local_limits(backend):
+    from tests.conftest import tolerated_dimension
+
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    doc_loader = DocumentLoader(backend=backend)
+    # CATIA reports rounded deviations for the new dimension.
+    doc_loader.views._items[2]._dimensions._items.append(
+        tolerated_dimension(backend.session, "Length.5", 30.0, "js6", 0.007, -0.007)
+    )
+    tools = ToleranceTools(doc_loader=doc_loader, local_limits=True)
+    backend.session.reset()
+    dimensions = tools.get_all_tolerated_dimensions()
+
+    assert [(d.tol_up_d, d.tol_low_d) for d in dimensions] == [
+        (0.021, 0.0),
+        (-0.006, -0.017),
+        (0.021, 0.0),
+        (0.0065, -0.0065),
+    ]
+    # The deviations are still read with the tolerance type, no additional calls.
+    assert backend.session.count("DrawingDimension.get_tolerances") == 5
@@ -0,0 +1,85 @@
+"""
+    Test the metadata cache of title block contents.
+"""
+
+import os
+
+from tests.conftest import title_block_texts
+
+from pytia_title_block.backend.fake import FakeApplication
+from pytia_title_block.backend.fake import FakeBackend
+from pytia_title_block.backend.fake import create_drawing
+from pytia_title_block.resources import resource
+
+
+def test_lookup(tmp_path):
+    from pytia_title_block.loader.metadata_cache import MetadataCache
+
+    cache = MetadataCache(tmp_path / "cache")
+    drawing = tmp_path / "P-001.CATDrawing"
+    drawing.write_bytes(b"drawing")
+
+    assert cache.lookup(drawing) is None
+    assert cache.store(tmp_path / "missing.CATDrawing", {}) is None
+
+    cache.store(drawing, {"partnumber": "P-001", "product": None}, "C:\\P-001.CATPart")
+    entry = cache.lookup(drawing)
+    assert entry is not None
+    assert entry.get("partnumber") == "P-001"
+    assert entry.get("product") is None
+    assert entry.linked_path == "C:\\P-001.CATPart"
+    assert cache.get(drawing, "partnumber") == "P-001"
+
+    # The entry is outdated as soon as the file changes.
+    drawing.write_bytes(b"modified drawing")
+    assert cache.lookup(drawing) is None
+
+    # A corrupted entry is dropped.
+    cache.store(drawing, {"partnumber": "P-001"})
+    cache._entry_path(drawing).write_text("{")
+    assert cache.lookup(drawing) is None
+    assert not os.path.exists(cache._entry_path(drawing))
+
+
+def test_cache_title_block(tmp_path, product):
+    from pytia_title_block.loader.catalogue import Catalogue
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.loader.metadata_cache import MetadataCache
+
+    path = tmp_path / "P-001.CATDrawing"
+    path.write_bytes(b"drawing")
+    application = FakeApplication(product.session)
+    drawing = create_drawing(
+        application,
+        str(path),
+        title_block=title_block_texts(partnumber="P-001", revision="1"),
+        product=product,
+    )
+    cache = MetadataCache(tmp_path / "cache")
+    catalogue = Catalogue(tmp_path / "catalogue.sqlite")
+    doc_loader = DocumentLoader(backend=FakeBackend(application))
+
+    assert doc_loader.cache_title_block(cache, catalogue) is not None
+    assert catalogue.get(path).get("partnumber") == "P-001"
+
+    # Lookups are answered from the cache, without the drawing.
+    backend_calls = application.session.total
+    entry = cache.lookup(path)
+    assert entry is not None
+    assert entry.get("partnumber") == "P-001"
+    assert entry.get("revision") == "1"
+    assert entry.get("product") is None
+    assert entry.linked_path == "C:\\parts\\P-001.CATPart"
+    assert application.session.total == backend_calls
+
+    # Unsaved changes don't match the file, they are not cached.
+    drawing.modified()
+    assert doc_loader.cache_title_block(cache, catalogue) is None
+
+    # Saving the drawing caches the written values.
+    doc_loader.get_text_by_name(resource.title_block_items.revision).text = "2"
+    doc_loader.read_text_values()
+    doc_loader.save_drawing()
+    entry = MetadataCache().lookup(path)
+    assert entry is not None
+    assert entry.get("revision") == "2"
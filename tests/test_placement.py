@@ -0,0 +1,140 @@
+"""
+    Test the collision free placement of elements on the sheet.
+"""
+
+
+def test_grid_index():
+    from pytia_title_block.models.placement_model import BoxModel
+    from pytia_title_block.tools.placement import GridIndex
+
+    grid = GridIndex(cell_size=10)
+    grid.insert(BoxModel(x_min=0, x_max=25, y_min=0, y_max=5))
+    grid.insert(BoxModel(x_min=100, x_max=110, y_min=100, y_max=110))
+
+    assert len(grid) == 2
+    assert grid.intersects(BoxModel(x_min=20, x_max=30, y_min=2, y_max=3))
+    assert not grid.intersects(BoxModel(x_min=30, x_max=40, y_min=0, y_max=5))
+    assert grid.intersects(BoxModel(x_min=30, x_max=40, y_min=0, y_max=5), margin=6)
+    assert not grid.intersects(BoxModel(x_min=50, x_max=60, y_min=50, y_max=60))
+
+
+def test_find_free():
+    from pytia_title_block.models.placement_model import BoxModel
+    from pytia_title_block.tools.placement import SheetIndex
+
+    sheet = BoxModel(x_min=0, x_max=200, y_min=0, y_max=100)
+    obstacle = BoxModel(x_min=50, x_max=100, y_min=0, y_max=40)
+    index = SheetIndex(sheet, [obstacle])
+
+    # Free: The box stays where it is.
+    box = BoxModel(x_min=10, x_max=30, y_min=10, y_max=20)
+    assert index.find_free(box) == box
+
+    # Blocked: The nearest free position is above the obstacle.
+    box = BoxModel(x_min=60, x_max=90, y_min=10, y_max=20)
+    free = index.find_free(box)
+    assert free is not None
+    assert (free.x_min, free.y_min) == (60, 45)
+    assert not free.intersects(obstacle) and sheet.contains(free)
+
+    # Extra obstacles are avoided as well.
+    free = index.find_free(box, extra=[free])
+    assert free is not None
+    assert not free.intersects(obstacle) and (free.y_min, free.x_min) != (45, 60)
+
+    # No space left on the sheet.
+    assert index.find_free(BoxModel(x_min=0, x_max=300, y_min=0, y_max=10)) is None
+
+
+def test_sheet_index_cache(backend):
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.tools.placement import SheetIndexCache
+
+    doc_loader = DocumentLoader(backend=backend)
+    cache = SheetIndexCache()
+    index = cache.get(doc_loader)
+    # All views except the main and the background view, and all background texts.
+    views = doc_loader.views.count - 2
+    assert len(index.grid) == views + doc_loader.bg_texts.count
+
+    # The geometry is read once per sheet.
+    backend.session.reset()
+    assert cache.get(doc_loader) is index
+    assert backend.session.count("DrawingView") == 0
+    assert backend.session.count("DrawingText") == 0
+
+    # Excluded elements are no obstacles of the index.
+    name = doc_loader.bg_texts.item(1).name
+    excluded = cache.get(doc_loader, exclude=[name])
+    assert excluded is not index
+    assert len(excluded.grid) == len(index.grid) - 1
+    assert cache.get(doc_loader, exclude=(name,)) is excluded
+
+    cache.invalidate(doc_loader)
+    assert cache.get(doc_loader) is not index
+    assert cache.get(doc_loader, exclude=[name]) is not excluded
+    index = cache.get(doc_loader)
+    cache.invalidate()
+    assert cache.get(doc_loader) is not index
+
+
+def test_avoid_collisions(product, monkeypatch):
+    from pytia_title_block.backend.fake import FakeApplication
+    from pytia_title_block.backend.fake import FakeBackend
+    from pytia_title_block.backend.fake import create_drawing
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.models.placement_model import BoxModel
+    from pytia_title_block.tools import tolerance_tools
+    from pytia_title_block.tools.placement import SheetIndexCache
+    from pytia_title_block.tools.placement import text_box
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+    from tests.conftest import DRAWING_PATH
+    from tests.conftest import title_block_texts
+    from tests.conftest import tolerated_dimension
+
+    # The app's modules hold their own instance of the resources.
+    resource = tolerance_tools.resource
+    monkeypatch.setattr(resource.settings.tables.tolerances, "avoid_collisions", True)
+    cache = SheetIndexCache()
+    monkeypatch.setattr(tolerance_tools, "sheet_indexes", cache)
+
+    application = FakeApplication()
+    create_drawing(
+        application,
+        DRAWING_PATH,
+        title_block=title_block_texts(),
+        product=product,
+        dimensions=[
+            lambda s, i=i: tolerated_dimension(s, f"Length.{i}", 10 + i)
+            for i in range(3)
+        ],
+    )
+    backend = FakeBackend(application)
+    doc_loader = DocumentLoader(backend=backend)
+    # The front view covers the anchor of the tolerance table.
+    view = doc_loader.views._items[2]
+    view.bounding_box = (20, 120, 5, 100)
+    view_box = BoxModel(x_min=20, x_max=120, y_min=5, y_max=100)
+
+    index = cache.get(doc_loader)
+    tools = ToleranceTools(doc_loader=doc_loader)
+    tools.add_table()
+
+    table = doc_loader.background_view._tables._items[0]
+    table_box = BoxModel(
+        x_min=table._x,
+        x_max=table._x + 3 * table.get_column_size(1),
+        y_min=table._y - table.number_of_rows * table.get_row_size(1),
+        y_max=table._y,
+    )
+    assert not table_box.intersects(view_box)
+    # The index is read again, the new table is an obstacle.
+    assert cache.get(doc_loader) is not index
+    assert not cache.get(doc_loader).is_free(table_box)
+    assert cache.get(doc_loader).sheet.contains(table_box)
+
+    notes = doc_loader.get_text_by_name(resource.title_block_items.notes)
+    assert notes is not None
+    notes_box = text_box(notes._x, notes._y, notes._text)
+    assert not notes_box.intersects(table_box)
+    assert not notes_box.intersects(view_box)
@@ -0,0 +1,148 @@
+"""
+    Test the compiled bundle of the resource files.
+"""
+
+import pickle
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def bundle_file(tmp_path, monkeypatch):
+    """Redirects the bundle of the resources into the temp folder."""
+    from pytia_title_block.resources import bundle
+
+    path = tmp_path / "resources.bundle"
+    monkeypatch.setattr(bundle, "BUNDLE_FILE", path)
+    return path
+
+
+def test_store_and_load(tmp_path, monkeypatch):
+    from pytia_title_block.resources import bundle
+
+    path = tmp_path / "cache" / "resources.bundle"
+    stamp = bundle.get_stamp(None, tmp_path, ["settings.json"])
+    sections = {"_settings": {"title": "Title Block"}}
+
+    assert bundle.load(stamp, path) is None
+    assert bundle.store(stamp, sections, {}, path)
+    assert bundle.load(stamp, path) == sections
+    assert list(path.parent.iterdir()) == [path]
+
+    # A changed source file makes the bundle stale.
+    (tmp_path / "settings.json").write_text("{}")
+    assert (
+        bundle.load(bundle.get_stamp(None, tmp_path, ["settings.json"]), path) is None
+    )
+
+    # So does a changed environment variable.
+    monkeypatch.setenv("PYTIA_TEST_RELEASE", "C:\\release")
+    environment = bundle.get_environment("%PYTIA_TEST_RELEASE%\\apps")
+    assert environment == {"PYTIA_TEST_RELEASE": "C:\\release"}
+    bundle.store(stamp, sections, environment, path)
+    assert bundle.load(stamp, path) == sections
+    monkeypatch.setenv("PYTIA_TEST_RELEASE", "D:\\release")
+    assert bundle.load(stamp, path) is None
+
+    # A corrupted bundle is ignored.
+    path.write_bytes(b"\x80\x05corrupted")
+    assert bundle.load(stamp, path) is None
+
+    # Unpicklable sections (TypeError) aren't stored, no temp file is left behind.
+    assert not bundle.store(stamp, {"_settings": threading.Lock()}, {}, path)
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_resources_from_bundle(bundle_file, monkeypatch):
+    from pytia_title_block.resources import Resources
+    from pytia_title_block.resources import bundle
+
+    compiled = Resources()
+    assert not bundle_file.exists()
+    # The bundle is written as soon as all sections of the config files have been read.
+    for name in Resources.BUNDLED:
+        compiled._get(name)
+    assert bundle_file.exists()
+    with open(bundle_file, "rb") as f:
+        assert set(pickle.load(f)["sections"]) == set(Resources.BUNDLED)
+
+    # The bundle is up to date: No config file is read.
+    def fail(self):
+        raise AssertionError("Config file read.")
+
+    with monkeypatch.context() as m:
+        for name in ("_read_settings", "_read_user_records", "_read_props"):
+            m.setattr(Resources, name, fail)
+        loaded = Resources()
+        assert loaded.settings == compiled.settings
+    assert loaded.settings == compiled.settings
+    assert loaded.users == compiled.users
+    assert loaded.title_block_items == compiled.title_block_items
+    assert loaded.props == compiled.props
+    assert loaded.infos == compiled.infos
+
+    # A stale bundle is rebuilt transparently.
+    monkeypatch.setattr(bundle, "BUNDLE_VERSION", bundle.BUNDLE_VERSION + 1)
+    rebuilt = Resources()
+    assert rebuilt.settings == compiled.settings
+    rebuilt.prefetch().join()
+    with open(bundle_file, "rb") as f:
+        assert pickle.load(f)["stamp"][0] == bundle.BUNDLE_VERSION
+
+
+def test_lazy_sections(bundle_file, monkeypatch):
+    from pytia_title_block.resources import Resources
+
+    read = []
+    for name in (*Resources.BUNDLED, "appdata"):
+        reader = getattr(Resources, f"_read_{name}")
+        monkeypatch.setattr(
+            Resources,
+            f"_read_{name}",
+            lambda self, name=name, reader=reader: read.append(name) or reader(self),
+        )
+
+    # Nothing is read until a section is accessed, each section is read once.
+    resources = Resources()
+    assert not read
+    assert resources.settings is resources.settings
+    assert read == ["settings"]
+
+    # Prefetching loads the remaining sections of the config files in the background.
+    resources.prefetch().join()
+    assert sorted(read) == sorted(Resources.BUNDLED)
+    assert resources.user_directory is resources.user_directory
+    assert "appdata" not in read
+
+    resources.prefetch("appdata").join()
+    assert read[-1] == "appdata"
+
+
+def test_benchmark_startup(bundle_file):
+    from pytia_title_block.resources import Resources
+
+    def load() -> Resources:
+        resources = Resources()
+        for name in Resources.BUNDLED:
+            resources._get(name)
+        return resources
+
+    runs = 20
+    cold = warm = 0.0
+    for _ in range(runs):
+        bundle_file.unlink(missing_ok=True)
+        start = time.perf_counter()
+        load()
+        cold += time.perf_counter() - start
+
+        start = time.perf_counter()
+        load()
+        warm += time.perf_counter() - start
+
+    print(
+        f"Resources: {cold / runs * 1000:.3f} ms from the config files, "
+        f"{warm / runs * 1000:.3f} ms from the bundle."
+    )
+    assert warm < cold
@@ -0,0 +1,460 @@
+"""
+    Test the tolerance table data preparation, including a micro-benchmark of the loop and
+    the columnar (NumPy) implementation.
+
+    Run `python -m tests.test_tolerance_tools` to print the benchmark results.
+"""
+
+import time
+from typing import List
+
+import pytest
+
+from pytia_title_block.backend.fake import FakeApplication
+from pytia_title_block.backend.fake import FakeSession
+from pytia_title_block.backend.fake import FakeTable
+from pytia_title_block.models.tolerance_model import ColumnFormatModel
+from pytia_title_block.models.tolerance_model import ToleranceModel
+
+TOLERANCES = (("H7", 0.021, 0.0), ("g6", -0.007, -0.020), ("h6", 0.0, -0.013))
+
+
+def synthetic_dimensions(count: int, unique: int = 500) -> List[ToleranceModel]:
+    """Returns tolerated dimensions with `unique` different values and tolerances."""
+    dimensions = []
+    for index in range(count):
+        tol_name, upper, lower = TOLERANCES[(index % unique) % len(TOLERANCES)]
+        dimensions.append(
+            ToleranceModel(
+                name=f"Length.{index}",
+                value=10 + (index % unique) * 0.5,
+                precision=0.001,
+                tol_type=2,
+                tol_name=tol_name,
+                tol_up_s=tol_name,
+                tol_low_s=tol_name,
+                tol_up_d=upper,
+                tol_low_d=lower,
+                tol_display=0,
+            )
+        )
+    return dimensions
+
+
+def _dimension(value: float, tol_name: str, precision: float = 0.001) -> ToleranceModel:
+    return ToleranceModel(
+        name="Length",
+        value=value,
+        precision=precision,
+        tol_type=2,
+        tol_name=tol_name,
+        tol_up_s=tol_name,
+        tol_low_s=tol_name,
+        tol_up_d=0.021,
+        tol_low_d=0.0,
+        tol_display=0,
+    )
+
+
+def test_deduplication():
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    dimensions = [
+        _dimension(30.0, "H7"),
+        _dimension(12.0, "H7"),
+        _dimension(30.0002, "H7"),  # Same value at the displayed precision
+        _dimension(30.0, "F8"),
+        _dimension(30.0, "H7"),
+    ]
+    header, *rows = ToleranceTools.prepare_table_data(dimensions)
+
+    assert header.count == 1
+    assert [(r.base, r.count) for r in rows] == [
+        ("30.000 H7", 3),
+        ("12.000 H7", 1),
+        ("30.000 F8", 1),
+    ]
+    assert (rows[0].min, rows[0].max) == ("30.0000", "30.0210")
+
+    _, *grouped = ToleranceTools.prepare_table_data(
+        dimensions, group=True, show_count=True
+    )
+    assert [r.base for r in grouped] == ["30.000 F8", "12.000 H7", "3× 30.000 H7"]
+
+
+def test_extraction_com_calls(backend):
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    progress = []
+    tools = ToleranceTools(
+        doc_loader=DocumentLoader(backend=backend),
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    backend.session.reset()
+    dimensions = list(tools.iter_tolerated_dimensions())
+
+    # The drawing has 3 views and 4 dimensions, 3 of them toleranced.
+    assert [d.name for d in dimensions] == ["Length.1", "Length.2", "Length.3"]
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    calls = backend.session.calls
+    per_view = sum(calls[c] for c in ("DrawingViews.item", "DrawingView.dimensions"))
+    per_view += calls["DrawingDimensions.count"] + calls["DrawingViews.count"]
+    per_dimension = backend.session.total - per_view
+    print(
+        f"COM calls: {per_view} for 3 views, {per_dimension} for 4 dimensions "
+        f"({per_dimension / 4:.1f} per dimension)"
+    )
+    assert per_view == 3 + 3 + 3 + 1
+    # Untoleranced: item, get_tolerances. Toleranced: additionally get_value, name,
+    # value, get_format_precision.
+    assert per_dimension == 1 * 2 + 3 * 6
+
+
+def test_table_writer_com_calls():
+    from pytia_title_block.tools.table_writer import TABLE_COMPUTE_ON
+    from pytia_title_block.tools.table_writer import TableWriter
+
+    session = FakeSession()
+    application = FakeApplication(session)
+    table = FakeTable(session, 0, 0, 200, 3, 4.5, 30)
+    rows = [(f"{row}", f"{row}.min", f"{row}.max") for row in range(200)]
+    formats = [
+        ColumnFormatModel(font_size=2, alignment=4),
+        ColumnFormatModel(alignment=4),
+        ColumnFormatModel(),
+    ]
+    session.reset()
+    TableWriter(table, formats=formats, application=application).write(rows)
+
+    assert table.values == [list(row) for row in rows]
+    assert all(row[0].font_size == 2 and row[1].font_size == 3.5 for row in table.cells)
+    assert set(table.alignments) == {(r, c) for r in range(1, 201) for c in (1, 2)}
+    assert table._compute_mode == TABLE_COMPUTE_ON
+    assert application._refresh_display is True
+
+    # One call per cell for the contents, the formats cost only for formatted columns.
+    assert session.count("DrawingTable.set_cell_string") == 600
+    assert session.count("DrawingTable.get_cell_object") == 200
+    assert session.count("DrawingText.set_font_size") == 200
+    assert session.count("DrawingTable.set_cell_alignment") == 400
+    # Read, suspend and restore the compute mode and the display refresh.
+    assert session.count("DrawingTable.compute_mode") == 3
+    assert session.count("Application.refresh_display") == 3
+    assert session.total == 600 + 200 + 200 + 400 + 3 + 3
+
+
+def test_add_table_com_calls(backend):
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    tools = ToleranceTools(doc_loader=DocumentLoader(backend=backend))
+    backend.session.reset()
+    tools.add_table()
+
+    # Header and two rows, each cell: contents, cell object, font size, alignment.
+    table_calls = backend.session.count("DrawingTable.") - 3 - 1
+    assert table_calls + backend.session.count("DrawingText.set_font_size") == 9 * 4
+    assert backend.application._refresh_display is True
+
+
+def test_update_table(backend):
+    from tests.conftest import tolerated_dimension
+
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    doc_loader = DocumentLoader(backend=backend)
+    tools = ToleranceTools(doc_loader=doc_loader)
+    tools.add_table()
+    table = doc_loader.background_view._tables._items[0]
+    header = table.values[0]
+    position = (table._x, table._y)
+
+    # Unchanged: The table is only read.
+    backend.session.reset()
+    tools.add_table()
+    writes = ("DrawingTable.set", "DrawingTable.add", "DrawingTable.remove")
+    assert sum(backend.session.count(prefix) for prefix in writes) == 0
+    assert backend.session.count("DrawingTables.") == 2  # count, item
+
+    # One dimension changed and one added: One row rewritten, one row inserted.
+    dimensions = doc_loader.views._items[2]._dimensions._items
+    dimensions[1] = tolerated_dimension(
+        backend.session, "Length.2", 14.0, "g6", -0.006, -0.017
+    )
+    dimensions.append(tolerated_dimension(backend.session, "Length.5", 40.0, "F8"))
+    backend.session.reset()
+    tools.add_table()
+
+    assert len(doc_loader.background_view._tables._items) == 1
+    assert table.values == [
+        header,
+        ["30.000 H7", "30.0000", "30.0210"],
+        ["14.000 g6", "13.9830", "13.9940"],
+        ["40.000 F8", "40.0000", "40.0210"],
+    ]
+    assert backend.session.count("DrawingTable.add_row") == 1
+    assert backend.session.count("DrawingTable.remove_row") == 0
+    assert backend.session.count("DrawingTable.set_cell_string") == 6
+    assert backend.session.count("DrawingText.set_font_size") == 3
+    assert all(cell.font_size == 2 for row in table.cells for cell in row)
+    assert table._y == position[1] + 4.5
+
+    # Dimension removed: One row deleted.
+    del dimensions[-1]
+    backend.session.reset()
+    tools.add_table()
+    assert len(table.values) == 3
+    assert backend.session.count("DrawingTable.remove_row") == 1
+    assert backend.session.count("DrawingTable.set_cell_string") == 0
+
+
+def test_update_table_insert_rows(backend):
+    from tests.conftest import tolerated_dimension
+
+    from pytia_title_block.const import TOLERANCE_TABLE_CELL_HEIGHT
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    doc_loader = DocumentLoader(backend=backend)
+    tools = ToleranceTools(doc_loader=doc_loader)
+    tools.add_table()
+    table = doc_loader.background_view._tables._items[0]
+
+    # Three rows inserted in the middle of the table.
+    dimensions = doc_loader.views._items[2]._dimensions._items
+    dimensions[1:1] = [
+        tolerated_dimension(backend.session, f"Length.{index}", value, "F8")
+        for index, value in ((6, 20.0), (7, 21.0), (8, 22.0))
+    ]
+    backend.session.reset()
+    tools.add_table()
+
+    assert [row[0] for row in table.values[1:]] == [
+        "30.000 H7",
+        "20.000 F8",
+        "21.000 F8",
+        "22.000 F8",
+        "12.000 g6",
+    ]
+    assert backend.session.count("DrawingTable.add_row") == 3
+    assert table.row_sizes == [TOLERANCE_TABLE_CELL_HEIGHT] * len(table.values)
+
+
+def test_layout_blocks():
+    from pytia_title_block.tools.table_layout import layout_blocks
+
+    # 100 mm fit 22 rows of 4.5 mm: The header and 21 rows per block.
+    blocks = layout_blocks(50, 300, 10, 100, 4.5, 90, gap=5)
+    assert [(b.first, b.rows) for b in blocks] == [(0, 17), (17, 17), (34, 16)]
+    assert [b.x for b in blocks] == [20, 115, 210]
+    assert [b.y for b in blocks] == [10 + 18 * 4.5, 10 + 18 * 4.5, 10 + 17 * 4.5]
+
+    assert [(b.first, b.rows) for b in layout_blocks(0, 300, 10, 100, 4.5, 90)] == [
+        (0, 0)
+    ]
+    assert len(layout_blocks(21, 300, 10, 100, 4.5, 90)) == 1
+    assert len(layout_blocks(22, 300, 10, 100, 4.5, 90)) == 2
+
+
+def _drawing_with_dimensions(product, count: int):
+    from tests.conftest import DRAWING_PATH
+    from tests.conftest import title_block_texts
+    from tests.conftest import tolerated_dimension
+
+    from pytia_title_block.backend.fake import FakeBackend
+    from pytia_title_block.backend.fake import create_drawing
+
+    application = FakeApplication(product.session)
+    create_drawing(
+        application,
+        DRAWING_PATH,
+        title_block=title_block_texts(),
+        product=product,
+        dimensions=[
+            lambda s, i=i: tolerated_dimension(s, f"Length.{i}", 10 + i)
+            for i in range(count)
+        ],
+    )
+    return FakeBackend(application)
+
+
+def test_multiple_tables(product):
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.resources import resource
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    backend = _drawing_with_dimensions(product, 80)
+    doc_loader = DocumentLoader(backend=backend)
+    tools = ToleranceTools(doc_loader=doc_loader)
+    blocks = tools.get_layout(80)
+    assert len(blocks) > 1
+
+    tools.add_table()
+    tables = doc_loader.background_view._tables._items
+    assert [t._name for t in tables] == ["tolerance_table"] + [
+        f"tolerance_table.{i}" for i in range(2, len(blocks) + 1)
+    ]
+    assert [(t._x, t._y) for t in tables] == [(b.x, b.y) for b in blocks]
+    assert all(len(t.values) == b.rows + 1 for t, b in zip(tables, blocks))
+    assert all(
+        t.values[0][0] == resource.settings.tables.tolerances.header_base
+        for t in tables
+    )
+    assert [row[0] for t in tables for row in t.values[1:]] == [
+        f"{10 + i:.3f} H7" for i in range(80)
+    ]
+    notes = doc_loader.get_text_by_name(resource.title_block_items.notes)
+    assert notes is None or notes._y >= max(b.y for b in blocks) + 2.5
+
+    # Unchanged: No table is written or moved.
+    backend.session.reset()
+    tools.add_table()
+    writes = ("DrawingTable.set", "DrawingTable.add", "DrawingTable.remove")
+    assert sum(backend.session.count(prefix) for prefix in writes) == 0
+    assert backend.session.count("DrawingTable.x=") == 0
+
+    # Fewer dimensions: The surplus tables are removed, the rest is moved.
+    view = doc_loader.views._items[2]
+    del view._dimensions._items[5:]
+    tools.add_table()
+    assert [t._name for t in tables] == ["tolerance_table"]
+    assert (tables[0]._x, tables[0]._y) == (
+        (b := tools.get_layout(5)[0]).x,
+        b.y,
+    )
+
+
+def test_export_streams(product):
+    import io
+
+    from pytia_title_block.loader.doc_loader import DocumentLoader
+    from pytia_title_block.tools.tolerance_export import export_tolerances
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    class File(io.StringIO):
+        """Records the progress of the extraction at each write."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.progress: List[int] = []
+
+        def write(self, s: str) -> int:
+            self.progress.append(done[-1] if done else 0)
+            return super().write(s)
+
+    done: List[int] = []
+    tools = ToleranceTools(
+        doc_loader=DocumentLoader(backend=_drawing_with_dimensions(product, 100)),
+        progress=lambda d, _: done.append(d),
+    )
+    file = File()
+    assert export_tolerances(tools, file, "csv") == 100
+
+    # Each record is written as soon as its dimension is read.
+    assert file.progress[1:] == list(range(1, 101))
+    lines = file.getvalue().splitlines()
+    assert lines[0].startswith("drawing,name,value,")
+    assert len(lines) == 101
+
+
+@pytest.mark.parametrize("count", [10, 1_000, 100_000])
+def test_benchmark(count):
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    dimensions = synthetic_dimensions(count)
+    start = time.perf_counter()
+    data = ToleranceTools.prepare_table_data(dimensions)
+    elapsed = time.perf_counter() - start
+
+    assert len(data) == 1 + min(count, 500)
+    assert sum(row.count for row in data[1:]) == count
+    # Linear: Generous upper bound of 20µs per dimension.
+    assert elapsed < 0.01 + count * 20e-6
+
+
+@pytest.mark.parametrize("group", [False, True])
+def test_columnar(group):
+    pytest.importorskip("numpy")
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    dimensions = synthetic_dimensions(5_000) + [
+        _dimension(30.0, "H7"),
+        _dimension(30.0002, "H7"),
+        _dimension(30.0, "F8"),
+        # Half-way values are grouped like they are displayed.
+        _dimension(3.0, "H7"),
+        _dimension(3.0005, "H7"),
+        _dimension(3.001, "H7"),
+        # Mixed precisions.
+        _dimension(12.346, "H7", precision=0.01),
+        _dimension(12.35, "H7"),
+        _dimension(12.346, "H7", precision=0),
+    ]
+    loop = ToleranceTools.prepare_table_data(
+        dimensions, group=group, show_count=True, columnar=False
+    )
+    columnar = ToleranceTools.prepare_table_data(
+        dimensions, group=group, show_count=True, columnar=True
+    )
+    assert columnar == loop
+    assert ToleranceTools.prepare_table_data([], columnar=True) == loop[:1]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_precision(columnar):
+    if columnar:
+        pytest.importorskip("numpy")
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    data = ToleranceTools.prepare_table_data(
+        [
+            _dimension(12.346, "H7", precision=0.01),
+            _dimension(12.35, "H7"),
+            _dimension(12.346, "H7"),
+            _dimension(12.3456, "H7", precision=0),
+        ],
+        group=False,
+        show_count=True,
+        columnar=columnar,
+    )
+    # Rounded to the precision of each dimension, limits from the rounded value.
+    assert [(row.base, row.min, row.max) for row in data[1:]] == [
+        ("2× 12.350 H7", "12.3500", "12.3710"),
+        ("2× 12.346 H7", "12.3460", "12.3670"),
+    ]
+
+
+@pytest.mark.parametrize("count", [10_000, 100_000])
+def test_benchmark_columnar(count):
+    pytest.importorskip("numpy")
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    dimensions = synthetic_dimensions(count)
+    start = time.perf_counter()
+    data = ToleranceTools.prepare_table_data(dimensions, columnar=True)
+    elapsed = time.perf_counter() - start
+
+    assert len(data) == 1 + 500
+    assert sum(row.count for row in data[1:]) == count
+    assert elapsed < 0.05 + count * 5e-6
+
+
+if __name__ == "__main__":
+    from pytia_title_block.tools.tolerance_columns import HAS_NUMPY
+    from pytia_title_block.tools.tolerance_tools import ToleranceTools
+
+    for n in (10, 1_000, 100_000):
+        dims = synthetic_dimensions(n)
+        runs = max(1, 100_000 // n)
+        for columnar in (False, True) if HAS_NUMPY else (False,):
+            t = time.perf_counter()
+            for _ in range(runs):
+                ToleranceTools.prepare_table_data(dims, columnar=columnar)
+            t = (time.perf_counter() - t) / runs
+            print(
+                f"{n:>7} dimensions, {'columnar' if columnar else 'loop':>8}: "
+                f"{t * 1000:9.3f} ms ({t / n * 1e6:.2f} µs/dimension)"
+            )
@@ -0,0 +1,155 @@
+"""
+    Test the indexed user directory.
+"""
+
+import pickle
+import time
+from typing import List
+
+import pytest
+
+
+def synthetic_users(count: int) -> List:
+    from pytia_title_block.resources import User
+
+    return [
+        User(
+            logon=f"User{index:06d}",
+            id=f"{index:06d}",
+            name=f"User {index:06d}",
+            mail=f"user{index:06d}@company.com",
+        )
+        for index in range(count)
+    ]
+
+
+def directories(tmp_path, users, case_sensitive=True):
+    from pytia_title_block.resources.user_directory import SqliteUserDirectory
+    from pytia_title_block.resources.user_directory import UserDirectory
+
+    return [
+        UserDirectory(users, case_sensitive=case_sensitive),
+        SqliteUserDirectory(
+            tmp_path / f"users_{case_sensitive}.sqlite",
+            stamp=1,
+            source=lambda: users,
+            user_type=type(users[0]),
+            case_sensitive=case_sensitive,
+        ),
+    ]
+
+
+@pytest.mark.parametrize("storage", [0, 1])
+def test_lookup(tmp_path, storage):
+    from pytia_title_block.resources import User
+
+    users = synthetic_users(100) + [
+        User(logon="User000001", id="999", name="Duplicate", mail="")
+    ]
+    directory = directories(tmp_path, users)[storage]
+
+    assert len(directory) == 101
+    assert list(directory) == users
+    assert directory.get_by_logon("User000042") == users[42]
+    assert directory.get_by_name("User 000042") == users[42]
+    assert directory.get_by_id("000042") == users[42]
+    # The first user wins.
+    assert directory.get_by_logon("User000001") == users[1]
+    assert directory.get_by_id("999") == users[-1]
+
+    assert "User000042" in directory
+    assert "user000042" not in directory
+    assert directory.get_by_logon(None) is None
+    assert directory.get_by_name("Nobody") is None
+
+
+@pytest.mark.parametrize("storage", [0, 1])
+def test_case_insensitive(tmp_path, storage):
+    users = synthetic_users(10)
+    directory = directories(tmp_path, users, case_sensitive=False)[storage]
+
+    assert directory.get_by_logon("USER000003") == users[3]
+    assert directory.get_by_name("user 000003") == users[3]
+    assert "user000003" in directory
+
+
+READS: List[int] = []
+
+
+def read_synthetic_users() -> List:
+    """The source of the SQLite directory, must be picklable."""
+    READS.append(1)
+    return synthetic_users(10 if len(READS) == 1 else 5)
+
+
+def test_sqlite_file(tmp_path):
+    from pytia_title_block.resources import User
+    from pytia_title_block.resources.user_directory import SqliteUserDirectory
+
+    READS.clear()
+    users = synthetic_users(10)
+    path = tmp_path / "users.sqlite"
+    directory = SqliteUserDirectory(path, (1, 2), read_synthetic_users, User)
+    assert directory.get_by_logon("User000003") == users[3]
+    assert len(READS) == 1
+    directory.close()
+
+    # The file is up to date: The source isn't read again.
+    directory = SqliteUserDirectory(path, (1, 2), read_synthetic_users, User)
+    assert directory.get_by_logon("User000004") == users[4]
+    assert len(READS) == 1
+
+    # The directory can be pickled, e.g. into the resource bundle.
+    directory = pickle.loads(pickle.dumps(directory))
+    assert directory.get_by_id("000005") == users[5]
+    assert len(READS) == 1
+
+    # A changed source rebuilds the file.
+    directory = SqliteUserDirectory(path, (1, 3), read_synthetic_users, User)
+    assert len(directory) == 5
+    assert len(READS) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["users.sqlite"]
+
+
+def test_resources_sqlite_storage(tmp_path, monkeypatch):
+    from pytia_title_block import resources
+    from pytia_title_block.resources import Resources
+    from pytia_title_block.resources import SettingsUsers
+    from pytia_title_block.resources import bundle
+
+    monkeypatch.setattr(bundle, "BUNDLE_FILE", tmp_path / "resources.bundle")
+    monkeypatch.setattr(resources, "CACHE", str(tmp_path))
+    read_settings = Resources._read_settings
+
+    def sqlite_settings(self):
+        settings = read_settings(self)
+        settings.users = SettingsUsers(storage="sqlite")
+        return settings
+
+    monkeypatch.setattr(Resources, "_read_settings", sqlite_settings)
+    resource = Resources()
+
+    assert type(resource.user_directory).__name__ == "SqliteUserDirectory"
+    assert resource.users == resources.read_users()
+    for user in resource.users:
+        assert resource.get_user_by_logon(user.logon) == user
+        assert resource.get_user_by_name(user.name) == user
+        assert resource.logon_exists(user.logon)
+    assert not resource.logon_exists("nobody@nowhere")
+    assert (tmp_path / "users.sqlite").exists()
+
+
+@pytest.mark.parametrize("storage", [0, 1])
+def test_benchmark(tmp_path, storage):
+    users = synthetic_users(50_000)
+    directory = directories(tmp_path, users)[storage]
+    directory.get_by_logon("User000000")
+
+    lookups = 10_000
+    start = time.perf_counter()
+    for index in range(0, 50_000, 50_000 // lookups):
+        assert directory.get_by_logon(f"User{index:06d}") is not None
+    elapsed = (time.perf_counter() - start) / lookups
+
+    print(f"{type(directory).__name__}: {elapsed * 1e6:.2f} µs per lookup")
+    assert elapsed < 200e-6
@@ -0,0 +1,291 @@
+"""
+    Test the external user sources and their local cache.
+"""
+
+import base64
+import json
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+LDIF = """version: 1
+
+# Exported from the corporate directory
+dn: CN=Jane Doe,OU=Users,DC=company,DC=com
+sAMAccountName: jdoe
+displayName: Jane Doe
+employeeID: 0001
+mail: jane.doe@comp
+ any.com
+proxyAddresses: smtp:jane@company.com
+proxyAddresses: smtp:doe@company.com
+
+dn: CN=Jörg Müller,OU=Users,DC=company,DC=com
+samaccountname: jmueller
+displayName:: {name}
+employeeID: 0002
+mail: joerg.mueller@company.com
+
+dn: CN=Printer,OU=Devices,DC=company,DC=com
+description: No logon, no user
+""".format(
+    name=base64.b64encode("Jörg Müller".encode("utf8")).decode("ascii")
+)
+
+
+def write_users(
+    path: Path, count: int, renamed: int | None = None, first: int = 0
+) -> None:
+    """Writes an export in the format of the users.json."""
+    users = [
+        {
+            "logon": f"user{index:05d}",
+            "id": f"{index:05d}",
+            "name": f"User {index:05d}" + (" (renamed)" if index == renamed else ""),
+            "mail": f"user{index:05d}@company.com",
+        }
+        for index in range(first, count)
+    ]
+    path.write_text(json.dumps(users), encoding="utf8")
+    # Changes within the same tick of the file system's clock must be detected as well.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + count * 1000))
+
+
+FALLBACK_READS: List[int] = []
+
+
+def read_fallback_users() -> List:
+    """The fallback of the cache, must be picklable."""
+    from pytia_title_block.resources import User
+
+    FALLBACK_READS.append(1)
+    return [User(logon="admin", id="001", name="Administrator", mail="")]
+
+
+def cached_directory(tmp_path: Path, source_path: Path, ttl: float = 3600):
+    from pytia_title_block.resources import User
+    from pytia_title_block.resources.user_directory import CachedUserDirectory
+    from pytia_title_block.resources.user_sources import JsonUserSource
+
+    return CachedUserDirectory(
+        tmp_path / "users.cache.sqlite",
+        source=JsonUserSource(source_path),
+        user_type=User,
+        ttl=ttl,
+        fallback=read_fallback_users,
+    )
+
+
+def test_ldif_source(tmp_path):
+    from pytia_title_block.resources import User
+    from pytia_title_block.resources.user_sources import get_source
+
+    path = tmp_path / "users.ldif"
+    path.write_text(LDIF, encoding="utf8")
+
+    users = list(get_source("ldif", path).read(User))
+    assert users == [
+        User(logon="jdoe", id="0001", name="Jane Doe", mail="jane.doe@company.com"),
+        User(
+            logon="jmueller",
+            id="0002",
+            name="Jörg Müller",
+            mail="joerg.mueller@company.com",
+        ),
+    ]
+
+    source = get_source("ldif", path, {"logon": "mail", "id": "proxyAddresses"})
+    assert next(source.read(User)).id == "smtp:jane@company.com"
+
+
+def test_csv_source(tmp_path):
+    from pytia_title_block.resources import User
+    from pytia_title_block.resources.user_sources import get_source
+
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "\ufeffAccount;Personnel number;Name;Mail\n"
+        "jdoe;0001;Doe, Jane;jane.doe@company.com\n"
+        ";;Service account;\n",
+        encoding="utf8",
+    )
+    source = get_source(
+        "csv",
+        path,
+        {"logon": "Account", "id": "Personnel number", "name": "Name", "mail": "Mail"},
+    )
+    assert list(source.read(User)) == [
+        User(logon="jdoe", id="0001", name="Doe, Jane", mail="jane.doe@company.com")
+    ]
+
+
+def test_cache_refresh(tmp_path):
+    source_path = tmp_path / "users.json"
+    write_users(source_path, 100)
+    directory = cached_directory(tmp_path, source_path)
+    assert directory.get_by_logon("user00042").name == "User 00042"
+    assert len(directory) == 100
+
+    # The source hasn't changed: Nothing is written.
+    assert directory.refresh() == 0
+
+    # Only the changed users are written into the cache.
+    write_users(source_path, 98, renamed=42)
+    assert directory.refresh() == 3
+    assert directory.get_by_logon("user00042").name == "User 00042 (renamed)"
+    assert directory.get_by_logon("user00099") is None
+    assert len(directory) == 98
+
+    # A user added at the top is the only change.
+    write_users(source_path, 98, renamed=42, first=-1)
+    assert directory.refresh() == 1
+    assert directory.get_by_logon("user-0001").id == "-0001"
+    assert len(directory) == 99
+    directory.close()
+
+
+def test_cache_ttl(tmp_path):
+    source_path = tmp_path / "users.json"
+    write_users(source_path, 10)
+    directory = cached_directory(tmp_path, source_path, ttl=0.2)
+    assert directory.get_by_logon("user00005") is not None
+    directory.close()
+
+    # Within the TTL the source isn't checked, the cache survives a restart.
+    write_users(source_path, 20)
+    directory = pickle.loads(pickle.dumps(directory))
+    assert directory.get_by_logon("user00015") is None
+    assert directory._refresh_thread is None
+
+    # After the TTL the source is checked in the background.
+    time.sleep(0.25)
+    assert directory.get_by_logon("user00015") is None
+    directory._refresh_thread.join()
+    assert directory.get_by_logon("user00015") is not None
+    directory.close()
+
+
+def test_cache_offline(tmp_path):
+    source_path = tmp_path / "share" / "users.json"
+    FALLBACK_READS.clear()
+
+    # No cache and no source: The fallback is used, the source is tried again.
+    directory = cached_directory(tmp_path, source_path)
+    assert directory.get_by_logon("admin").name == "Administrator"
+    assert len(FALLBACK_READS) == 1
+    directory._refresh_thread.join()
+
+    source_path.parent.mkdir()
+    write_users(source_path, 10)
+    directory.close()
+    directory = cached_directory(tmp_path, source_path)
+    directory.get_by_logon("admin")
+    directory._refresh_thread.join()
+    assert directory.get_by_logon("user00003") is not None
+    assert directory.get_by_logon("admin") is None
+    directory.close()
+
+    # The share goes offline: The cache is used as it is.
+    source_path.unlink()
+    directory = cached_directory(tmp_path, source_path, ttl=0)
+    assert directory.get_by_logon("user00003") is not None
+    directory._refresh_thread.join()
+    assert directory.get_by_logon("user00004") is not None
+    assert len(FALLBACK_READS) == 1
+    directory.close()
+
+
+def test_cache_malformed(tmp_path):
+    source_path = tmp_path / "users.json"
+    FALLBACK_READS.clear()
+
+    # The export is being written: The fallback is used until it's complete.
+    source_path.write_text('[{"logon": "user00000", "id"', encoding="utf8")
+    directory = cached_directory(tmp_path, source_path)
+    assert directory.get_by_logon("admin") is not None
+    assert len(FALLBACK_READS) == 1
+    directory._refresh_thread.join()
+    assert directory.get_by_logon("user00000") is None
+
+    write_users(source_path, 10)
+    assert directory.refresh() == 11
+    assert directory.get_by_logon("user00000") is not None
+    assert directory.get_by_logon("admin") is None
+    directory.close()
+
+
+def test_resources_source(tmp_path, monkeypatch):
+    from pytia_title_block import resources
+    from pytia_title_block.resources import Resources
+    from pytia_title_block.resources import SettingsUsers
+    from pytia_title_block.resources import bundle
+
+    source_path = tmp_path / "users.ldif"
+    source_path.write_text(LDIF, encoding="utf8")
+    monkeypatch.setattr(bundle, "BUNDLE_FILE", tmp_path / "resources.bundle")
+    monkeypatch.setattr(resources, "CACHE", str(tmp_path))
+    read_settings = Resources._read_settings
+
+    def source_settings(self):
+        settings = read_settings(self)
+        settings.users = SettingsUsers(
+            source="ldif", path=str(source_path), case_sensitive=False
+        )
+        return settings
+
+    monkeypatch.setattr(Resources, "_read_settings", source_settings)
+    resource = Resources()
+
+    assert type(resource.user_directory).__name__ == "CachedUserDirectory"
+    assert resource.get_user_by_logon("JDoe").name == "Jane Doe"
+    assert resource.get_user_by_name("jörg müller").logon == "jmueller"
+    assert not resource.logon_exists("printer")
+    assert (tmp_path / "users.cache.sqlite").exists()
+
+    # The bundle holds the config only, not the cache of the users.
+    for name in Resources.BUNDLED:
+        resource._get(name)
+    with open(tmp_path / "resources.bundle", "rb") as f:
+        sections = pickle.load(f)["sections"]
+    assert "user_directory" not in sections
+    assert sections["user_records"] is None
+
+
+def test_settings_source():
+    from pytia_title_block.resources import SettingsUsers
+
+    with pytest.raises(ValueError):
+        SettingsUsers(source="ldap", path="\\\\share\\users.ldif")
+    with pytest.raises(ValueError):
+        SettingsUsers(source="ldif")
+
+
+def test_abstract_source(tmp_path):
+    from pytia_title_block.resources.user_sources import UserSource
+
+    with pytest.raises(TypeError):
+        UserSource(tmp_path / "users.json")
+
+
+def test_benchmark(tmp_path):
+    source_path = tmp_path / "users.json"
+    write_users(source_path, 50_000)
+    directory = cached_directory(tmp_path, source_path)
+    directory.get_by_logon("user00000")
+
+    # The share is slow or offline: Lookups don't depend on it.
+    source_path.unlink()
+    lookups = 10_000
+    start = time.perf_counter()
+    for index in range(0, 50_000, 50_000 // lookups):
+        assert directory.get_by_logon(f"user{index:05d}") is not None
+    elapsed = (time.perf_counter() - start) / lookups
+
+    print(f"CachedUserDirectory: {elapsed * 1e6:.2f} µs per lookup")
+    assert elapsed < 200e-6
+    directory.close()